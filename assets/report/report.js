@@ -0,0 +1,15 @@
+// Offline rapor: Bootstrap bundle yerine sadece accordion collapse davranışı.
+// Tek delegated listener (binlerce item için ayrı handler yok).
+document.addEventListener("click", function (e) {
+    var btn = e.target.closest('[data-bs-toggle="collapse"]');
+    if (!btn) {
+        return;
+    }
+    var target = document.querySelector(btn.getAttribute("data-bs-target"));
+    if (!target) {
+        return;
+    }
+    var open = target.classList.toggle("show");
+    btn.classList.toggle("collapsed", !open);
+    btn.setAttribute("aria-expanded", open ? "true" : "false");
+});
@@ -1,6 +1,7 @@
 import os
 import subprocess
 import rumps
+from PyObjCTools.AppHelper import callAfter
 
 from macos_picker import pick_folder
 from scanner import scan_project, SCAN_DEV, SCAN_PROD
@@ -12,12 +13,17 @@ from settings_ui import (
     open_ignore_settings,
 )
 from config import load_config
+from watcher import ProjectWatcher
 from ipc import (
-    read_command,
-    clear_command,
-    write_status,
+    read_commands,
     send_command,   # 👈 EKLENDİ
+    write_status,
+    use_channel,
 )
+from ipc_channel import MessageBroker
+from progress_shm import ProgressBlock, ProgressReader
+from findings_db import FindingsDB
+from scheduler import ScanScheduler, TRIGGER_INTERACTIVE, DEFAULT_WORKERS
 
 def section(title: str):
     item = rumps.MenuItem(title)
@@ -121,43 +127,84 @@ class ZinkxDevAssistant(rumps.App):
         self.last_todos = 0
 
 
+        # Watch mode (config: watch_project)
+        self._watcher: ProjectWatcher | None = None
+
+        # Canlı scan sayaçları (shared memory); status.json parse edilmez
+        self._progress = ProgressBlock()
+        self._progress_reader = ProgressReader()
+        self._progress_timer = rumps.Timer(self._poll_progress, 0.5)
+
+        # Scan geçmişi (dashboard / CLI sorguları)
+        self._db = FindingsDB()
+
+        # Scan'ler ortak worker havuzunda; sonuçlar main thread'e callAfter ile döner
+        self._scheduler = ScanScheduler(
+            self._run_scan,
+            max_workers=int(load_config().get("scan_workers", DEFAULT_WORKERS)),
+        )
+
         # Initial UI state
         self._update_title_badge()
         self._refresh_mode_checks()
+        self._restart_watcher()
 
         # --------------------------------------------------
         # IPC command listener (Qt → Menu Bar)
         # --------------------------------------------------
+        # Dosya polling kanal varken de çalışır: CLI / daemon sadece dosyaya yazar
         self._cmd_timer = rumps.Timer(self._poll_commands, 1)
         self._cmd_timer.start()
 
+        # Push kanal: komutlar broker thread'inden main thread'e taşınır
+        self._broker = MessageBroker()
+        try:
+            self._broker.start()
+        except OSError:
+            self._broker = None
+        else:
+            self._broker.subscribe(
+                "command",
+                lambda _topic, cmd: callAfter(self._handle_command, cmd),
+            )
+            use_channel(self._broker)
+
     # --------------------------------------------------
     # IPC
     # --------------------------------------------------
     def _poll_commands(self, _):
-        cmd = read_command()
-        if not cmd:
-            return
-
-        clear_command()
+        # Arka arkaya gelen komutlar sırasıyla işlenir
+        for cmd in read_commands("menubar"):
+            self._handle_command(cmd)
 
+    def _handle_command(self, cmd: dict):
         action = cmd.get("action")
         mode = cmd.get("mode")
         project = cmd.get("project")
 
         if action == "scan" and project:
-            self.project_root = project
-            self._save_last_project(project)
+            if project != self.project_root:
+                self.project_root = project
+                self._save_last_project(project)
+                self._restart_watcher()
 
+            # "done" status'u scan_project yayınlar; push kanalda ikinci
+            # (eksik alanlı) bir status dashboard'da çift kayıt üretiyordu
             self._scan_with_mode(
-                SCAN_PROD if mode == "prod" else SCAN_DEV
+                SCAN_PROD if mode == "prod" else SCAN_DEV,
+                trigger=cmd.get("trigger", TRIGGER_INTERACTIVE),
             )
 
-            write_status({
-                "last_risks": self.last_risks,
-                "last_todos": self.last_todos,
-                "mode": mode,
-            })
+        elif action == "queue_scan" and project:
+            # Seçili projeyi değiştirmeden başka bir repo için job
+            self._submit_scan(
+                project,
+                SCAN_PROD if mode == "prod" else SCAN_DEV,
+                cmd.get("trigger", TRIGGER_INTERACTIVE),
+            )
+
+        elif action == "reload_watch":
+            self._restart_watcher()
 
     # --------------------------------------------------
     # Menu → Qt
@@ -195,6 +242,22 @@ class ZinkxDevAssistant(rumps.App):
             self.mi_scan_dev.state = 1
 
 
+    def _restart_watcher(self):
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+        cfg = load_config()
+        if not cfg.get("watch_project", False):
+            return
+        if not self.project_root or not os.path.isdir(self.project_root):
+            return
+
+        mode = SCAN_PROD if cfg.get("default_mode", "dev") == "prod" else SCAN_DEV
+        self._watcher = ProjectWatcher(self.project_root, mode=mode)
+        self._watcher.start()
+
+
     # --------------------------------------------------
     # State helpers
     # --------------------------------------------------
@@ -234,6 +297,7 @@ class ZinkxDevAssistant(rumps.App):
 
         self.project_root = chosen
         self._save_last_project(chosen)
+        self._restart_watcher()
         rumps.notification("Zinkx", "Project Selected", chosen)
 
     def scan_default(self, _):
@@ -250,7 +314,7 @@ class ZinkxDevAssistant(rumps.App):
     # --------------------------------------------------
     # Core scan
     # --------------------------------------------------
-    def _scan_with_mode(self, mode: str):
+    def _scan_with_mode(self, mode: str, trigger: str = TRIGGER_INTERACTIVE):
         if not self.project_root or not os.path.isdir(self.project_root):
             rumps.notification(
                 "Zinkx",
@@ -259,6 +323,22 @@ class ZinkxDevAssistant(rumps.App):
             )
             return
 
+        self._submit_scan(self.project_root, mode, trigger)
+
+    def _submit_scan(self, project: str, mode: str, trigger: str):
+        if not os.path.isdir(project):
+            return
+
+        # Aynı project + mode zaten kuyrukta / çalışıyorsa o job'a bağlanır;
+        # callback'ler sadece yeni job'a eklenir (scan başına tek bildirim)
+        self._scheduler.submit(
+            project,
+            mode,
+            trigger,
+            on_done=lambda job, result: callAfter(self._on_scan_done, job, result),
+            on_error=lambda job, e: callAfter(self._on_scan_failed, job, e),
+        )
+
         # 🟢 Scan başladı
         self.mi_status.title = "Status: Scanning…"
         self.mi_last_scan.title = "Last Scan: running…"
@@ -266,44 +346,100 @@ class ZinkxDevAssistant(rumps.App):
         self.mi_scan_default.enabled = False
         self.mi_scan_dev.enabled = False
         self.mi_scan_prod.enabled = False
+        self._progress_timer.start()
+
+    def _run_scan(self, job):
+        """
+        Scheduler worker thread'inde çalışır: UI'a dokunmaz.
+        """
+        # Progress bloğu tek scan gösterir: boşta ise (başka job / CLI
+        # tutmuyorsa) job onu alır
+        owns_progress = self._progress.claim()
+        stats = {}
+        try:
+            findings = scan_project(
+                job.project,
+                mode=job.mode,
+                progress=self._progress if owns_progress else None,
+                db=self._db,
+                stats=stats,
+            )
+        finally:
+            if owns_progress:
+                self._progress.release()
 
-        findings = scan_project(self.project_root, mode=mode)
         report_path = write_html_report(
             findings,
-            self.project_root,
+            job.project,
             out_dir="reports",
+            mode=job.mode,
+            **stats,
         )
+        return findings, report_path
+
+    def _scan_finished(self):
+        if self._scheduler.busy:
+            return  # kuyrukta başka scan var
+
+        self._progress_timer.stop()
+
+        # 🟢 Butonları geri aç
+        self.mi_scan_default.enabled = True
+        self.mi_scan_dev.enabled = True
+        self.mi_scan_prod.enabled = True
+
+    def _on_scan_done(self, job, result):
+        findings, report_path = result
         self._save_last_report(str(report_path))
 
         risks = sum(1 for f in findings if f.kind == "RISK")
         todos = sum(1 for f in findings if f.kind == "TODO")
 
-        self.last_risks = risks
-        self.last_todos = todos
+        # Badge seçili projeyi gösterir; diğer repo'lar sadece bildirim
+        if job.project == self.project_root:
+            self.last_risks = risks
+            self.last_todos = todos
+
+            # 🟢 Scan bitti
+            self.mi_status.title = f"Status: {risks} risks · {todos} todos"
+            self.mi_last_scan.title = f"Last Scan: {datetime.now().strftime('%H:%M')}"
 
-        # 🟢 Scan bitti
-        self.mi_status.title = f"Status: {risks} risks · {todos} todos"
-        self.mi_last_scan.title = f"Last Scan: {datetime.now().strftime('%H:%M')}"
         self.mi_open_report.enabled = True
 
         self._update_title_badge()
         self._refresh_mode_checks()
+        self._scan_finished()
 
-        # 🟢 Butonları geri aç
-        self.mi_scan_default.enabled = True
-        self.mi_scan_dev.enabled = True
-        self.mi_scan_prod.enabled = True
-
-        label = "PROD" if mode == SCAN_PROD else "DEV"
+        label = "PROD" if job.mode == SCAN_PROD else "DEV"
+        name = os.path.basename(job.project.rstrip(os.sep))
 
         rumps.notification(
             "Zinkx Dev Assistant",
-            f"Scan completed · {label}",
+            f"Scan completed · {label} · {name}",
             f"🚨 Risks: {risks}   📝 TODO: {todos}",
         )
 
-        open_path(str(report_path))
+        if job.trigger == TRIGGER_INTERACTIVE:
+            open_path(str(report_path))
+
+    def _on_scan_failed(self, job, error: Exception):
+        self.mi_status.title = "Status: Scan failed"
+        self.mi_last_scan.title = "Last Scan: failed"
+        self._scan_finished()
+
+        # Dashboard "Scan failed" durumuna geçsin
+        write_status({"type": "error", "message": str(error), "project": job.project})
+        rumps.notification("Zinkx", "Scan failed", str(error))
 
+    def _poll_progress(self, _):
+        snap = self._progress_reader.read()
+        if not snap or snap["phase"] in ("done", "idle"):
+            return
+
+        self.mi_status.title = (
+            f"Status: Scanning… {snap['percent']}% · "
+            f"{snap['findings']['CRITICAL'] + snap['findings']['HIGH']} high+"
+        )
 
     # --------------------------------------------------
     # Other actions
@@ -319,6 +455,7 @@ class ZinkxDevAssistant(rumps.App):
         open_general_settings()
         self._update_title_badge()
         self._refresh_mode_checks()
+        self._restart_watcher()
 
     def open_ignore_settings(self, _):
         open_ignore_settings()
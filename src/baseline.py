@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+from fingerprint import fingerprint, relative_key
+
+if TYPE_CHECKING:
+    from scanner import Finding
+
+# Proje kökünde; repoya commit edilir, ekip aynı baseline'ı paylaşır
+BASELINE_NAME = ".zinkx-baseline"
+
+_HEADER = (
+    "# Zinkx Dev Assistant baseline: bu bulgular raporlanmaz.\n"
+    "# Yenilemek için: cli.py <proje> --update-baseline\n"
+    "# fingerprint<TAB>rule<TAB>path (aynı satırın her kopyası ayrı satır)\n"
+)
+
+# root → ((mtime_ns, size), Baseline); daemon / watch her scan'de yeniden parse etmez
+_loaded: dict[str, tuple[tuple[int, int], "Baseline"]] = {}
+
+
+def baseline_path(root: str | Path) -> Path:
+    return Path(root) / BASELINE_NAME
+
+
+class Baseline:
+    """
+    Bilinen (kabul edilmiş) bulguların fingerprint multiset'i.
+
+    Aynı dosyada aynı satır birden çok kez geçebilir (aynı fingerprint);
+    baseline her fingerprint için kaç kopyanın kabul edildiğini tutar.
+    Fazla kopyalar (ör. baseline'lı bir secret satırının yeni kopyası)
+    raporlanır; hangisinin raporlandığı scan sırasıdır (dosyada sonraki
+    satırlar), FindingsDB delta'sının eşleştirmesiyle aynı.
+    Bulgu başına kontrol: bir sha1 + dict lookup.
+    """
+
+    def __init__(self, fingerprints: Iterable[str] = ()):
+        counts: dict[str, int] = {}
+        for fp in fingerprints:
+            counts[fp] = counts.get(fp, 0) + 1
+        self.counts = counts
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __contains__(self, fp: str) -> bool:
+        return fp in self.counts
+
+    def take(self, fp: str, used: dict[str, int]) -> bool:
+        """
+        fp'nin bir kopyası baseline'da kabul edilmişse True ve used'da
+        sayılır. used çağıran tarafın (tek süzme geçişi) sayacıdır.
+        """
+        n = used.get(fp, 0)
+        if n >= self.counts.get(fp, 0):
+            return False
+        used[fp] = n + 1
+        return True
+
+    def filter(self, findings: list[Finding], root: str) -> list[Finding]:
+        """
+        Baseline'da olmayan (veya kabul edilenden fazla kopyası olan)
+        bulgular, sıra korunur. root resolve edilmiş proje kökü
+        (fingerprint ile aynı anahtar).
+        """
+        if not self.counts:
+            return findings
+        used: dict[str, int] = {}
+        take = self.take
+        return [f for f in findings if not take(fingerprint(f, root), used)]
+
+    @classmethod
+    def load(cls, root: str | Path) -> Baseline:
+        """
+        Proje kökündeki baseline; yoksa / okunamazsa boş. Dosya değişmedikçe
+        (mtime + boyut) cache'ten döner.
+        """
+        path = baseline_path(root)
+        key = str(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            _loaded.pop(key, None)
+            return cls()
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _loaded.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        fps = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("#"):
+                        continue
+                    fp = line.split("\t", 1)[0].strip()
+                    if fp:
+                        fps.append(fp)
+        except (OSError, UnicodeDecodeError):
+            return cls()
+
+        baseline = cls(fps)
+        _loaded[key] = (stamp, baseline)
+        return baseline
+
+
+def write_baseline(root: str | Path, findings: Iterable[Finding]) -> tuple[Path, int]:
+    """
+    Baseline'ı verilen bulgulardan yeniden yazar (artık görülmeyenler düşer).
+    Satırlar path / kural / fingerprint sırasında: dosya diff'lenebilir.
+    Aynı fingerprint'li her kopya ayrı satırdır; yazılan satır sayısı döner.
+    """
+    rootp = Path(root).expanduser().resolve()
+    root_key = str(rootp)
+
+    entries: dict[tuple[str, str, str], int] = {}
+    for f in findings:
+        key = (
+            relative_key(f.path, root_key).replace(os.sep, "/"),
+            f.rule or f.title,
+            fingerprint(f, root_key),
+        )
+        entries[key] = entries.get(key, 0) + 1
+
+    path = baseline_path(rootp)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as out:
+        out.write(_HEADER)
+        for (rel, rule, fp), count in sorted(entries.items()):
+            out.write(f"{fp}\t{rule}\t{rel}\n" * count)
+    os.replace(tmp, path)
+
+    return path, sum(entries.values())
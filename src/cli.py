@@ -1,8 +1,13 @@
 import argparse
+from dataclasses import replace
 from pathlib import Path
 
-from scanner import scan_project, SCAN_DEV, SCAN_PROD
-from report_html import write_html_report
+from scanner import scan_project, ScanProfile, SCAN_DEV, SCAN_PROD
+from report_formats import REPORT_FORMATS
+from findings_db import FindingsDB
+from progress_shm import ProgressBlock
+from watcher import run_watch
+from baseline import Baseline, write_baseline
 
 
 def run_cli():
@@ -24,6 +29,38 @@ def run_cli():
         help="Scan mode (default: dev)"
     )
 
+    parser.add_argument(
+        "--format",
+        choices=sorted(REPORT_FORMATS),
+        default="html",
+        help="Report format: html, jsonl (one JSON object per line) or sarif (SARIF 2.1.0)"
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Watch the project and rescan changed files continuously"
+    )
+
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write all current findings to .zinkx-baseline (they are no longer reported)"
+    )
+
+    parser.add_argument(
+        "--no-baseline",
+        action="store_true",
+        help="Report findings listed in .zinkx-baseline too"
+    )
+
+    parser.add_argument(
+        "--history",
+        type=int,
+        metavar="N",
+        help="Show risks by file over the last N recorded scans (no scan)"
+    )
+
     args = parser.parse_args()
     project_path = Path(args.path).expanduser().resolve()
 
@@ -32,17 +69,42 @@ def run_cli():
 
     scan_mode = SCAN_PROD if args.mode == "prod" else SCAN_DEV
 
+    if args.history:
+        print_history(project_path, args.history)
+        return
+
+    if args.update_baseline:
+        update_baseline(project_path, scan_mode)
+        return
+
     print(f"[+] Scanning project: {project_path}")
     print(f"[+] Mode: {args.mode}")
 
+    if args.watch:
+        print("[+] Watching for changes (Ctrl+C to stop)\n")
+        run_watch(str(project_path), mode=scan_mode)
+        return
+
+    # Dashboard canlı sayaçları; blok başka scan'deyse (menubar) yazılmaz.
+    # Claim process çıkınca düşer.
+    progress = ProgressBlock()
+    stats = {}
     findings = scan_project(
         root=str(project_path),
-        mode=scan_mode
+        mode=scan_mode,
+        progress=progress if progress.claim() else None,
+        db=FindingsDB(),            # scan geçmişi
+        stats=stats,
+        baseline=Baseline() if args.no_baseline else None,
     )
 
-    report_path = write_html_report(
+    write_report = REPORT_FORMATS[args.format]
+    report_path = write_report(
         findings,
-        project_root=str(project_path)
+        project_root=str(project_path),
+        out_dir="reports",
+        mode=scan_mode,
+        **stats,
     )
 
     # ---- CLI summary ----
@@ -54,6 +116,53 @@ def run_cli():
     print(f"TODOs found       : {todos}")
     print(f"Scan mode         : {args.mode}")
     print(f"Scanned directory : {project_path}")
-    print(f"HTML report       : {report_path}")
+
+    delta = stats.get("delta")
+    if delta is not None and delta.base_scan_id is not None:
+        print(
+            f"Since last scan   : {delta.new_count} new, {delta.fixed_count} fixed, "
+            f"{delta.persisting_count} persisting"
+        )
+    label = f"{args.format.upper()} report"
+    print(f"{label:<18}: {report_path}")
 
     print("\n[✓] Scan completed successfully")
+
+
+def update_baseline(project_path: Path, scan_mode: str):
+    # Baseline'sız tam scan: mevcut baseline'daki bulgular da yeniden yazılır.
+    # Dosya içi sınır kapalı: sınırı aşan satırlar da tek tek fingerprint'lenir
+    profile = replace(ScanProfile.from_config(scan_mode), finding_caps=())
+    findings = scan_project(
+        root=str(project_path),
+        profile=profile,
+        baseline=Baseline(),
+    )
+    path, count = write_baseline(project_path, findings)
+
+    print(f"[+] Baseline written: {path}")
+    print(f"[+] Baseline entries: {count}")
+
+
+def print_history(project_path: Path, last_scans: int):
+    db = FindingsDB()
+    scans = db.recent_scans(str(project_path), limit=last_scans)
+    rows = db.risks_by_file(str(project_path), last_scans=last_scans)
+
+    print(f"[+] History: {project_path}")
+    print(f"[+] Scans recorded: {len(scans)} (last {last_scans})")
+
+    if not rows:
+        print("\nNo risks recorded.")
+        return
+
+    print("\n=== Risks by file ===")
+    for r in rows:
+        try:
+            rel = Path(r["path"]).relative_to(project_path)
+        except ValueError:
+            rel = r["path"]
+        print(
+            f"{r['risks']:>6}  (critical {r['critical']}, high {r['high']}, "
+            f"in {r['scans']} scans)  {rel}"
+        )
@@ -1,5 +1,7 @@
+import copy
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any
 
@@ -40,6 +42,23 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "show_scan_progress": True,       # scan sırasında progress bar göster
     "scan_progress_steps": [20, 50, 80, 100],  # IPC % adımları
 
+    # Watch mode
+    "watch_project": False,           # proje değişince otomatik incremental scan
+
+    # Scheduler
+    "scan_workers": 2,                # tüm projeler için ortak scan worker sayısı
+
+    # Dosya başına, kural başına bulgu sınırı; fazlası tek özet bulguya toplanır (0 = sınırsız).
+    # Sadece INFO / TODO kuralları: RISK kuralları hiç sınırlanmaz
+    "finding_caps": {
+        "default": 100,
+        "trailing_whitespace": 20,
+        "long_line": 20,
+    },
+
+    # Bellek
+    "findings_memory_budget": 250000, # bellekte en fazla bulgu; fazlası diske sıralı run (0 = sınırsız)
+
     # =========================
     # Ignore rules
     # =========================
@@ -61,6 +80,8 @@ DEFAULT_CONFIG: Dict[str, Any] = {
             "TODO": True,
         },
         "enable_search": True,        # report search aktif
+        "virtual_threshold": 2000,    # fazlası: sanal scroll'lu (JSON) HTML rapor, 0 = kapalı
+        "offline_assets": False,      # CSS / JS CDN yerine rapora gömülür (ağsız ortamlar)
         "inline_preview": False,      # (ileride) HTML inline preview
     },
 
@@ -79,7 +100,7 @@ def _merge_with_defaults(cfg: Dict[str, Any]) -> Dict[str, Any]:
     Eksik alanları DEFAULT_CONFIG ile tamamlar.
     Nested dict'leri de güvenli şekilde merge eder.
     """
-    merged = DEFAULT_CONFIG.copy()
+    merged = copy.deepcopy(DEFAULT_CONFIG)
 
     for key, value in (cfg or {}).items():
         if isinstance(value, dict) and isinstance(merged.get(key), dict):
@@ -89,27 +110,94 @@ def _merge_with_defaults(cfg: Dict[str, Any]) -> Dict[str, Any]:
 
     return merged
 
+# --------------------------------------------------
+# Schema migrations
+# --------------------------------------------------
+# Eksik alanlar her load'da DEFAULT_CONFIG'ten bellekte tamamlanır; dosyaya
+# yazmak gerekmez. Dosya sadece şema değişince (alan adı / format) yazılır.
+CONFIG_SCHEMA_VERSION = 1
+
+
+def _migrate_v0(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    # v0: schema_version alanı olmayan eski dosyalar; içerik aynı
+    return cfg
+
+
+# from_version → migration (from_version + 1'e taşır)
+MIGRATIONS = {
+    0: _migrate_v0,
+}
+
+
+def _migrate(raw: Dict[str, Any]) -> tuple[Dict[str, Any], bool]:
+    version = int(raw.get("schema_version", 0))
+    changed = False
+
+    while version < CONFIG_SCHEMA_VERSION:
+        raw = MIGRATIONS[version](raw)
+        version += 1
+        changed = True
+
+    raw["schema_version"] = version
+    return raw, changed
+
+
+# --------------------------------------------------
+# Process-wide cache (mtime invalidation)
+# --------------------------------------------------
+_cache_lock = threading.Lock()
+_cache: Dict[str, Any] = {"key": None, "cfg": None}
+
+
+def _file_key(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _defaults() -> Dict[str, Any]:
+    cfg = copy.deepcopy(DEFAULT_CONFIG)
+    cfg["schema_version"] = CONFIG_SCHEMA_VERSION
+    return cfg
+
+
 # --------------------------------------------------
 # Load config
 # --------------------------------------------------
 def load_config() -> Dict[str, Any]:
-    if not os.path.exists(CONFIG_PATH):
-        cfg = DEFAULT_CONFIG.copy()
-        save_config(cfg)
-        return cfg
+    """
+    Dosya değişmediyse (mtime / size / inode) parse edilmez; cache'in kopyası döner.
+    Dönen dict çağıranındır, değiştirmek cache'i etkilemez.
+    """
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return _defaults()
+
+    key = _file_key(st)
+    with _cache_lock:
+        if _cache["key"] == key:
+            return copy.deepcopy(_cache["cfg"])
 
     try:
         with open(CONFIG_PATH, "r", encoding="utf-8") as f:
             raw = json.load(f)
+        if not isinstance(raw, dict):
+            raise ValueError("config root must be an object")
+    except Exception:
+        # Bozuk dosya kullanıcının; üzerine yazılmaz
+        return _defaults()
 
-        cfg = _merge_with_defaults(raw)
-        save_config(cfg)  # eksik alanları kalıcı yaz (auto-migrate)
-        return cfg
+    raw, migrated = _migrate(raw)
+    cfg = _merge_with_defaults(raw)
 
-    except Exception:
-        cfg = DEFAULT_CONFIG.copy()
+    if migrated:
         save_config(cfg)
-        return cfg
+        return copy.deepcopy(cfg)
+
+    with _cache_lock:
+        _cache["key"] = key
+        _cache["cfg"] = cfg
+
+    return copy.deepcopy(cfg)
 
 # --------------------------------------------------
 # Save config
@@ -119,6 +207,20 @@ def save_config(cfg: Dict[str, Any]):
 
     # Partial update’ler için güvenli merge
     final_cfg = _merge_with_defaults(cfg)
+    final_cfg["schema_version"] = CONFIG_SCHEMA_VERSION
 
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
+    # Atomik: okuyan process (Qt / menubar) yarım dosya görmez
+    tmp = f"{CONFIG_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(final_cfg, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_PATH)
+
+    with _cache_lock:
+        try:
+            _cache["key"] = _file_key(os.stat(CONFIG_PATH))
+            _cache["cfg"] = copy.deepcopy(final_cfg)
+        except OSError:
+            _cache["key"] = None
+            _cache["cfg"] = None
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+from dataclasses import asdict
+from pathlib import Path
+
+from ipc import STATE_DIR
+from scanner import Finding, ScanProfile
+
+SNAPSHOT_DIR = os.path.join(STATE_DIR, "snapshots")
+SNAPSHOT_VERSION = 2
+
+
+# --------------------------------------------------
+# Directory tree
+# --------------------------------------------------
+# Her dizin düğümü:
+#   {"mtime": ns, "files": {name: [size, mtime_ns]}, "dirs": {name: node}}
+#
+# Watcher'ın cold start'ı için tutulur; tüm ağacı atlayan bir özet yok.
+# Dizin mtime'ı sadece isim listesi değişince (ekleme / silme / rename)
+# güncellenir: mtime'ı aynı kalan dizin yeniden listelenmez (readdir yok).
+# Yerinde yazılan (rename'siz) dosyalar dizin mtime'ını değiştirmediğinden
+# bilinen dosyalar her zaman stat'lanır.
+
+_EMPTY = {"mtime": None, "files": {}, "dirs": {}}
+
+
+def _wanted_file(p: Path, profile: ScanProfile) -> bool:
+    return p.suffix.lower() in profile.text_exts and not profile.is_ignored_dir(p)
+
+
+def _all_files(node: dict, base: Path):
+    for name in node["files"]:
+        yield str(base / name)
+    for name, child in node["dirs"].items():
+        yield from _all_files(child, base / name)
+
+
+def _diff_node(
+    d: Path,
+    old: dict | None,
+    profile: ScanProfile,
+    changed: set[str],
+    removed: set[str],
+) -> dict | None:
+    """
+    old None → yeni dizin: listelenir, tüm dosyaları changed'e girer.
+    """
+    try:
+        st = os.stat(d)
+    except OSError:
+        if old is not None:
+            removed.update(_all_files(old, d))
+        return None
+
+    if old is None:
+        old = _EMPTY
+
+    # İsim listesi değişmemiş → readdir yok, bilinen dosyalar stat'lanır
+    if st.st_mtime_ns == old["mtime"]:
+        files = {}
+        for name, prev in old["files"].items():
+            p = d / name
+            try:
+                s = os.stat(p)
+            except OSError:
+                removed.add(str(p))
+                continue
+            files[name] = [s.st_size, s.st_mtime_ns]
+            if files[name] != prev:
+                changed.add(str(p))
+
+        dirs = {}
+        for name, child in old["dirs"].items():
+            n = _diff_node(d / name, child, profile, changed, removed)
+            if n is not None:
+                dirs[name] = n
+        return {"mtime": old["mtime"], "files": files, "dirs": dirs}
+
+    # Yeni ya da isim listesi değişmiş → bu dizini listele
+    files: dict[str, list[int]] = {}
+    dirs: dict[str, dict] = {}
+    seen_dirs: set[str] = set()
+
+    try:
+        entries = list(os.scandir(d))
+    except OSError:
+        removed.update(_all_files(old, d))
+        return None
+
+    for e in entries:
+        p = Path(e.path)
+        try:
+            if e.is_dir(follow_symlinks=False):
+                if profile.is_ignored_dir(p):
+                    continue
+                seen_dirs.add(e.name)
+                n = _diff_node(p, old["dirs"].get(e.name), profile, changed, removed)
+                if n is not None:
+                    dirs[e.name] = n
+            elif e.is_file() and _wanted_file(p, profile):
+                s = e.stat()
+                files[e.name] = [s.st_size, s.st_mtime_ns]
+                if old["files"].get(e.name) != files[e.name]:
+                    changed.add(str(p))
+        except OSError:
+            continue
+
+    for name in old["files"].keys() - files.keys():
+        removed.add(str(d / name))
+    for name in old["dirs"].keys() - seen_dirs:
+        removed.update(_all_files(old["dirs"][name], d / name))
+
+    return {"mtime": st.st_mtime_ns, "files": files, "dirs": dirs}
+
+
+# --------------------------------------------------
+# Public API
+# --------------------------------------------------
+def build_snapshot(root: Path, profile: ScanProfile) -> dict:
+    return diff_snapshot(root, None, profile)[0]
+
+
+def diff_snapshot(
+    root: Path, old: dict | None, profile: ScanProfile,
+) -> tuple[dict, set[str], set[str]]:
+    """
+    Önceki snapshot'a göre (yeni snapshot, değişen/eklenen, silinen) döner.
+    Sadece mtime'ı değişen dizinler listelenir; dosyalar size + mtime ile
+    karşılaştırılır.
+    """
+    changed: set[str] = set()
+    removed: set[str] = set()
+
+    node = _diff_node(root, old, profile, changed, removed)
+    if node is None:
+        node = {"mtime": 0, "files": {}, "dirs": {}}
+
+    return node, changed, removed
+
+
+def snapshot_files(node: dict, root: Path) -> list[str]:
+    return list(_all_files(node, root))
+
+
+def touch_files(node: dict, root: Path, paths):
+    """
+    Watcher'ın yeniden taradığı dosyaların stat bilgisini snapshot'a işler.
+    Normal dosya olmayan yollar (dizin event'leri) atlanır.
+    """
+    for path in paths:
+        p = Path(path)
+        try:
+            rel = p.relative_to(root)
+        except ValueError:
+            continue
+
+        cur = node
+        for part in rel.parts[:-1]:
+            cur = cur["dirs"].get(part)
+            if cur is None:
+                break
+        if cur is None:
+            continue
+
+        try:
+            s = p.stat()
+        except OSError:
+            cur["files"].pop(p.name, None)
+            continue
+        if stat.S_ISREG(s.st_mode):
+            cur["files"][p.name] = [s.st_size, s.st_mtime_ns]
+
+
+# --------------------------------------------------
+# Persistence (snapshot + per-file findings)
+# --------------------------------------------------
+def _state_path(root: Path) -> str:
+    key = hashlib.sha1(str(root).encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    return os.path.join(SNAPSHOT_DIR, f"{key}.json")
+
+
+def save_state(
+    root: Path,
+    settings: dict,
+    snapshot: dict,
+    files: dict[str, list[Finding]],
+):
+    """
+    settings: sonuçları etkileyen scan ayarları (mode, marker'lar ...).
+    Farklı ayarlarla kaydedilmiş durum load_state'te kullanılmaz.
+    """
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+
+    state = {
+        "version": SNAPSHOT_VERSION,
+        "root": str(root),
+        "settings": settings,
+        "snapshot": snapshot,
+        "files": {
+            path: [asdict(f) for f in items]
+            for path, items in files.items()
+        },
+    }
+
+    path = _state_path(root)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def load_state(
+    root: Path,
+    settings: dict,
+) -> tuple[dict, dict[str, list[Finding]]] | None:
+    """
+    Aynı root + settings için kaydedilmiş durum yoksa None.
+    """
+    try:
+        with open(_state_path(root), "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except Exception:
+        return None
+
+    if (
+        state.get("version") != SNAPSHOT_VERSION
+        or state.get("root") != str(root)
+        or state.get("settings") != settings
+    ):
+        return None
+
+    files = {
+        path: [Finding(**d) for d in items]
+        for path, items in state.get("files", {}).items()
+    }
+    return state["snapshot"], files
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import heapq
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+from bisect import bisect_right
+from dataclasses import fields
+from itertools import chain, groupby, islice
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Callable, Iterator
+
+if TYPE_CHECKING:
+    from scanner import Finding
+
+# Run dosyasında pickle batch boyutu; merge sırasında run başına bellekte bu kadar
+RUN_BATCH = 1000
+
+_path = attrgetter("path")
+
+
+def _read_run(path: str, cls: type) -> Iterator[Finding]:
+    with open(path, "rb") as fh:
+        while True:
+            try:
+                batch = pickle.load(fh)
+            except EOFError:
+                return
+            for values in batch:
+                yield cls(*values)
+
+
+class FindingStore:
+    """
+    scan_project'in bulgu listesi, bellek bütçeli.
+
+    Bulgular key'e göre sıralı gelir (scan_file sonucunu üretildiği yerde
+    sıralar) ve path başına bir run'da durur. key (severity bucket, path,
+    ...) biçimindedir: sonuç sırası, run'ların (bucket, path) dilimlerinin
+    ardı ardına eklenmesidir; bulgu başına karşılaştırma / global sort yok.
+
+    budget aşılınca o ana kadarki sıralı çıktı diske bir run olarak yazılır;
+    sonuç disk run'ları ile bellektekilerin heapq.merge'üdür. Eşitlikte scan
+    sırası korunur: çıktı, tüm listeyi stabil sıralamakla aynıdır.
+    """
+
+    def __init__(self, key: Callable[[Finding], tuple], budget: int = 0):
+        self.key = key
+        self.budget = budget
+        self.total = 0
+
+        # path → sıralı run (ekleme sırası = scan sırası)
+        self._paths: dict[str, list[Finding]] = {}
+        self._count = 0
+        self._runs: list[str] = []
+        self._dir: str | None = None
+
+        # Run'lara düz alan tuple'ı yazılır (dataclass pickle'ından hızlı);
+        # scanner'ı import etmemek için sınıf ilk spill'de bulgudan alınır
+        self._cls: type | None = None
+        self._as_tuple: Callable | None = None
+
+    @property
+    def spilled(self) -> bool:
+        return bool(self._runs)
+
+    def extend(self, items: list[Finding]):
+        """
+        items key'e göre sıralı olmalı (scan_file / _root_findings öyle döner).
+        """
+        paths = self._paths
+        for path, group in groupby(items, key=_path):
+            run = paths.get(path)
+            if run is None:
+                paths[path] = list(group)
+            else:
+                # Aynı path ikinci kez (nadir): stabil sort, eşitlikte scan sırası
+                run.extend(group)
+                run.sort(key=self.key)
+
+        self._count += len(items)
+        self.total += len(items)
+        if self.budget and self._count >= self.budget:
+            self._spill()
+
+    def _slices(self) -> list[tuple]:
+        """
+        Run'ların (bucket, path) dilimleri, sonuç sırasında. Dilim sınırları
+        bisect ile bulunur: run başına bucket sayısı kadar log n key çağrısı.
+        """
+        key = self.key
+
+        def bucket(f: Finding):
+            return key(f)[0]
+
+        slices = []
+        for seq, (path, run) in enumerate(self._paths.items()):
+            i, n = 0, len(run)
+            while i < n:
+                b = bucket(run[i])
+                j = bisect_right(run, b, i, n, key=bucket)
+                slices.append((b, path, seq, run, i, j))
+                i = j
+        # seq tekil: run listeleri hiç karşılaştırılmaz
+        slices.sort(key=itemgetter(0, 1, 2))
+        return slices
+
+    def _ordered(self) -> Iterator[Finding]:
+        """
+        Bellekteki bulgular sonuç sırasında; ilk bucket (en yüksek severity)
+        kalan dilimler gezilmeden okunabilir.
+        """
+        for _, _, _, run, i, j in self._slices():
+            yield from islice(run, i, j)
+
+    def _spill(self):
+        if self._dir is None:
+            self._dir = tempfile.mkdtemp(prefix="zinkx-runs-")
+            # Store (veya ondan dönen FindingRuns) toplanınca run'lar silinir
+            weakref.finalize(self, shutil.rmtree, self._dir, True)
+
+        if self._cls is None:
+            first = next(iter(self._paths.values()))[0]
+            self._cls = type(first)
+            self._as_tuple = attrgetter(*(f.name for f in fields(self._cls)))
+        as_tuple = self._as_tuple
+
+        path = os.path.join(self._dir, f"run-{len(self._runs):05d}.pkl")
+        ordered = self._ordered()
+        with open(path, "wb") as fh:
+            while True:
+                batch = [as_tuple(f) for f in islice(ordered, RUN_BATCH)]
+                if not batch:
+                    break
+                pickle.dump(batch, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        self._runs.append(path)
+        self._paths = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __iter__(self) -> Iterator[Finding]:
+        """
+        Spill olmadıysa scan sırası (path başına run'lar); olduysa sonuç sırası.
+        """
+        if not self._runs:
+            return chain.from_iterable(self._paths.values())
+        return self._merge()
+
+    def _merge(self) -> Iterator[Finding]:
+        return heapq.merge(
+            *(_read_run(p, self._cls) for p in self._runs), self._ordered(), key=self.key,
+        )
+
+    def finish(self) -> list[Finding] | FindingRuns:
+        """
+        Sıralı sonuç: spill yoksa liste (dilimlerin birleşimi), varsa tekrar
+        gezilebilir FindingRuns (her gezinme yeni bir merge).
+        """
+        if self._runs:
+            return FindingRuns(self)
+
+        out: list[Finding] = []
+        for _, _, _, run, i, j in self._slices():
+            out.extend(islice(run, i, j))
+        return out
+
+
+class FindingRuns:
+    """
+    Diske taşmış scan sonucu. list gibi len() ve birden çok kez iter()
+    desteklenir; bulgular bellekte toplanmaz.
+    """
+
+    def __init__(self, store: FindingStore):
+        self._store = store
+
+    def __len__(self) -> int:
+        return self._store.total
+
+    def __iter__(self) -> Iterator[Finding]:
+        return self._store._merge()
+
+    def __bool__(self) -> bool:
+        return self._store.total > 0
@@ -0,0 +1,551 @@
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from ipc import STATE_DIR
+from scanner import Finding
+from fingerprint import fingerprint
+from scan_delta import DELTA_LIST_LIMIT, ScanDelta
+
+DB_PATH = os.path.join(STATE_DIR, "findings.db")
+SCHEMA_VERSION = 3
+
+# executemany başına satır (tek transaction içinde)
+INSERT_BATCH = 1000
+# Proje başına saklanan en yeni scan sayısı (eskiler bulgularıyla silinir)
+KEEP_SCANS_PER_PROJECT = 200
+
+# Arama: sonuç limiti ve tek sorguda taranan en fazla eşleşme
+# (aynı bulgu her scan'de tekrar ettiğinden fingerprint ile tekilleştirilir)
+SEARCH_LIMIT = 50
+SEARCH_SCAN_CAP = 5000
+SEARCH_MAX_TERMS = 8
+SEARCH_MIN_TERM = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scans (
+    id            INTEGER PRIMARY KEY,
+    project       TEXT    NOT NULL,
+    mode          TEXT    NOT NULL,
+    finished_at   REAL    NOT NULL,
+    duration      REAL,
+    files_scanned INTEGER,
+    risks         INTEGER NOT NULL DEFAULT 0,
+    todos         INTEGER NOT NULL DEFAULT 0,
+    risk_score    INTEGER NOT NULL DEFAULT 0,
+    risk_level    TEXT
+);
+
+CREATE TABLE IF NOT EXISTS findings (
+    id             INTEGER PRIMARY KEY,
+    scan_id        INTEGER NOT NULL REFERENCES scans(id) ON DELETE CASCADE,
+    project        TEXT    NOT NULL,
+    fingerprint    TEXT    NOT NULL,
+    kind           TEXT    NOT NULL,
+    severity       TEXT    NOT NULL,
+    score          INTEGER NOT NULL,
+    rule           TEXT,
+    title          TEXT    NOT NULL,
+    detail         TEXT,
+    path           TEXT    NOT NULL,
+    line           INTEGER,
+    explanation    TEXT,
+    recommendation TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_scans_project   ON scans(project, finished_at);
+CREATE INDEX IF NOT EXISTS idx_findings_scan   ON findings(scan_id);
+CREATE INDEX IF NOT EXISTS idx_findings_sev    ON findings(project, severity);
+CREATE INDEX IF NOT EXISTS idx_findings_path   ON findings(path);
+CREATE INDEX IF NOT EXISTS idx_findings_rule   ON findings(rule);
+CREATE INDEX IF NOT EXISTS idx_findings_fp     ON findings(fingerprint);
+"""
+
+# External-content FTS5: metin findings'te durur, index trigger'larla senkron.
+# Prune (ON DELETE CASCADE) da trigger'ları tetikler. Son kelime prefix
+# aranır: prefix index'i olmayan uzunlukta FTS5 eşleşen tüm token'ların
+# doclist'ini birleştirir (sık token'da onlarca ms), 2-6 harf index'lenir.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS findings_fts USING fts5(
+    title, detail, path,
+    content='findings', content_rowid='id',
+    tokenize="unicode61 remove_diacritics 2 tokenchars '_'",
+    prefix='2 3 4 5 6'
+);
+
+CREATE TRIGGER IF NOT EXISTS findings_fts_ai AFTER INSERT ON findings BEGIN
+    INSERT INTO findings_fts (rowid, title, detail, path)
+    VALUES (new.id, new.title, new.detail, new.path);
+END;
+
+CREATE TRIGGER IF NOT EXISTS findings_fts_ad AFTER DELETE ON findings BEGIN
+    INSERT INTO findings_fts (findings_fts, rowid, title, detail, path)
+    VALUES ('delete', old.id, old.title, old.detail, old.path);
+END;
+"""
+
+_TERM = re.compile(r"\w+")
+
+
+def _project_key(project: str) -> str:
+    # scan_project kökü resolve eder; sorgular da aynı anahtarı kullanmalı
+    return str(Path(project).expanduser().resolve())
+
+
+def _match_query(text: str) -> str | None:
+    """
+    Kullanıcı girdisi → FTS5 MATCH ifadesi, kelimeler AND'lenir; FTS sözdizimi
+    kullanıcıya açılmaz. Tamamlanmış kelimeler tam token olarak aranır, sadece
+    yazılmakta olan son kelime prefix'tir (yazdıkça arama). SEARCH_MIN_TERM'den
+    kısa kelimeler atlanır: tek harf prefix'i neredeyse tüm index'i tarar.
+    """
+    terms = [t for t in _TERM.findall(text) if len(t) >= SEARCH_MIN_TERM]
+    terms = terms[:SEARCH_MAX_TERMS]
+    if not terms:
+        return None
+    exact = [f'"{t}"' for t in terms[:-1]]
+    return " ".join(exact + [f'"{terms[-1]}"*'])
+
+
+class FindingsDB:
+    """
+    Scan geçmişi + bulgular (SQLite, WAL).
+
+    Tek connection, lock ile paylaşılır; scheduler worker'ları ve UI aynı
+    instance'ı kullanabilir. Ayrı process'ler kendi instance'larını açar.
+    """
+
+    def __init__(self, path: str = DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.row_factory = sqlite3.Row
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                self._conn.executescript(_SCHEMA)
+                self._create_fts()
+                self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+                self._conn.commit()
+
+            self.has_fts = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'findings_fts'"
+            ).fetchone() is not None
+
+    def _create_fts(self):
+        try:
+            # v2'den yükseltme: prefix index'i değişti, tablo yeniden kurulur
+            self._conn.execute("DROP TABLE IF EXISTS findings_fts")
+            self._conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            # FTS5'siz SQLite derlemesi: search() LIKE'a düşer
+            return
+        # Yükseltme: mevcut bulgular index'lenir
+        self._conn.execute("INSERT INTO findings_fts (findings_fts) VALUES ('rebuild')")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def interrupt(self):
+        """
+        Çalışan sorguyu keser (lock almaz; başka thread'den çağrılır).
+        """
+        self._conn.interrupt()
+
+    # ----------------------------------------------
+    # Write
+    # ----------------------------------------------
+    def record_scan(
+        self,
+        project: str,
+        mode: str,
+        findings: Iterable[Finding],
+        summary: dict[str, Any],
+        files_scanned: int = 0,
+        duration: float = 0.0,
+    ) -> int:
+        """
+        Bir scan + tüm bulgularını tek transaction'da yazar; scan id döner.
+        """
+        project = _project_key(project)
+
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                """
+                INSERT INTO scans (project, mode, finished_at, duration, files_scanned,
+                                   risks, todos, risk_score, risk_level)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    project, mode, time.time(), duration, files_scanned,
+                    summary.get("last_risks", 0),
+                    summary.get("last_todos", 0),
+                    summary.get("risk_score", 0),
+                    summary.get("risk_level"),
+                ),
+            )
+            scan_id = cur.lastrowid
+
+            batch = []
+            for f in findings:
+                batch.append((
+                    scan_id, project, fingerprint(f, project),
+                    f.kind, f.severity, f.score, f.rule,
+                    f.title, f.detail, f.path, f.line,
+                    f.explanation, f.recommendation,
+                ))
+                if len(batch) >= INSERT_BATCH:
+                    self._insert_findings(batch)
+                    batch = []
+            if batch:
+                self._insert_findings(batch)
+
+            self._prune(project, KEEP_SCANS_PER_PROJECT)
+
+        return scan_id
+
+    def _insert_findings(self, rows: list[tuple]):
+        self._conn.executemany(
+            """
+            INSERT INTO findings (scan_id, project, fingerprint, kind, severity, score,
+                                  rule, title, detail, path, line,
+                                  explanation, recommendation)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    def _prune(self, project: str, keep: int):
+        self._conn.execute(
+            """
+            DELETE FROM scans WHERE project = ? AND id NOT IN (
+                SELECT id FROM scans WHERE project = ?
+                ORDER BY finished_at DESC LIMIT ?
+            )
+            """,
+            (project, project, keep),
+        )
+
+    # ----------------------------------------------
+    # Queries
+    # ----------------------------------------------
+    def _query(self, sql: str, params: tuple = ()) -> list[dict]:
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(sql, params)]
+
+    def recent_scans(self, project: str | None = None, limit: int = 5) -> list[dict]:
+        if project is None:
+            return self._query(
+                "SELECT * FROM scans ORDER BY finished_at DESC LIMIT ?",
+                (limit,),
+            )
+        return self._query(
+            "SELECT * FROM scans WHERE project = ? ORDER BY finished_at DESC LIMIT ?",
+            (_project_key(project), limit),
+        )
+
+    def risks_by_file(
+        self,
+        project: str,
+        last_scans: int = 30,
+        limit: int = 20,
+    ) -> list[dict]:
+        """
+        Son last_scans scan boyunca dosya başına RISK sayıları.
+        [{path, risks, critical, high, scans}] (risks'e göre azalan)
+        """
+        return self._query(
+            """
+            WITH recent AS (
+                SELECT id FROM scans
+                WHERE project = ?
+                ORDER BY finished_at DESC
+                LIMIT ?
+            )
+            SELECT path,
+                   COUNT(*)                                        AS risks,
+                   SUM(severity = 'CRITICAL')                      AS critical,
+                   SUM(severity = 'HIGH')                          AS high,
+                   COUNT(DISTINCT scan_id)                         AS scans
+            FROM findings
+            WHERE scan_id IN (SELECT id FROM recent) AND kind = 'RISK'
+            GROUP BY path
+            ORDER BY risks DESC, critical DESC, path
+            LIMIT ?
+            """,
+            (_project_key(project), last_scans, limit),
+        )
+
+    def scan_findings(self, scan_id: int) -> list[Finding]:
+        rows = self._query(
+            """
+            SELECT kind, severity, score, title, detail, path, line,
+                   explanation, recommendation, rule
+            FROM findings WHERE scan_id = ? ORDER BY id
+            """,
+            (scan_id,),
+        )
+        return [Finding(**r) for r in rows]
+
+    def previous_scan_id(self, scan_id: int) -> int | None:
+        """
+        Aynı proje + mode'daki bir önceki tam scan (yoksa None).
+        """
+        rows = self._query(
+            """
+            SELECT prev.id FROM scans cur
+            JOIN scans prev
+              ON prev.project = cur.project AND prev.mode = cur.mode
+             AND prev.finished_at < cur.finished_at
+            WHERE cur.id = ?
+            ORDER BY prev.finished_at DESC
+            LIMIT 1
+            """,
+            (scan_id,),
+        )
+        return rows[0]["id"] if rows else None
+
+    def scan_delta(self, scan_id: int, base_scan_id: int | None = None) -> ScanDelta:
+        """
+        scan_id'nin base_scan_id'ye (verilmezse bir önceki scan'e) göre farkı.
+        Kayıtlı bulgulardan hesaplanır; rescan gerekmez. İlk scan'de base yok:
+        hepsi new.
+
+        Eşleştirme fingerprint multiset'i üzerinden SQL'de yapılır (3 → 2
+        olunca biri fixed); Python'a sadece sayılar ve listelenecek en fazla
+        DELTA_LIST_LIMIT new / fixed satırı gelir.
+        """
+        if base_scan_id is None:
+            base_scan_id = self.previous_scan_id(scan_id)
+        base = -1 if base_scan_id is None else base_scan_id
+        params = {"cur": scan_id, "base": base, "limit": DELTA_LIST_LIMIT}
+
+        # fingerprint → bu scan'deki / önceki scan'deki adet; kind fingerprint'e
+        # dahil, grup başına risk bayrağı tek
+        per_fp = """
+            SELECT fingerprint,
+                   SUM(scan_id = :cur)  AS cur_n,
+                   SUM(scan_id = :base) AS base_n,
+                   MAX(kind = 'RISK')   AS risk
+            FROM findings WHERE scan_id IN (:cur, :base)
+            GROUP BY fingerprint
+        """
+
+        with self._lock:
+            counts = self._conn.execute(
+                f"""
+                SELECT COALESCE(SUM(MAX(cur_n - base_n, 0)), 0),
+                       COALESCE(SUM(MAX(base_n - cur_n, 0)), 0),
+                       COALESCE(SUM(MIN(cur_n, base_n)), 0),
+                       COALESCE(SUM(risk * MAX(cur_n - base_n, 0)), 0),
+                       COALESCE(SUM(risk * MAX(base_n - cur_n, 0)), 0)
+                FROM ({per_fp})
+                """,
+                params,
+            ).fetchone()
+
+            # Aynı fingerprint'in fazla kopyaları: bu scan'de ilk base_n'den
+            # sonrakiler new, önceki scan'de ilk (base_n - cur_n) fixed
+            new_rows, fixed_rows = (
+                self._conn.execute(
+                    f"""
+                    WITH d AS ({per_fp}),
+                    ranked AS (
+                        SELECT f.*, d.cur_n, d.base_n,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY f.fingerprint ORDER BY f.id
+                               ) AS rn
+                        FROM findings f JOIN d ON d.fingerprint = f.fingerprint
+                        WHERE f.scan_id = :{side} AND {cond}
+                    )
+                    SELECT kind, severity, score, title, detail, path, line,
+                           explanation, recommendation, rule
+                    FROM ranked WHERE {pick}
+                    ORDER BY id LIMIT :limit
+                    """,
+                    params,
+                ).fetchall()
+                for side, cond, pick in (
+                    ("cur", "d.cur_n > d.base_n", "rn > base_n"),
+                    ("base", "d.base_n > d.cur_n", "rn <= base_n - cur_n"),
+                )
+            )
+
+        return ScanDelta(
+            scan_id, base_scan_id, *counts,
+            new=[Finding(*r) for r in new_rows],
+            fixed=[Finding(*r) for r in fixed_rows],
+        )
+
+    # ----------------------------------------------
+    # Search
+    # ----------------------------------------------
+    def search(
+        self,
+        text: str,
+        project: str | None = None,
+        limit: int = SEARCH_LIMIT,
+    ) -> list[dict]:
+        """
+        Tüm scan'lerde title / detail / path üzerinde arama, en yeni önce.
+        Aynı bulgu (fingerprint) bir kez döner: son görüldüğü scan ile.
+        """
+        project_filter = "" if project is None else "AND f.project = ?"
+        params: list[Any] = []
+        if self.has_fts:
+            match = _match_query(text)
+            if match is None:
+                return []
+            # FTS tarafı sürer: eşleşmeler rowid (= en yeni) sırasıyla gelir,
+            # findings'e PK ile bağlanır; tüm eşleşme kümesi kurulmaz
+            sql = f"""
+                SELECT f.id, f.fingerprint
+                FROM findings_fts
+                JOIN findings f ON f.id = findings_fts.rowid
+                WHERE findings_fts MATCH ? {project_filter}
+                ORDER BY findings_fts.rowid DESC
+                LIMIT ?
+            """
+            params.append(match)
+        else:
+            needle = text.strip()
+            if not needle:
+                return []
+            like = "%" + needle.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            sql = f"""
+                SELECT f.id, f.fingerprint
+                FROM findings f
+                WHERE (f.title LIKE ? ESCAPE '\\' OR f.detail LIKE ? ESCAPE '\\'
+                       OR f.path LIKE ? ESCAPE '\\') {project_filter}
+                ORDER BY f.id DESC
+                LIMIT ?
+            """
+            params += [like, like, like]
+
+        if project is not None:
+            params.append(_project_key(project))
+        params.append(SEARCH_SCAN_CAP)
+
+        ids: list[int] = []
+        seen: set[str] = set()
+        with self._lock:
+            # Tekilleştirme sadece (id, fingerprint) üzerinde; cursor tembel
+            # okunur, limit dolunca kalan eşleşmeler çekilmez
+            for row_id, fp in self._conn.execute(sql, params):
+                if fp in seen:
+                    continue
+                seen.add(fp)
+                ids.append(row_id)
+                if len(ids) >= limit:
+                    break
+            if not ids:
+                return []
+
+            # Tam satırlar sadece dönen bulgular için
+            marks = ", ".join("?" * len(ids))
+            rows = self._conn.execute(
+                f"""
+                SELECT f.id, f.scan_id, f.project, f.fingerprint, f.kind, f.severity,
+                       f.rule, f.title, f.detail, f.path, f.line,
+                       f.explanation, f.recommendation,
+                       s.mode, s.finished_at
+                FROM findings f JOIN scans s ON s.id = f.scan_id
+                WHERE f.id IN ({marks})
+                ORDER BY f.id DESC
+                """,
+                ids,
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+
+class FindingsSearcher:
+    """
+    Yazdıkça arama için arka plan sorgu thread'i.
+
+    Her submit() bir generation numarası alır; bekleyen eski sorgu atılır,
+    çalışan sorgu interrupt edilir. Sonuç callback'i worker thread'inden
+    sadece hâlâ en güncel olan sorgu için çağrılır:
+        on_results(generation, text, rows, elapsed_ms)
+    UI'ı bloklamamak için kendi connection'ını açar.
+    """
+
+    def __init__(
+        self,
+        on_results: Callable[[int, str, list[dict], float], None],
+        path: str = DB_PATH,
+        limit: int = SEARCH_LIMIT,
+    ):
+        self._on_results = on_results
+        self._db = FindingsDB(path)
+        self._limit = limit
+
+        self._cond = threading.Condition()
+        self._pending: tuple[int, str, str | None] | None = None
+        self._generation = 0
+        self._running: int | None = None
+        self._stopped = False
+
+        self._thread = threading.Thread(
+            target=self._worker, name="FindingsSearch", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, text: str, project: str | None = None) -> int:
+        with self._cond:
+            self._generation += 1
+            self._pending = (self._generation, text, project)
+            if self._running is not None:
+                self._db.interrupt()
+            self._cond.notify()
+            return self._generation
+
+    def close(self):
+        with self._cond:
+            self._stopped = True
+            self._pending = None
+            if self._running is not None:
+                self._db.interrupt()
+            self._cond.notify()
+        self._thread.join(timeout=2)
+        self._db.close()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                generation, text, project = self._pending
+                self._pending = None
+                self._running = generation
+
+            started = time.perf_counter()
+            try:
+                rows = self._db.search(text, project=project, limit=self._limit)
+            except sqlite3.Error:
+                rows = None   # interrupt / kilitli db: yenisi zaten sırada
+
+            with self._cond:
+                self._running = None
+                stale = generation != self._generation
+
+            if rows is not None and not stale:
+                elapsed = (time.perf_counter() - started) * 1000
+                try:
+                    self._on_results(generation, text, rows, elapsed)
+                except Exception:
+                    pass
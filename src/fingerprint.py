@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scanner import Finding
+
+_WS = re.compile(r"\s+")
+
+
+def relative_key(path: str, root: str) -> str:
+    """
+    Proje-göreli path. root resolve edilmiş olmalı (scan_project / FindingsDB
+    öyle verir); kök altındaki yollar Path nesnesi kurmadan kesilir.
+    """
+    if path.startswith(root) and path[len(root):len(root) + 1] == os.sep:
+        return path[len(root) + 1:]
+    try:
+        return str(Path(path).relative_to(root))
+    except ValueError:
+        return path
+
+
+def fingerprint(f: Finding, root: str) -> str:
+    """
+    Satır numarasından bağımsız kimlik: kural + proje-göreli path + normalize
+    satır içeriği (detail). Üstüne satır eklenen / kayan bulgu aynı
+    fingerprint'i korur; FindingsDB geçmişi ve baseline aynı değeri kullanır.
+    """
+    return fingerprint_of(f.rule or f.title, f.kind, relative_key(f.path, root), f.detail)
+
+
+def fingerprint_of(rule: str, kind: str, rel_path: str, detail: str | None) -> str:
+    """
+    fingerprint() ile aynı değer, Finding kurulmadan (scanner'ın dosya içi
+    sınır kontrolü baseline'daki satırları bu yolla tanır).
+    """
+    detail = _WS.sub(" ", (detail or "").strip())
+    key = "\0".join((rule, kind, rel_path, detail))
+    return hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()
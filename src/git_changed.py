@@ -30,3 +30,35 @@ def get_changed_files(repo_path: str) -> list[str]:
         return files
     except Exception:
         return []
+
+
+def get_staged_files(repo_path: str) -> list[str]:
+    """
+    Commit'e girecek (index'teki) dosyalar.
+    Silinen dosyalar hariç (--diff-filter=ACMR).
+    """
+    repo = Path(repo_path)
+    if not (repo / ".git").exists():
+        return []
+
+    try:
+        r = subprocess.run(
+            ["git", "diff", "--cached", "--name-only", "-z", "--diff-filter=ACMR"],
+            cwd=str(repo),
+            capture_output=True,
+            text=True,
+        )
+        if r.returncode != 0:
+            return []
+
+        files: list[str] = []
+        for path in r.stdout.split("\0"):
+            if not path:
+                continue
+            full = repo / path
+            if full.is_file():
+                files.append(str(full))
+
+        return files
+    except Exception:
+        return []
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Pre-commit hook client.
+
+Bilerek küçük tutuldu: scanner / report modüllerini import etmez.
+Staged dosyaları scan daemon'a gönderir ve verdict'e göre exit code döner.
+
+Daemon çalışmıyorsa arka planda başlatılır ve bu commit için
+precommit_runner ile klasik (cold) tarama yapılır.
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+
+from git_changed import get_staged_files
+from ipc import STATE_DIR
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.path.join(STATE_DIR, "scan-daemon.sock")
+
+# Daemon cevap vermezse cold path'e düş (saniye)
+REQUEST_TIMEOUT = 30
+
+
+def _request(msg: dict) -> dict | None:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(REQUEST_TIMEOUT)
+            s.connect(SOCKET_PATH)
+            s.sendall(json.dumps(msg).encode("utf-8") + b"\n")
+
+            buf = b""
+            while not buf.endswith(b"\n"):
+                chunk = s.recv(65536)
+                if not chunk:
+                    break
+                buf += chunk
+
+        return json.loads(buf) if buf else None
+    except (OSError, ValueError):
+        return None
+
+
+def _spawn_daemon():
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.join(SRC_DIR, "scan_daemon.py")],
+            cwd=SRC_DIR,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except Exception:
+        pass
+
+
+def _cold_run() -> int:
+    sys.path.insert(0, SRC_DIR)
+    from precommit_runner import main as run_precommit
+    return run_precommit([])
+
+
+def main() -> int:
+    repo = os.getcwd()
+
+    staged = get_staged_files(repo)
+    if not staged:
+        print("✔ No staged files. Commit allowed.")
+        return 0
+
+    verdict = _request({
+        "op": "check",
+        "repo": repo,
+        "staged": [os.path.relpath(p, repo) for p in staged],
+        "mode": "prod",
+    })
+
+    if verdict is None:
+        _spawn_daemon()
+        return _cold_run()
+
+    if not verdict.get("ok"):
+        print(f"⚠ Scan daemon error: {verdict.get('error')}")
+        return _cold_run()
+
+    if not verdict.get("allowed"):
+        print("\n🚨 COMMIT BLOCKED — Security Risks Found")
+        print(f"→ Risks: {verdict['risks']}")
+        for line in verdict.get("top", []):
+            print(f"  {line}")
+        if verdict.get("report"):
+            print(f"→ Report: {verdict['report']}\n")
+            os.system(f"open '{verdict['report']}'")
+        return 1
+
+    print(f"✔ Scan clean ({verdict.get('elapsed_ms', 0)} ms). Commit allowed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,9 @@
 from pathlib import Path
 import os
 import stat
+import sys
+
+SRC_DIR = Path(__file__).resolve().parent
 
 
 def install_precommit_hook(repo_path: str):
@@ -13,9 +16,9 @@ def install_precommit_hook(repo_path: str):
 
     hook_file = hooks_dir / "pre-commit"
 
+    # Hook sadece küçük client'ı çalıştırır; tarama warm scan daemon'da yapılır
     script = f"""#!/bin/bash
-source "{Path.home()}/Projects/zinkx-dev-assistant/.venv/bin/activate"
-python "{repo / 'src' / 'precommit_runner.py'}"
+exec "{sys.executable}" "{SRC_DIR / 'hook_client.py'}"
 """
 
     hook_file.write_text(script, encoding="utf-8")
@@ -2,36 +2,113 @@ import json
 import os
 from typing import Any, Dict
 
+from ipc_journal import Journal
+
 STATE_DIR = os.path.expanduser("~/.zinkx_dev_assistant")
 os.makedirs(STATE_DIR, exist_ok=True)
 
-CMD_FILE = os.path.join(STATE_DIR, "command.json")
 STATUS_FILE = os.path.join(STATE_DIR, "status.json")
+QUEUE_FILE = os.path.join(STATE_DIR, "queue.json")
 
+# Bundan eski komutlar yeni / uzun süre kapalı kalmış consumer'a tekrar
+# verilmez (ör. saatler önce istenmiş scan); status tarafı snapshot'tan başlar
+COMMAND_TTL = 60.0
 
-def send_command(cmd: Dict[str, Any]):
-    with open(CMD_FILE, "w", encoding="utf-8") as f:
-        json.dump(cmd, f)
+# Dosya tabanlı fallback: kayıpsız, sıralı günlükler (ipc_journal)
+COMMAND_JOURNAL = Journal(os.path.join(STATE_DIR, "commands.jsonl"), max_age=COMMAND_TTL)
+EVENT_JOURNAL = Journal(os.path.join(STATE_DIR, "events.jsonl"))
 
+# Event-driven kanal (ipc_channel); yoksa dosya tabanlı fallback
+CHANNEL_SOCKET = os.path.join(STATE_DIR, "ipc.sock")
 
-def read_command() -> Dict[str, Any] | None:
-    if not os.path.exists(CMD_FILE):
-        return None
+_channel = None  # MessageBroker | ChannelClient
+
+
+def use_channel(channel):
+    """
+    send_command / write_status mesajlarını önce bu kanaldan push eder.
+    None verilirse tamamen dosya moduna dönülür.
+    """
+    global _channel
+    _channel = channel
+
+
+def _publish(topic: str, msg: Dict[str, Any]) -> bool:
+    channel = _channel
+    if channel is None:
+        return False
     try:
-        with open(CMD_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return channel.publish(topic, msg)
     except Exception:
-        return None
+        return False
 
 
-def clear_command():
-    if os.path.exists(CMD_FILE):
-        os.remove(CMD_FILE)
+def send_command(cmd: Dict[str, Any]):
+    if _publish("command", cmd):
+        return
+    COMMAND_JOURNAL.append(cmd)
+
+
+def read_commands(consumer: str) -> list[Dict[str, Any]]:
+    """
+    consumer ("menubar", "window" ...) için okunmamış komutlar, gönderim sırasıyla.
+    Her consumer'ın cursor'u ayrıdır; biri okuyunca diğerinden kaybolmaz.
+    COMMAND_TTL'den eski komutlar atlanır.
+    """
+    try:
+        return COMMAND_JOURNAL.read(consumer)
+    except OSError:
+        return []
 
 
 def write_status(status: Dict[str, Any]):
-    with open(STATUS_FILE, "w", encoding="utf-8") as f:
-        json.dump(status, f)
+    # Kanala ulaşan event journal'a yazılmaz (abone iki kez görmesin)
+    if not _publish("status", status):
+        EVENT_JOURNAL.append(status)
+
+    # Son durum snapshot'ı her zaman (atomik: okuyan yarım dosya görmez)
+    _write_json_atomic(STATUS_FILE, status)
+
+
+def read_events(consumer: str) -> list[Dict[str, Any]]:
+    """
+    consumer için okunmamış status event'leri (progress / done / error ...).
+    İlk okumada geçmiş yerine son durum snapshot'ı döner.
+    """
+    try:
+        first = EVENT_JOURNAL.cursor(consumer) is None
+        events = EVENT_JOURNAL.read(consumer)
+    except OSError:
+        return []
+
+    if first:
+        st = read_status()
+        return [st] if st else []
+    return events
+
+
+def _write_json_atomic(path: str, data: Dict[str, Any]):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def write_queue_state(state: Dict[str, Any]):
+    """
+    Scheduler kuyruk durumu (running / queued / recent). Sadece son hal önemli:
+    kanala yayınlanır ve queue.json üzerine yazılır (polling eski hali görmesin).
+    """
+    _publish("queue", state)
+    _write_json_atomic(QUEUE_FILE, state)
+
+
+def read_queue_state() -> Dict[str, Any] | None:
+    try:
+        with open(QUEUE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return None
 
 
 def read_status() -> Dict[str, Any] | None:
@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import json
+import os
+import selectors
+import socket
+import struct
+import threading
+from typing import Any, Callable, Dict
+
+from ipc import CHANNEL_SOCKET
+
+# Son mesajı saklanan topic'ler: yeni abone bağlanınca hemen alır
+RETAINED_TOPICS = {"status", "queue"}
+
+_HEADER = struct.Struct("!I")
+_MAX_FRAME = 16 * 1024 * 1024
+
+# Aboneye yazma süresi sınırı: okumayan client broker'ı kilitlemez, düşürülür
+SEND_TIMEOUT = 0.5
+
+Message = Dict[str, Any]
+Handler = Callable[[str, Message], None]
+
+
+# --------------------------------------------------
+# Framing: 4 byte uzunluk (big-endian) + UTF-8 JSON
+# --------------------------------------------------
+def _encode(frame: dict) -> bytes:
+    body = json.dumps(frame, ensure_ascii=False).encode("utf-8")
+    return _HEADER.pack(len(body)) + body
+
+
+class _FrameReader:
+    def __init__(self):
+        self._buf = bytearray()
+
+    def feed(self, data: bytes) -> list[dict]:
+        self._buf += data
+        frames = []
+        while len(self._buf) >= _HEADER.size:
+            (size,) = _HEADER.unpack_from(self._buf)
+            if size > _MAX_FRAME:
+                raise ValueError("frame too large")
+            end = _HEADER.size + size
+            if len(self._buf) < end:
+                break
+            frames.append(json.loads(self._buf[_HEADER.size:end]))
+            del self._buf[:end]
+        return frames
+
+
+class _Conn:
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.reader = _FrameReader()
+        self.topics: set[str] = set()
+        self.lock = threading.Lock()
+
+    def send(self, frame: dict) -> bool:
+        try:
+            with self.lock:
+                self.sock.sendall(_encode(frame))
+            return True
+        except OSError:
+            return False
+
+
+# --------------------------------------------------
+# Broker (menubar / owner process)
+# --------------------------------------------------
+class MessageBroker:
+    """
+    Yerel pub/sub broker.
+
+    Client frame'leri:
+        {"op": "subscribe", "topics": ["status", "command"]}
+        {"op": "publish", "topic": "command", "msg": {...}}
+    Abonelere giden frame:
+        {"topic": "status", "msg": {...}}
+
+    Aynı process içinden publish / subscribe de yapılabilir.
+    """
+
+    def __init__(self, socket_path: str = CHANNEL_SOCKET):
+        self.socket_path = socket_path
+
+        self._sel = selectors.DefaultSelector()
+        self._server: socket.socket | None = None
+        self._conns: dict[socket.socket, _Conn] = {}
+        self._lock = threading.Lock()
+
+        self._local: dict[str, list[Handler]] = {}
+        self._retained: dict[str, Message] = {}
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ----------------------------------------------
+    # Lifecycle
+    # ----------------------------------------------
+    def start(self):
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        old_umask = os.umask(0o077)
+        try:
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+
+        server.listen(16)
+        server.setblocking(False)
+        self._server = server
+        self._sel.register(server, selectors.EVENT_READ)
+
+        self._thread = threading.Thread(
+            target=self._loop, name="MessageBroker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+        with self._lock:
+            for conn in self._conns.values():
+                conn.sock.close()
+            self._conns.clear()
+
+        if self._server is not None:
+            self._server.close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    @property
+    def client_count(self) -> int:
+        with self._lock:
+            return len(self._conns)
+
+    # ----------------------------------------------
+    # Pub / Sub
+    # ----------------------------------------------
+    def subscribe(self, topic: str, handler: Handler):
+        """
+        Process içi abone (broker thread'inde çağrılır).
+        """
+        self._local.setdefault(topic, []).append(handler)
+
+    def publish(self, topic: str, msg: Message) -> bool:
+        """
+        Process içinden publish. En az bir uzak aboneye ulaştıysa True.
+        """
+        return self._fanout(topic, msg, origin=None, local=False)
+
+    def _fanout(
+        self,
+        topic: str,
+        msg: Message,
+        origin: _Conn | None,
+        local: bool = True,
+    ) -> bool:
+        if topic in RETAINED_TOPICS:
+            self._retained[topic] = msg
+
+        with self._lock:
+            targets = [
+                c for c in self._conns.values()
+                if c is not origin and topic in c.topics
+            ]
+
+        delivered = False
+        frame = {"topic": topic, "msg": msg}
+        for conn in targets:
+            if conn.send(frame):
+                delivered = True
+            else:
+                self._drop(conn)
+
+        if local:
+            for handler in self._local.get(topic, []):
+                try:
+                    handler(topic, msg)
+                except Exception:
+                    pass
+                delivered = True
+
+        return delivered
+
+    # ----------------------------------------------
+    # Socket loop
+    # ----------------------------------------------
+    def _loop(self):
+        while not self._stop.is_set():
+            for key, _ in self._sel.select(timeout=0.5):
+                if key.fileobj is self._server:
+                    self._accept()
+                else:
+                    self._read(key.fileobj)
+
+    def _accept(self):
+        try:
+            sock, _ = self._server.accept()
+        except OSError:
+            return
+
+        sock.settimeout(SEND_TIMEOUT)
+        conn = _Conn(sock)
+        with self._lock:
+            self._conns[sock] = conn
+        self._sel.register(sock, selectors.EVENT_READ)
+
+    def _read(self, sock: socket.socket):
+        conn = self._conns.get(sock)
+        if conn is None:
+            return
+
+        try:
+            data = sock.recv(65536)
+            frames = conn.reader.feed(data) if data else None
+        except (OSError, ValueError):
+            frames = None
+
+        if frames is None:
+            self._drop(conn)
+            return
+
+        for frame in frames:
+            op = frame.get("op")
+            if op == "subscribe":
+                topics = set(frame.get("topics", []))
+                conn.topics |= topics
+                for topic in topics & self._retained.keys():
+                    conn.send({"topic": topic, "msg": self._retained[topic]})
+            elif op == "publish" and frame.get("topic"):
+                self._fanout(frame["topic"], frame.get("msg") or {}, origin=conn)
+
+    def _drop(self, conn: _Conn):
+        with self._lock:
+            if self._conns.pop(conn.sock, None) is None:
+                return
+
+        try:
+            self._sel.unregister(conn.sock)
+        except (KeyError, ValueError):
+            pass
+        conn.sock.close()
+
+
+# --------------------------------------------------
+# Client (Qt window / diğer process'ler)
+# --------------------------------------------------
+class ChannelClient:
+    """
+    Broker'a bağlanır; mesajlar reader thread'inde on_message ile push edilir.
+    """
+
+    def __init__(
+        self,
+        topics: list[str] | None = None,
+        on_message: Handler | None = None,
+        on_disconnect: Callable[[], None] | None = None,
+        socket_path: str = CHANNEL_SOCKET,
+    ):
+        self.topics = topics or []
+        self.on_message = on_message
+        self.on_disconnect = on_disconnect
+        self.socket_path = socket_path
+
+        self._conn: _Conn | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None
+
+    def connect(self, timeout: float = 0.5) -> bool:
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            sock.connect(self.socket_path)
+            sock.settimeout(None)
+        except OSError:
+            return False
+
+        self._conn = _Conn(sock)
+
+        if self.topics:
+            self._conn.send({"op": "subscribe", "topics": self.topics})
+
+        if self.on_message or self.topics:
+            self._thread = threading.Thread(
+                target=self._reader, name="ChannelClient", daemon=True
+            )
+            self._thread.start()
+
+        return True
+
+    def publish(self, topic: str, msg: Message) -> bool:
+        conn = self._conn
+        if conn is None:
+            return False
+        if conn.send({"op": "publish", "topic": topic, "msg": msg}):
+            return True
+        self.close()
+        return False
+
+    def close(self):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            conn.sock.close()
+
+    def _reader(self):
+        conn = self._conn
+        try:
+            while conn is not None:
+                data = conn.sock.recv(65536)
+                if not data:
+                    break
+                for frame in conn.reader.feed(data):
+                    if self.on_message and "topic" in frame:
+                        self.on_message(frame["topic"], frame.get("msg") or {})
+        except (OSError, ValueError):
+            pass
+
+        if self._conn is conn:
+            self.close()
+            if self.on_disconnect:
+                self.on_disconnect()
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import fcntl
+import glob
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+# Bu boyutu aşınca tüm consumer'ların okuduğu kayıtlar silinir
+COMPACT_BYTES = 256 * 1024
+# Bu süredir cursor'u ilerlemeyen consumer compaction'ı bloklamaz (kapanmış pencere vb.)
+STALE_CURSOR_SECONDS = 24 * 60 * 60
+
+
+class Journal:
+    """
+    Append-only, sıra numaralı mesaj günlüğü (JSON Lines).
+
+    - append: flock altında tek write() ile eklenir → yarım satır / kayıp yok
+    - read: her consumer'ın kendi cursor'u vardır; biri okuyunca diğerinden silinmez
+    - compact: tüm (aktif) consumer'ların geçtiği kayıtlar atomik rename ile atılır
+
+    Dosyalar:
+        <path>              {"seq": 12, "ts": 1700000000.0, "msg": {...}}\\n
+        <path>.lock         flock hedefi
+        <path>.seq          son verilen seq
+        <path>.<name>.cursor  consumer'ın son okuduğu seq
+    """
+
+    def __init__(self, path: str, max_age: float | None = None):
+        self.path = path
+        # Verilirse bundan eski kayıtlar okunmadan atlanır (bayat komutlar)
+        self.max_age = max_age
+        self._lock_path = f"{path}.lock"
+        self._seq_path = f"{path}.seq"
+
+    # ----------------------------------------------
+    # Helpers
+    # ----------------------------------------------
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _cursor_path(self, consumer: str) -> str:
+        return f"{self.path}.{consumer}.cursor"
+
+    def _last_seq(self) -> int:
+        try:
+            with open(self._seq_path, "r", encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            # .seq kaybolduysa günlükteki son kayıttan devam et
+            return max((e.get("seq", 0) for e in self._iter_entries()), default=0)
+
+    @staticmethod
+    def _write_atomic(path: str, text: str):
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def _iter_entries(self) -> Iterator[dict]:
+        try:
+            with open(self.path, "rb") as f:
+                for raw in f:
+                    # Yazımı bitmemiş son satır atlanır
+                    if not raw.endswith(b"\n"):
+                        break
+                    try:
+                        yield json.loads(raw)
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            return
+
+    # ----------------------------------------------
+    # Writer
+    # ----------------------------------------------
+    def append(self, msg: Dict[str, Any]) -> int:
+        with self._locked():
+            seq = self._last_seq() + 1
+            line = json.dumps(
+                {"seq": seq, "ts": time.time(), "msg": msg},
+                ensure_ascii=False,
+            ).encode("utf-8") + b"\n"
+
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, line)
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+
+            self._write_atomic(self._seq_path, str(seq))
+
+            if size > COMPACT_BYTES:
+                self._compact_locked()
+
+        return seq
+
+    # ----------------------------------------------
+    # Consumers
+    # ----------------------------------------------
+    def cursor(self, consumer: str) -> int | None:
+        try:
+            with open(self._cursor_path(consumer), "r", encoding="utf-8") as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
+
+    def commit(self, consumer: str, seq: int):
+        self._write_atomic(self._cursor_path(consumer), str(seq))
+
+    def read(self, consumer: str) -> list[Dict[str, Any]]:
+        """
+        Consumer'ın cursor'undan sonraki mesajlar (sıralı) ve cursor ilerletilir.
+        İlk kez okuyan consumer günlükte kalan en eski kayıttan başlar
+        (ilk okumadan önce gönderilen komutlar kaybolmaz); max_age'den eski
+        kayıtlar cursor'u ilerletir ama dönmez.
+        """
+        cursor = self.cursor(consumer)
+        after = cursor
+        if after is None or after > self._last_seq():
+            after = 0  # yeni consumer / günlük sıfırlanmış
+
+        oldest = time.time() - self.max_age if self.max_age is not None else None
+
+        out = []
+        last = after
+        for entry in self._iter_entries():
+            seq = entry.get("seq", 0)
+            if seq <= after:
+                continue
+            last = seq
+            if oldest is not None and entry.get("ts", 0) < oldest:
+                continue
+            out.append(entry.get("msg") or {})
+
+        if last != cursor:
+            self.commit(consumer, last)
+        else:
+            # Aktif consumer: compaction onu stale saymasın
+            try:
+                os.utime(self._cursor_path(consumer))
+            except OSError:
+                pass
+
+        return out
+
+    # ----------------------------------------------
+    # Compaction
+    # ----------------------------------------------
+    def compact(self):
+        with self._locked():
+            self._compact_locked()
+
+    def _compact_locked(self):
+        now = time.time()
+        cursors = []
+        for path in glob.glob(glob.escape(self.path) + ".*.cursor"):
+            try:
+                if now - os.path.getmtime(path) > STALE_CURSOR_SECONDS:
+                    continue
+                with open(path, "r", encoding="utf-8") as f:
+                    cursors.append(int(f.read().strip()))
+            except (OSError, ValueError):
+                continue
+
+        # Aktif consumer yoksa hepsi okunmuş sayılır
+        keep_after = min(cursors) if cursors else self._last_seq()
+
+        kept = [
+            json.dumps(e, ensure_ascii=False) + "\n"
+            for e in self._iter_entries()
+            if e.get("seq", 0) > keep_after
+        ]
+        self._write_atomic(self.path, "".join(kept))
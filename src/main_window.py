@@ -1,21 +1,27 @@
 import sys
 import os
+import html
+from datetime import datetime
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFileDialog, QListWidget, QListWidgetItem,
     QStackedWidget, QProgressBar, QCheckBox,
-    QComboBox, QSlider, QFormLayout, QScrollArea
+    QComboBox, QSlider, QFormLayout, QScrollArea, QLineEdit, QListView
 )
-from PySide6.QtCore import Qt, QTimer, QUrl, QSize
+from PySide6.QtCore import Qt, QTimer, QUrl, QSize, QObject, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWebEngineWidgets import QWebEngineView
 
 import qtawesome as qta
 from qt_material import apply_stylesheet
 
-from ipc import send_command, read_status, read_command, clear_command
+from ipc import send_command, read_events, read_commands, read_queue_state, use_channel
+from ipc_channel import ChannelClient
+from progress_shm import ProgressReader
+from findings_db import FindingsDB, FindingsSearcher, SEARCH_LIMIT
+from reports_model import ReportListModel, ReportItemDelegate
 from config import load_config, save_config, APP_META
 from PySide6.QtGui import QPalette
 
@@ -27,6 +33,25 @@ def apply_theme(app, theme: str):
         apply_stylesheet(app, theme="dark_teal.xml")
 
 
+# ==================================================
+# IPC channel → Qt main thread
+# ==================================================
+class ChannelBridge(QObject):
+    """
+    ChannelClient reader thread'inden gelen mesajları
+    queued signal ile Qt main thread'ine taşır.
+    """
+    message = Signal(str, object)
+    disconnected = Signal()
+
+
+class SearchBridge(QObject):
+    """
+    FindingsSearcher worker thread'inin sonuçlarını Qt main thread'ine taşır.
+    """
+    results = Signal(int, str, object, float)
+
+
 UI = {
     "radius_sm": "10px",
     "radius_md": "14px",
@@ -66,13 +91,17 @@ class MainWindow(QMainWindow):
         # --------------------------------------------------
         self.project_path = None
         self._last_status_hash = None
+        self._last_live_hash = None
         # UI tokens (instance scope)
         self.UI = UI
 
         # Toast system
         self._toast_queue = []
         self._toast_active = False
-        self._scan_history = self.cfg.get("scan_history", [])
+
+        # Scan geçmişi SQLite'tan (findings_db); eski config listesi fallback
+        self._db = FindingsDB()
+        self._scan_history = self._load_scan_history() or self.cfg.get("scan_history", [])
         self._top_risky_files = []
 
     
@@ -236,6 +265,27 @@ class MainWindow(QMainWindow):
         self.cmd_timer.timeout.connect(self.poll_commands)
         self.cmd_timer.start(500)
 
+        # Canlı sayaçlar (shared-memory progress bloğu) — sadece scan sürerken
+        self._progress_reader = ProgressReader()
+        self._progress_generation = None
+        self.progress_timer = QTimer(self)
+        self.progress_timer.timeout.connect(self.poll_progress)
+
+        # --------------------------------------------------
+        # IPC Channel (push) — polling timer'ları çalışmaya devam eder:
+        # kanala bağlı olmayan yazarlar (CLI, daemon) sadece dosyaya yazar
+        # --------------------------------------------------
+        self._channel = None
+        self._bridge = ChannelBridge(self)
+        self._bridge.message.connect(self.on_channel_message)
+        self._bridge.disconnected.connect(self.on_channel_lost)
+
+        # Menubar broker'ı bizden sonra başlayabilir → periyodik deneme
+        self.channel_timer = QTimer(self)
+        self.channel_timer.timeout.connect(self.connect_channel)
+        self.channel_timer.start(2000)
+        self.connect_channel()
+
         self.load_reports()
 
     def apply_sidebar_style(self):
@@ -690,6 +740,17 @@ class MainWindow(QMainWindow):
 
 
         hl.addWidget(self.lbl_history)
+
+        hl.addWidget(QLabel("<b>Risky Files · Last 30 Scans</b>"))
+        self.lbl_file_trend = QLabel("No scan history.")
+        self.lbl_file_trend.setStyleSheet("color:#9ca3af; font-size:12px;")
+        hl.addWidget(self.lbl_file_trend)
+
+        hl.addWidget(QLabel("<b>Since Previous Scan</b>"))
+        self.lbl_delta = QLabel(self._load_last_delta())
+        self.lbl_delta.setStyleSheet("color:#9ca3af; font-size:12px;")
+        hl.addWidget(self.lbl_delta)
+
         l.addWidget(history)
         # --------------------------------------------------
         # Top 5 Risky Files
@@ -915,6 +976,12 @@ class MainWindow(QMainWindow):
         self.progress.hide()
         l.addWidget(self.progress)
 
+        # Scheduler kuyruğu (tüm projeler)
+        self.lbl_queue = QLabel("")
+        self.lbl_queue.setStyleSheet("color:#6b7280; font-size:12px;")
+        self.lbl_queue.hide()
+        l.addWidget(self.lbl_queue)
+
         self.btn_cancel = QPushButton("Cancel Scan")
         self.btn_cancel.setEnabled(False)
         self.btn_cancel.setStyleSheet("""
@@ -979,31 +1046,68 @@ class MainWindow(QMainWindow):
         ll.addWidget(title)
         ll.addWidget(subtitle)
 
-        self.reports_list = QListWidget()
-        self.reports_list.setSpacing(8)
-        pal = QApplication.palette()
-        bg = pal.color(QPalette.Base).name()
-        border = pal.color(QPalette.Mid).name()
-
-        self.reports_list.setStyleSheet(f"""
-            QListWidget {{
+        # --------------------------------------------------
+        # Search (tüm scan geçmişi, findings_db FTS)
+        # --------------------------------------------------
+        self._searcher = None
+        self._search_generation = 0
+
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search findings (title, detail, path)…")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.setStyleSheet(
+            f"padding:8px; border-radius:{self.UI['radius_sm']};"
+        )
+        ll.addWidget(self.search_box)
+
+        self.lbl_search = QLabel("")
+        self.lbl_search.setStyleSheet("color:#94a3b8; font-size:11px;")
+        self.lbl_search.hide()
+        ll.addWidget(self.lbl_search)
+
+        self.search_results = QListWidget()
+        self.search_results.setWordWrap(True)
+        self.search_results.itemClicked.connect(self.open_search_result)
+        self.search_results.hide()
+        ll.addWidget(self.search_results)
+
+        if self.cfg.get("reports", {}).get("enable_search", True):
+            self._search_bridge = SearchBridge(self)
+            self._search_bridge.results.connect(self.show_search_results)
+            self._searcher = FindingsSearcher(self._search_bridge.results.emit)
+
+            # Her tuşta değil, yazım durunca sorgu (eskisi zaten iptal edilir)
+            self.search_timer = QTimer(self)
+            self.search_timer.setSingleShot(True)
+            self.search_timer.timeout.connect(self.run_search)
+            self.search_box.textChanged.connect(lambda _: self.search_timer.start(120))
+        else:
+            self.search_box.hide()
+
+        # Model + delegate: satır başına widget yok, satırlar parça parça açılır
+        self.reports_model = ReportListModel(self.reports_dir, self)
+        self.reports_list = QListView()
+        self.reports_list.setModel(self.reports_model)
+        self.reports_list.setItemDelegate(ReportItemDelegate(self.reports_list))
+        self.reports_list.setUniformItemSizes(True)
+        self.reports_list.setSpacing(4)
+        self.reports_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.reports_list.setStyleSheet("""
+            QListView {
                 background: transparent;
                 border: none;
-            }}
-            QListWidget::item {{
-                background: {bg};
-                border-radius: {self.UI["radius_md"]};
-                padding: 12px;
-                border: 1px solid {border};
-            }}
-            QListWidget::item:selected {{
-                background: {pal.color(QPalette.Highlight).name()};
-                color: white;
-            }}
+            }
         """)
-        self.reports_list.itemClicked.connect(self.open_report)
+        self.reports_list.clicked.connect(self.open_report)
 
         ll.addWidget(self.reports_list)
+
+        ll.addWidget(QLabel("<b>Risky files · last 30 scans</b>"))
+        self.lbl_reports_trend = QLabel("Select a project to see its history.")
+        self.lbl_reports_trend.setWordWrap(True)
+        self.lbl_reports_trend.setStyleSheet("color:#94a3b8; font-size:11px;")
+        ll.addWidget(self.lbl_reports_trend)
+
         wrapper.addWidget(left)
 
         # ==================================================
@@ -1157,6 +1261,16 @@ class MainWindow(QMainWindow):
 
         sl.addWidget(risk_desc)
 
+        self.chk_watch = QCheckBox("Live watch mode")
+        self.chk_watch.setChecked(self.cfg.get("watch_project", False))
+        sl.addWidget(self.chk_watch)
+
+        watch_desc = QLabel("Rescan changed files automatically and keep dashboard counts live.")
+        watch_desc.setStyleSheet(
+            f"color:{pal.color(QPalette.Text).name()}; font-size:12px;"
+        )
+        sl.addWidget(watch_desc)
+
         content_layout.addWidget(scan)
 
         # ---------------- Ignore Rules ----------------
@@ -1203,6 +1317,7 @@ class MainWindow(QMainWindow):
         self.slider_risk.valueChanged.connect(self.save_settings)
         self.chk_env.stateChanged.connect(self.save_settings)
         self.chk_node.stateChanged.connect(self.save_settings)
+        self.chk_watch.stateChanged.connect(self.save_settings)
 
     def refresh_theme(self):
         pal = QApplication.palette()
@@ -1241,7 +1356,7 @@ class MainWindow(QMainWindow):
             self.report_view.setStyleSheet(f"background:{card_bg};")
 
         if hasattr(self, "reports_list"):
-            self.reports_list.update()
+            self.reports_list.viewport().update()
 
 
 
@@ -1275,6 +1390,7 @@ class MainWindow(QMainWindow):
         if p:
             self.project_path = p
             self.scan_status.setText(p)
+            self.refresh_risk_trend(p)
         if hasattr(self, "lbl_project"):
             self.lbl_project.setText(p)
 
@@ -1288,6 +1404,7 @@ class MainWindow(QMainWindow):
         self.progress.setValue(10)
         self.scan_status.setText("Scanning…")
         self.show_toast("Scan started…", type="info")
+        self.start_progress_polling()
         self.btn_cancel.setEnabled(True)
 
         # Sidebar status → Scanning
@@ -1307,6 +1424,7 @@ class MainWindow(QMainWindow):
 
     def cancel_scan(self):
         send_command({"action": "cancel_scan"})
+        self.progress_timer.stop()
 
         self.progress.setValue(0)
         self.progress.hide()
@@ -1349,6 +1467,7 @@ class MainWindow(QMainWindow):
     def save_settings(self):
         old_theme = self.cfg.get("theme", "dark")
         new_theme = self.cmb_theme.currentText()
+        old_watch = self.cfg.get("watch_project", False)
 
         self.cfg.update({
             "default_mode": self.cmb_mode.currentText(),
@@ -1357,10 +1476,15 @@ class MainWindow(QMainWindow):
             "ignore_node_modules": self.chk_node.isChecked(),
             "theme": new_theme,
             "enable_notifications": self.chk_notify.isChecked(),
+            "watch_project": self.chk_watch.isChecked(),
         })
 
         save_config(self.cfg)
 
+        # Menubar watcher'ı yeni ayarla yeniden başlatsın
+        if self.cfg["watch_project"] != old_watch:
+            send_command({"action": "reload_watch"})
+
         if new_theme != old_theme:
             self.theme = new_theme
             self.UI = UI
@@ -1375,82 +1499,138 @@ class MainWindow(QMainWindow):
     # Reports
     # ==================================================
     def load_reports(self):
-        self.reports_list.clear()
+        self.reports_model.refresh()
+
 
-        if not os.path.isdir(self.reports_dir):
+    def open_report(self, index):
+        filename = index.data(ReportListModel.FileRole)
+        path = os.path.join(self.reports_dir, filename)
+        self.report_view.setUrl(QUrl.fromLocalFile(path))
+
+    # ==================================================
+    # Search
+    # ==================================================
+    def run_search(self):
+        text = self.search_box.text().strip()
+
+        if not text:
+            self._search_generation += 1   # uçuştaki sonuç gösterilmesin
+            self.search_results.hide()
+            self.lbl_search.hide()
+            self.reports_list.show()
             return
 
-        base_dir = os.path.dirname(__file__)
-        icon_dir = os.path.join(base_dir, "..", "assets", "icons")
+        self._search_generation = self._searcher.submit(text)
 
-        for f in sorted(os.listdir(self.reports_dir), reverse=True):
-            if not f.endswith(".html"):
-                continue
+    def show_search_results(self, generation: int, text: str, rows: list, elapsed: float):
+        # Kullanıcı bu arada yazmaya devam ettiyse eski sonuç atılır
+        if generation != self._search_generation:
+            return
 
-            # filename örnek: 2026-01-15_myproject_prod.html
-            parts = f.replace(".html", "").split("_")
+        self.search_results.clear()
+        for r in rows:
+            name = os.path.relpath(r["path"], r["project"]) if r["path"].startswith(r["project"]) else r["path"]
+            when = datetime.fromtimestamp(r["finished_at"]).strftime("%Y-%m-%d %H:%M")
 
-            date = parts[0] if len(parts) > 0 else "Unknown date"
-            project = parts[1] if len(parts) > 1 else "Unknown project"
-            mode = parts[2].upper() if len(parts) > 2 else "SCAN"
+            item = QListWidgetItem(
+                f"[{r['severity']}] {r['title']}\n"
+                f"{name}:{r['line'] or '-'}  ·  {os.path.basename(r['project'])} · {when}"
+            )
+            item.setData(Qt.UserRole, r)
+            self.search_results.addItem(item)
+
+        more = "+" if len(rows) >= SEARCH_LIMIT else ""
+        self.lbl_search.setText(f"{len(rows)}{more} results · {elapsed:.0f} ms")
+        self.lbl_search.show()
+        self.reports_list.hide()
+        self.search_results.show()
+
+    def open_search_result(self, item):
+        r = item.data(Qt.UserRole)
+        e = lambda v: html.escape(str(v or ""))
+
+        when = datetime.fromtimestamp(r["finished_at"]).strftime("%Y-%m-%d %H:%M")
+        self.report_view.setHtml(f"""
+            <html><body style="font-family:sans-serif;padding:24px">
+            <h2>{e(r['title'])}</h2>
+            <p><b>{e(r['kind'])} · {e(r['severity'])}</b> · rule: {e(r['rule'])}</p>
+            <p><code>{e(r['path'])}:{e(r['line'])}</code></p>
+            <pre style="white-space:pre-wrap">{e(r['detail'])}</pre>
+            <p>{e(r['explanation'])}</p>
+            <p><i>{e(r['recommendation'])}</i></p>
+            <p style="color:#94a3b8">Last seen: {e(r['mode']).upper()} scan · {when}</p>
+            </body></html>
+        """)
 
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(320, 74))
-            item.setData(Qt.UserRole, f)
 
-            widget = QWidget()
-            v = QVBoxLayout(widget)
-            v.setContentsMargins(8, 6, 8, 6)
-            v.setSpacing(4)
+    # ==================================================
+    # IPC
+    # ==================================================
+    def connect_channel(self):
+        if self._channel is not None and self._channel.connected:
+            return
 
-            # ---- Title row
-            t = QHBoxLayout()
-            icon = QLabel()
-            icon.setPixmap(QIcon(os.path.join(icon_dir, "report.svg")).pixmap(18, 18))
-            t.addWidget(icon)
+        client = ChannelClient(
+            topics=["status", "command", "queue"],
+            on_message=self._bridge.message.emit,
+            on_disconnect=self._bridge.disconnected.emit,
+        )
+        if not client.connect():
+            return
 
-            t.addWidget(QLabel(f"<b>{project}</b>"))
-            t.addStretch()
-            t.addWidget(QLabel(f"<span style='color:#60a5fa'>{mode}</span>"))
-            v.addLayout(t)
+        self._channel = client
+        use_channel(client)
+        self.channel_timer.stop()
 
-            # ---- Meta row
-            meta = QHBoxLayout()
+    def on_channel_lost(self):
+        # Broker'ı tekrar dene (dosya polling zaten çalışıyor)
+        self._channel = None
+        use_channel(None)
+        self.channel_timer.start(2000)
 
-            clock = QLabel()
-            clock.setPixmap(QIcon(os.path.join(icon_dir, "clock.svg")).pixmap(14, 14))
-            meta.addWidget(clock)
-            meta.addWidget(QLabel(f"<span style='color:#94a3b8;font-size:11px'>{date}</span>"))
+    def on_channel_message(self, topic: str, msg: dict):
+        if topic == "status":
+            self.handle_status(msg)
+        elif topic == "command":
+            self.handle_command(msg)
+        elif topic == "queue":
+            self.handle_queue(msg)
 
-            meta.addSpacing(10)
+    def poll_status(self):
+        # Progress / done event'leri atlanmadan sırayla
+        for st in read_events("window"):
+            self.handle_status(st)
 
-            folder = QLabel()
-            folder.setPixmap(QIcon(os.path.join(icon_dir, "folder.svg")).pixmap(14, 14))
-            meta.addWidget(folder)
-            meta.addWidget(QLabel("<span style='color:#94a3b8;font-size:11px'>Project root</span>"))
+        queue = read_queue_state()
+        if queue:
+            self.handle_queue(queue)
 
-            meta.addStretch()
-            v.addLayout(meta)
+    def handle_queue(self, q: dict):
+        running = q.get("running", [])
+        queued = q.get("queued", [])
 
-            self.reports_list.addItem(item)
-            self.reports_list.setItemWidget(item, widget)
+        if not running and not queued:
+            self.lbl_queue.hide()
+            return
 
+        def name(job):
+            return os.path.basename(job.get("project", "").rstrip(os.sep))
 
-    def open_report(self, item):
-        filename = item.data(Qt.UserRole)
-        path = os.path.join(self.reports_dir, filename)
-        self.report_view.setUrl(QUrl.fromLocalFile(path))
+        parts = [f"▶ {name(j)} ({j.get('mode', '').upper()})" for j in running]
+        if queued:
+            parts.append(
+                f"{len(queued)} queued: "
+                + ", ".join(f"{name(j)} · {j.get('trigger')}" for j in queued[:3])
+                + ("…" if len(queued) > 3 else "")
+            )
 
+        self.lbl_queue.setText("   ".join(parts))
+        self.lbl_queue.show()
 
-    # ==================================================
-    # IPC
-    # ==================================================
-    def poll_status(self):
-        st = read_status()
-        if not st:
-            return
+    def handle_status(self, st: dict):
         # ❌ Scan error
         if st.get("type") == "error" or st.get("error"):
+            self.progress_timer.stop()
             self.progress.hide()
             self.progress.setValue(0)
             self.scan_status.setText("Scan failed.")
@@ -1471,10 +1651,17 @@ class MainWindow(QMainWindow):
             return
 
 
+        # Live summary (watch mode)
+        if st.get("type") == "live":
+            self.apply_live_summary(st)
+            return
+
         # Progress update
         if st.get("type") == "progress":
             self.progress.show()
             self.progress.setValue(st.get("percent", 0))
+            if not self.progress_timer.isActive():
+                self.start_progress_polling(current=True)
             return
 
         key = f"{st.get('finished_at')}|{st.get('last_risks')}|{st.get('last_todos')}|{st.get('mode')}"
@@ -1482,21 +1669,26 @@ class MainWindow(QMainWindow):
             return
 
         self._last_status_hash = key
+        self.progress_timer.stop()
         self.progress.setValue(100)
 
         # ===============================
-        # 📜 AŞAMA 2.3 — SAVE SCAN HISTORY
+        # 📜 AŞAMA 2.3 — SCAN HISTORY
         # ===============================
-        self._scan_history.insert(0, {
-            "mode": st["mode"].upper(),
-            "risks": st["last_risks"],
-            "date": st.get("finished_at", "")
-        })
+        # Kaydedilen scan'ler findings_db'de; config'e yazılmaz
+        if st.get("scan_id") is not None:
+            self._scan_history = self._load_scan_history()
+            self.refresh_risk_trend(st.get("project"))
+        else:
+            self._scan_history.insert(0, {
+                "mode": st["mode"].upper(),
+                "risks": st["last_risks"],
+                "date": st.get("finished_at", "")
+            })
+            self._scan_history = self._scan_history[:5]
 
-        # sadece son 5 scan kalsın
-        self._scan_history = self._scan_history[:5]
-        self.cfg["scan_history"] = self._scan_history
-        save_config(self.cfg)
+        if st.get("delta") is not None and hasattr(self, "lbl_delta"):
+            self.lbl_delta.setText(self._delta_text(st["delta"]))
 
         history_text = "\n".join(
             f"• {h['date']} | {h['mode']} | {h['risks']} risks"
@@ -1525,28 +1717,7 @@ class MainWindow(QMainWindow):
         # -------------------------------
         # Risk Summary Bars (Dashboard)
         # -------------------------------
-        summary = st.get("risk_summary", {}) or {}
-
-        crit = int(summary.get("CRITICAL", 0))
-        high = int(summary.get("HIGH", 0))
-        med  = int(summary.get("MEDIUM", 0))
-
-        max_val = max(crit, high, med, 1)
-
-        # scale
-        self.bar_critical.setMaximum(max_val)
-        self.bar_high.setMaximum(max_val)
-        self.bar_medium.setMaximum(max_val)
-
-        # values
-        self.bar_critical.setValue(crit)
-        self.bar_high.setValue(high)
-        self.bar_medium.setValue(med)
-
-        # labels
-        self.val_critical.setText(str(crit))
-        self.val_high.setText(str(high))
-        self.val_medium.setText(str(med))
+        self.update_risk_bars(st.get("risk_summary", {}) or {})
 
         # ---- Top risky files (if provided)
         files = st.get("top_risky_files", [])
@@ -1691,17 +1862,140 @@ class MainWindow(QMainWindow):
         self.load_reports()
  
 
-    def poll_commands(self):
-        cmd = read_command()
-        if not cmd:
+    def _load_scan_history(self) -> list[dict]:
+        try:
+            scans = self._db.recent_scans(limit=5)
+        except Exception:
+            return []
+        return [
+            {
+                "mode": s["mode"].upper(),
+                "risks": s["risks"],
+                "date": datetime.fromtimestamp(s["finished_at"]).strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            for s in scans
+        ]
+
+    def _load_last_delta(self) -> str:
+        # Açılışta: en son kayıtlı scan'in bir öncekine göre farkı (kayıtlı bulgulardan)
+        try:
+            scans = self._db.recent_scans(limit=1)
+            if not scans:
+                return "No scan history."
+            return self._delta_text(self._db.scan_delta(scans[0]["id"]).counts())
+        except Exception:
+            return "No scan history."
+
+    @staticmethod
+    def _delta_text(d: dict) -> str:
+        if d.get("base_scan_id") is None:
+            return "First recorded scan — nothing to compare yet."
+        return (
+            f"• {d['new']} new ({d['new_risks']} risks)\n"
+            f"• {d['fixed']} fixed ({d['fixed_risks']} risks)\n"
+            f"• {d['persisting']} persisting"
+        )
+
+    def refresh_risk_trend(self, project: str | None = None):
+        project = project or self.project_path
+        if not project:
+            return
+
+        try:
+            rows = self._db.risks_by_file(project, last_scans=30, limit=5)
+        except Exception:
+            return
+
+        if rows:
+            text = "\n".join(
+                f"• {os.path.basename(r['path'])} — {r['risks']} risks "
+                f"({r['critical']} critical) in {r['scans']} scans"
+                for r in rows
+            )
+        else:
+            text = "✔ No risks recorded."
+
+        self.lbl_file_trend.setText(text)
+        self.lbl_reports_trend.setText(text)
+
+    def update_risk_bars(self, summary: dict):
+        crit = int(summary.get("CRITICAL", 0))
+        high = int(summary.get("HIGH", 0))
+        med  = int(summary.get("MEDIUM", 0))
+
+        max_val = max(crit, high, med, 1)
+
+        # scale
+        self.bar_critical.setMaximum(max_val)
+        self.bar_high.setMaximum(max_val)
+        self.bar_medium.setMaximum(max_val)
+
+        # values
+        self.bar_critical.setValue(crit)
+        self.bar_high.setValue(high)
+        self.bar_medium.setValue(med)
+
+        # labels
+        self.val_critical.setText(str(crit))
+        self.val_high.setText(str(high))
+        self.val_medium.setText(str(med))
+
+    def apply_live_summary(self, st: dict):
+        """
+        Watch mode özetleri: sadece sayaçlar güncellenir,
+        history / toast / rapor listesi tetiklenmez.
+        """
+        key = f"{st.get('finished_at')}|{st.get('last_risks')}|{st.get('last_todos')}"
+        if key == self._last_live_hash:
             return
+        self._last_live_hash = key
 
-        if cmd.get("action") == "focus":
+        self.lbl_risk.setText(str(st.get("last_risks", 0)))
+        self.lbl_todo.setText(str(st.get("last_todos", 0)))
+        self.update_risk_bars(st.get("risk_summary", {}) or {})
+
+        self.lbl_dash.setText(
+            f"● Live ({st.get('mode', '').upper()}) · updated {st.get('finished_at', '')}"
+        )
+
+    def start_progress_polling(self, current: bool = False):
+        """
+        current=False: bloktaki mevcut (önceki) scan atlanır, yenisi beklenir.
+        """
+        snap = self._progress_reader.read()
+        self._progress_generation = (
+            None if current or snap is None else snap["generation"]
+        )
+        self.progress_timer.start(100)
+
+    def poll_progress(self):
+        snap = self._progress_reader.read()
+        if not snap or snap["generation"] == self._progress_generation:
+            return
+
+        if snap["phase"] in ("done", "idle"):
+            self.progress_timer.stop()
+            return
+
+        found = snap["findings"]
+        self.progress.show()
+        self.progress.setValue(max(self.progress.value(), snap["percent"]))
+        self.scan_status.setText(
+            f"Scanning… {snap['files_done']}/{snap['total_files']} files · "
+            f"{found['CRITICAL']} critical · {found['HIGH']} high · "
+            f"{snap['todos']} todos"
+        )
+
+    def poll_commands(self):
+        for cmd in read_commands("window"):
+            self.handle_command(cmd)
+
+    def handle_command(self, cmd: dict):
+        if cmd.get("action") in ("focus", "show_window"):
+            self.showNormal()
             self.raise_()
             self.activateWindow()
 
-        clear_command()
-
 
 # ==================================================
 # Toast Notification
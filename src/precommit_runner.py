@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
+import argparse
 import sys
 import os
 from pathlib import Path
 
 from scanner import scan_project, SCAN_PROD
 from git_changed import get_changed_files
-from report_html import write_html_report
+from report_formats import REPORT_FORMATS
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="precommit_runner")
+    parser.add_argument("--format", choices=sorted(REPORT_FORMATS), default="html")
+    args = parser.parse_args(argv)
+
     repo_root = Path.cwd()
 
     changed = get_changed_files(str(repo_root))
@@ -16,21 +21,26 @@ def main() -> int:
         print("✔ No changed files. Commit allowed.")
         return 0
 
+    stats = {}
     findings = scan_project(
         str(repo_root),
         mode=SCAN_PROD,
         only_files=changed,
+        stats=stats,
     )
 
     risks = [f for f in findings if f.kind == "RISK"]
 
-    report = write_html_report(findings, str(repo_root), out_dir="reports")
+    report = REPORT_FORMATS[args.format](
+        findings, str(repo_root), out_dir="reports", mode=SCAN_PROD, **stats
+    )
 
     if risks:
         print("\n🚨 COMMIT BLOCKED — Security Risks Found")
         print(f"→ Risks: {len(risks)}")
         print(f"→ Report: {report}\n")
-        os.system(f"open '{report}'")
+        if args.format == "html":
+            os.system(f"open '{report}'")
         return 1
 
     print("✔ Scan clean. Commit allowed.")
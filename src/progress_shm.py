@@ -0,0 +1,314 @@
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict
+
+from ipc import STATE_DIR
+
+# mmap'lenen dosya: status.json'dan farklı olarak JSON / rewrite yok,
+# okuyan taraf istediği sıklıkta sabit offset'lerden sayaç okur.
+PROGRESS_FILE = os.path.join(STATE_DIR, "progress.bin")
+
+MAX_WORKERS = 16
+
+PHASE_IDLE = 0
+PHASE_LISTING = 1
+PHASE_ROOT_CHECKS = 2
+PHASE_SCANNING = 3
+PHASE_SORTING = 4
+PHASE_DONE = 5
+
+PHASE_NAMES = {
+    PHASE_IDLE: "idle",
+    PHASE_LISTING: "listing",
+    PHASE_ROOT_CHECKS: "root_checks",
+    PHASE_SCANNING: "scanning",
+    PHASE_SORTING: "sorting",
+    PHASE_DONE: "done",
+}
+
+SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+
+_MAGIC = b"ZKPG"
+_VERSION = 1
+
+# --------------------------------------------------
+# Layout (little-endian, sabit boyut)
+# --------------------------------------------------
+# header: seq, magic, version, slots, generation, total_files,
+#         started_at, phase, mode
+# slot:   seq, files_done, bytes_done, CRITICAL, HIGH, MEDIUM, LOW, TODO
+#
+# Her bölgenin tek bir yazarı vardır (header → scan'i başlatan,
+# slot[i] → i. worker). seq yazım sırasında tektir (seqlock);
+# okuyan seq'i başta ve sonda aynı ve çift görene kadar tekrar okur.
+# Blok aynı anda tek scan'indir: yazan taraf önce claim() ile dosyayı
+# (flock) ayırır; CLI, menubar ve scheduler worker'ları aynı anda yazmaz.
+_HEADER = struct.Struct("<Q4sHHQQdB7x16s")
+_SLOT = struct.Struct("<8Q")
+_SEQ = struct.Struct("<Q")
+
+_SIZE = _HEADER.size + MAX_WORKERS * _SLOT.size
+_READ_RETRIES = 100
+
+
+def _slot_offset(index: int) -> int:
+    return _HEADER.size + index * _SLOT.size
+
+
+def _read_consistent(buf, offset: int, st: struct.Struct) -> tuple | None:
+    for _ in range(_READ_RETRIES):
+        (seq1,) = _SEQ.unpack_from(buf, offset)
+        if seq1 & 1:
+            time.sleep(0)  # yazar ortada; CPU'yu bırak
+            continue
+        values = st.unpack_from(buf, offset)
+        (seq2,) = _SEQ.unpack_from(buf, offset)
+        if seq1 == seq2 and values[0] == seq1:
+            return values
+    return None
+
+
+def _write_seqlocked(buf, offset: int, st: struct.Struct, seq: int, *values) -> int:
+    """
+    seq: bölgenin mevcut (çift) seq'i. Yeni seq'i döner.
+    """
+    # pack_into hedefi önce sıfırladığından okuyan "tutarlı" sıfırlar görebilir;
+    # bu yüzden kayıt ayrı pack'lenir ve seq alanı hariç kopyalanır.
+    n = _SEQ.size
+    buf[offset:offset + n] = _SEQ.pack(seq + 1)
+    buf[offset + n:offset + st.size] = st.pack(seq + 1, *values)[n:]
+    buf[offset:offset + n] = _SEQ.pack(seq + 2)
+    return seq + 2
+
+
+# --------------------------------------------------
+# Writer
+# --------------------------------------------------
+class ProgressSlot:
+    """
+    Tek bir worker'ın sayaçları. Lock yok: slot'a sadece bu worker yazar.
+    """
+
+    def __init__(self, block: ProgressBlock, index: int):
+        self._buf = block._buf
+        self._offset = _slot_offset(index)
+        # Başka bir yazarın bıraktığı seq'ten devam (aynı seq tekrar kullanılmasın)
+        self._seq = (_SEQ.unpack_from(self._buf, self._offset)[0] + 1) & ~1
+
+        self.files_done = 0
+        self.bytes_done = 0
+        self.findings = {s: 0 for s in SEVERITIES}
+        self.todos = 0
+
+    def add(self, files: int = 0, bytes_: int = 0, findings=()):
+        self.files_done += files
+        self.bytes_done += bytes_
+        for f in findings:
+            if f.kind == "TODO":
+                self.todos += 1
+            elif f.kind == "RISK" and f.severity in self.findings:
+                self.findings[f.severity] += 1
+        self._flush()
+
+    def _flush(self):
+        self._seq = _write_seqlocked(
+            self._buf, self._offset, _SLOT, self._seq,
+            self.files_done,
+            self.bytes_done,
+            *(self.findings[s] for s in SEVERITIES),
+            self.todos,
+        )
+
+
+class ProgressBlock:
+    """
+    Scan'i yürüten process tarafı. claim() ile blok ayrılır, begin() sayaçları
+    sıfırlar ve her worker için bir ProgressSlot döner; worker'lar sadece
+    kendi slot'una yazar. release() bloğu sonraki scan'e bırakır.
+    """
+
+    def __init__(self, path: str = PROGRESS_FILE):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # fd claim (flock) için açık kalır
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < _SIZE:
+            os.ftruncate(self._fd, _SIZE)
+        self._buf = mmap.mmap(self._fd, _SIZE, access=mmap.ACCESS_WRITE)
+        # flock process başınadır; aynı process'in thread'leri için ayrıca
+        self._claim_lock = threading.Lock()
+
+        self._seq = 0
+        self._generation = 0
+        self._total = 0
+        self._started = 0.0
+        self._phase = PHASE_IDLE
+        self._mode = b""
+        self._sync()
+
+    def _sync(self):
+        """
+        Header seq / generation bloktan okunur: başka process bu instance
+        açıldıktan sonra yazmış olabilir (generation geri gitmez).
+        """
+        # Yarıda kalmış yazımdan (tek seq) sonra çift sayıdan devam
+        self._seq = (_SEQ.unpack_from(self._buf, 0)[0] + 1) & ~1
+
+        header = _read_consistent(self._buf, 0, _HEADER)
+        if header and header[1] == _MAGIC:
+            self._generation = max(self._generation, header[4])
+
+    def claim(self) -> bool:
+        """
+        Bloğu bu scan için ayırır. Başka bir scan (bu veya başka process'te)
+        tutuyorsa False: o scan canlı sayaç yazmaz. Process kapanınca flock
+        kendiliğinden düşer, yarıda kalan scan bloğu kilitli bırakmaz.
+        """
+        if not self._claim_lock.acquire(blocking=False):
+            return False
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            self._claim_lock.release()
+            return False
+        return True
+
+    def release(self):
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._claim_lock.release()
+
+    def begin(self, mode: str, total_files: int = 0, workers: int = 1) -> list[ProgressSlot]:
+        """
+        Yeni scan (claim() sonrası): generation artar, slot'lar sıfırlanır.
+        """
+        self._sync()
+
+        # Önceki scan'in (daha fazla worker'lı olabilir) sayaçları da sıfırlanır
+        slots = [ProgressSlot(self, i) for i in range(MAX_WORKERS)]
+        for slot in slots:
+            slot._flush()
+
+        self._generation += 1
+        self._total = total_files
+        self._started = time.time()
+        self._mode = mode.encode("utf-8")[:16]
+        self._phase = PHASE_LISTING
+        self._flush()
+        return slots[:max(1, min(workers, MAX_WORKERS))]
+
+    def slot(self, index: int) -> ProgressSlot:
+        """
+        Ayrı process'teki worker için: bloğu kendisi açar ve slot(i)'ye bağlanır.
+        Sayaçlar begin()'in sıfırladığı değerden başlar.
+        """
+        return ProgressSlot(self, index)
+
+    def set_total(self, total_files: int):
+        self._total = total_files
+        self._flush()
+
+    def set_phase(self, phase: int):
+        self._phase = phase
+        self._flush()
+
+    def close(self):
+        self._buf.close()
+        os.close(self._fd)
+
+    def _flush(self):
+        self._seq = _write_seqlocked(
+            self._buf, 0, _HEADER, self._seq,
+            _MAGIC, _VERSION, MAX_WORKERS,
+            self._generation,
+            self._total,
+            self._started,
+            self._phase,
+            self._mode,
+        )
+
+
+# --------------------------------------------------
+# Reader (UI / menubar)
+# --------------------------------------------------
+class ProgressReader:
+    """
+    Salt okunur görünüm; read() disk I/O veya JSON parse yapmaz.
+    """
+
+    def __init__(self, path: str = PROGRESS_FILE):
+        self.path = path
+        self._buf: mmap.mmap | None = None
+        # Yazımı süren slot okunamazsa son tutarlı değeri kullanılır (sayaç geri gitmez)
+        self._generation = None
+        self._last_slots: dict[int, tuple] = {}
+
+    def _map(self) -> bool:
+        if self._buf is not None:
+            return True
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            if os.fstat(fd).st_size < _SIZE:
+                return False
+            self._buf = mmap.mmap(fd, _SIZE, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        return True
+
+    def read(self) -> Dict[str, Any] | None:
+        if not self._map():
+            return None
+
+        header = _read_consistent(self._buf, 0, _HEADER)
+        if header is None or header[1] != _MAGIC or header[2] != _VERSION:
+            return None
+        _, _, _, slots, generation, total, started, phase, mode = header
+
+        if generation != self._generation:
+            self._generation = generation
+            self._last_slots = {}
+
+        files_done = 0
+        bytes_done = 0
+        findings = {s: 0 for s in SEVERITIES}
+        todos = 0
+        for i in range(min(slots, MAX_WORKERS)):
+            values = _read_consistent(self._buf, _slot_offset(i), _SLOT)
+            if values is None:
+                values = self._last_slots.get(i)
+                if values is None:
+                    continue
+            else:
+                self._last_slots[i] = values
+            files_done += values[1]
+            bytes_done += values[2]
+            for s, n in zip(SEVERITIES, values[3:7]):
+                findings[s] += n
+            todos += values[7]
+
+        percent = int(files_done * 100 / total) if total else 0
+
+        return {
+            "generation": generation,
+            "phase": PHASE_NAMES.get(phase, "idle"),
+            "mode": mode.rstrip(b"\0").decode("utf-8", "ignore"),
+            "total_files": total,
+            "files_done": files_done,
+            "bytes_done": bytes_done,
+            "percent": min(percent, 100),
+            "findings": findings,
+            "todos": todos,
+            "started_at": started,
+        }
+
+    def close(self):
+        if self._buf is not None:
+            self._buf.close()
+            self._buf = None
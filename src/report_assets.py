@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+
+ASSET_DIR = os.path.join(os.path.dirname(__file__), "..", "assets", "report")
+
+CDN_CSS = (
+    '<link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/css/bootstrap.min.css"'
+    ' rel="stylesheet">'
+)
+CDN_JS = (
+    '<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.2/dist/js/bootstrap.bundle.min.js">'
+    "</script>"
+)
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")
+_JS_LINE_COMMENT = re.compile(r"^\s*//.*$", re.M)
+
+
+def _read(name: str) -> str:
+    with open(os.path.join(ASSET_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _minify_css(text: str) -> str:
+    text = _CSS_COMMENT.sub("", text)
+    text = _CSS_SPACE.sub(" ", text)
+    # ":" dokunulmaz: "a:hover" / ".x :not()" seçicilerinde boşluk anlamlı
+    text = _CSS_PUNCT.sub(r"\1", text)
+    return text.replace(";}", "}").strip()
+
+
+def _minify_js(text: str) -> str:
+    # Güvenli alt küme: tam satır yorumlar, girinti ve boş satırlar
+    text = _JS_LINE_COMMENT.sub("", text)
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+@lru_cache(maxsize=None)
+def asset_blocks(offline: bool) -> tuple[str, str]:
+    """
+    (head, body sonu) için CSS / JS bloğu. offline=True: assets/report
+    altındaki dosyalar minify edilip gömülür (ağ isteği yok). Process başına
+    bir kez okunur / minify edilir; sonraki raporlar cache'ten alır.
+    """
+    if not offline:
+        return CDN_CSS, CDN_JS
+
+    css = _minify_css(_read("report.css"))
+    js = _minify_js(_read("report.js"))
+    return f"<style>{css}</style>", f"<script>{js}</script>"
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+# Her rapor dizininde bir tane; writer'lar rapor başına bir satır ekler
+CATALOG_NAME = "catalog.jsonl"
+
+SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+
+
+def catalog_path(out_dir: str | Path) -> str:
+    return os.path.join(str(out_dir), CATALOG_NAME)
+
+
+def make_entry(
+    report_file: Path,
+    project_root: str,
+    counts: Dict[str, Any],
+    created_at: float | None = None,
+    mode: str | None = None,
+    files_scanned: int | None = None,
+    duration: float | None = None,
+) -> Dict[str, Any]:
+    """
+    counts: {"risks": {severity: n}, "todos": n, "infos": n}
+    (FindingSpool.catalog_counts()).
+    """
+    risks = {s: counts["risks"].get(s, 0) for s in SEVERITIES}
+
+    try:
+        size = report_file.stat().st_size
+    except OSError:
+        size = 0
+
+    return {
+        "file": report_file.name,
+        "project": str(project_root),
+        "project_name": Path(project_root).name,
+        "mode": mode,
+        "created_at": created_at if created_at is not None else time.time(),
+        "risks": risks,
+        "risk_total": sum(risks.values()),
+        "todos": counts["todos"],
+        "infos": counts["infos"],
+        "files_scanned": files_scanned,
+        "duration": duration,
+        "size": size,
+    }
+
+
+class CatalogCounts:
+    """
+    Spool'suz writer'lar (JSONL / SARIF) için akış hâlinde sayaç;
+    as_dict() FindingSpool.catalog_counts() ile aynı şekildedir.
+    """
+
+    def __init__(self):
+        self.risks = {s: 0 for s in SEVERITIES}
+        self.kinds = {"TODO": 0, "INFO": 0}
+
+    def add(self, kind: str, severity: str | None):
+        if kind == "RISK":
+            if severity in self.risks:
+                self.risks[severity] += 1
+        elif kind in self.kinds:
+            self.kinds[kind] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "risks": dict(self.risks),
+            "todos": self.kinds["TODO"],
+            "infos": self.kinds["INFO"],
+        }
+
+
+def append_entry(out_dir: str | Path, entry: Dict[str, Any]):
+    """
+    flock altında tek write() ile ekler: eşzamanlı writer'lar (menubar,
+    daemon, CLI) satırları bölmez.
+    """
+    path = catalog_path(out_dir)
+    line = json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        os.write(fd, line)
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def record_report(
+    report_file: Path,
+    project_root: str,
+    counts: Dict[str, Any],
+    **meta,
+):
+    """
+    Writer'ların çağırdığı kısayol; katalog yazılamazsa rapor yine geçerlidir.
+    """
+    try:
+        append_entry(
+            report_file.parent,
+            make_entry(report_file, project_root, counts, **meta),
+        )
+    except OSError:
+        pass
+
+
+class ReportCatalog:
+    """
+    Katalog okuyucu. read_new() sadece son okumadan sonra eklenen satırları
+    parse eder; dosya değişmiş / kısalmışsa baştan okur.
+    """
+
+    def __init__(self, out_dir: str | Path):
+        self.path = catalog_path(out_dir)
+        self._offset = 0
+        self._ino: int | None = None
+
+    def read_all(self) -> list[Dict[str, Any]]:
+        self._offset = 0
+        self._ino = None
+        return self.read_new()
+
+    def read_new(self) -> list[Dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != self._ino or st.st_size < self._offset:
+                    self._ino = st.st_ino
+                    self._offset = 0
+                f.seek(self._offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+
+        # Yazımı bitmemiş son satır bir sonraki okumaya kalır
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+
+        out = []
+        for raw in data[:end].splitlines():
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and entry.get("file"):
+                out.append(entry)
+        return out
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from report_html import write_html_report
+from report_jsonl import write_jsonl_report
+from report_sarif import write_sarif_report
+
+# --format adı → writer; hepsi aynı imza:
+# (findings, project_root, out_dir, mode=, files_scanned=, duration=, delta=) -> Path
+REPORT_FORMATS = {
+    "html": write_html_report,
+    "jsonl": write_jsonl_report,
+    "sarif": write_sarif_report,
+}
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from scanner import Finding
+from scan_delta import ScanDelta
+from report_jsonl import PathEncoder, json_int, json_str, report_path
+from report_spool import open_report
+from report_catalog import CatalogCounts, record_report
+from config import APP_META
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SRCROOT = "%SRCROOT%"
+
+# Severity → SARIF level
+LEVELS = {
+    "CRITICAL": "error",
+    "HIGH": "error",
+    "MEDIUM": "warning",
+    "LOW": "note",
+}
+
+_encode = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, separators=(",", ":"),
+).encode
+
+
+def _rule_descriptor(rule: str, f: Finding) -> Dict[str, Any]:
+    desc: Dict[str, Any] = {
+        "id": rule,
+        "shortDescription": {"text": f.title},
+        "defaultConfiguration": {"level": LEVELS.get(f.severity, "warning")},
+    }
+    if f.explanation:
+        desc["fullDescription"] = {"text": f.explanation}
+    if f.recommendation:
+        desc["help"] = {"text": f.recommendation}
+    return desc
+
+
+def write_sarif_report(
+    findings: Iterable[Finding],
+    project_root: str,
+    out_dir: str,
+    mode: str | None = None,
+    files_scanned: int | None = None,
+    duration: float | None = None,
+    delta: ScanDelta | None = None,
+) -> Path:
+    """
+    SARIF 2.1.0, tek run. Bulgular results dizisine akış hâlinde yazılır;
+    kural kataloğu (tool.driver.rules) bulgularda görülen kurallardan
+    toplanır ve results'tan sonra bir kez yazılır. JSON nesnesinde alan
+    sırası anlamsız olduğundan geçerli SARIF'tir; bulgular bellekte tutulmaz.
+
+    ruleIndex ilk görülme sırasıdır; aynı bulgular aynı dosyayı üretir.
+    URI'ler %SRCROOT%'a göreli; kökün mutlak yolu yazılmaz (makineden
+    bağımsız), tüketici (ör. code scanning) checkout kökünü kullanır.
+    """
+    root = str(Path(project_root).expanduser().resolve())
+    report_file = report_path(out_dir, project_root, ".sarif")
+
+    rules: Dict[str, tuple[str, int]] = {}
+    descriptors: list[Dict[str, Any]] = []
+    path_json = PathEncoder(root)
+    counts = CatalogCounts()
+    count = counts.add
+
+    with open_report(report_file) as out:
+        write = out.write
+        write(
+            f'{{"$schema":{_encode(SARIF_SCHEMA)},"version":"{SARIF_VERSION}",'
+            f'"runs":[{{"results":['
+        )
+
+        # Result satırı şablonla kurulur (bkz. report_jsonl); alan sırası sabit
+        sep = ""
+        for f in findings:
+            count(f.kind, f.severity)
+            rule = f.rule or f.kind.lower()
+            known = rules.get(rule)
+            if known is None:
+                known = rules[rule] = (json_str(rule), len(descriptors))
+                descriptors.append(_rule_descriptor(rule, f))
+            rule_json, index = known
+
+            region = (
+                f',"region":{{"startLine":{f.line},"snippet":{{"text":{json_str(f.detail)}}}}}'
+                if f.line else ""
+            )
+            write(
+                f'{sep}{{"ruleId":{rule_json},"ruleIndex":{index},'
+                f'"level":"{LEVELS.get(f.severity, "warning")}",'
+                f'"message":{{"text":{json_str(f.title)}}},'
+                f'"locations":[{{"physicalLocation":{{"artifactLocation":'
+                f'{{"uri":{path_json(f.path)},"uriBaseId":"{SRCROOT}"}}{region}}}}}],'
+                f'"properties":{{"kind":{json_str(f.kind)},"severity":{json_str(f.severity)},'
+                f'"score":{json_int(f.score)}}}}}'
+            )
+            sep = ","
+
+        # run nesnesinin kalan alanları: baştaki "{" atlanır, sondaki "}" run'ı kapatır
+        write("],")
+        write(_encode({
+            "tool": {
+                "driver": {
+                    "name": APP_META["name"],
+                    "version": APP_META["version"],
+                    "rules": descriptors,
+                },
+            },
+            "properties": {
+                "mode": mode,
+                "filesScanned": files_scanned,
+                "delta": delta.report_counts() if delta is not None else None,
+            },
+        })[1:])
+        write("]}\n")
+
+    # Reports ekranı HTML'leri listeler; katalog yine her writer'ı kaydeder
+    record_report(
+        report_file,
+        project_root,
+        counts.as_dict(),
+        mode=mode,
+        files_scanned=files_scanned,
+        duration=duration,
+    )
+    return report_file
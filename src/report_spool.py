@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from contextlib import contextmanager
+from dataclasses import fields
+from operator import attrgetter
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+from scanner import Finding
+
+KINDS = ("RISK", "TODO", "INFO")
+SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+
+# Bellekte tutulan en fazla bulgu (batch); fazlası kind başına temp dosyaya
+SPOOL_BATCH = 1000
+WRITE_BUFFER = 1 << 16
+
+# astuple() derin kopya yapar; düz alan tuple'ı yeterli
+_as_tuple = attrgetter(*(f.name for f in fields(Finding)))
+
+
+class FindingSpool:
+    """
+    Bulguları tek geçişte sayar ve kind'a göre ayırır.
+
+    Rapor başlığı sayaçları bölümlerden önce yazdığından bulgular bir kez
+    okunmalı; liste yerine kind başına temp dosyaya pickle batch'leri yazılır,
+    bellekte en fazla SPOOL_BATCH bulgu durur. Sıra korunur.
+    """
+
+    def __init__(self, findings: Iterable[Finding]):
+        self.counts = {k: 0 for k in KINDS}
+        self.severities = {s: 0 for s in SEVERITIES}
+
+        self._files: dict[str, IO[bytes]] = {}
+        self._batches: dict[str, list[tuple]] = {k: [] for k in KINDS}
+
+        for f in findings:
+            if f.kind not in self.counts:
+                continue
+            self.counts[f.kind] += 1
+            if f.kind == "RISK" and f.severity in self.severities:
+                self.severities[f.severity] += 1
+
+            batch = self._batches[f.kind]
+            batch.append(_as_tuple(f))
+            if len(batch) >= SPOOL_BATCH:
+                self._spill(f.kind)
+
+    def _spill(self, kind: str):
+        fh = self._files.get(kind)
+        if fh is None:
+            fh = self._files[kind] = tempfile.TemporaryFile(prefix="zinkx-spool-")
+        pickle.dump(self._batches[kind], fh, protocol=pickle.HIGHEST_PROTOCOL)
+        self._batches[kind] = []
+
+    def catalog_counts(self) -> dict:
+        return {
+            "risks": dict(self.severities),
+            "todos": self.counts["TODO"],
+            "infos": self.counts["INFO"],
+        }
+
+    def iter(self, kind: str) -> Iterator[Finding]:
+        fh = self._files.get(kind)
+        if fh is not None:
+            fh.seek(0)
+            while True:
+                try:
+                    batch = pickle.load(fh)
+                except EOFError:
+                    break
+                for values in batch:
+                    yield Finding(*values)
+        for values in self._batches[kind]:
+            yield Finding(*values)
+
+    def iter_all(self) -> Iterator[Finding]:
+        for kind in KINDS:
+            yield from self.iter(kind)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def close(self):
+        for fh in self._files.values():
+            fh.close()
+        self._files.clear()
+
+    def __enter__(self) -> FindingSpool:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@contextmanager
+def open_report(report_file: Path) -> Iterator[IO[str]]:
+    """
+    Buffer'lı yazım; bitince atomik rename. Yarım rapor .html olarak görünmez
+    (reports ekranı dizini izliyor).
+    """
+    tmp = report_file.with_name(report_file.name + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8", buffering=WRITE_BUFFER) as out:
+            yield out
+        os.replace(tmp, report_file)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import IO
+
+from jinja2 import (
+    ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, select_autoescape,
+)
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
+# tools/precompile_templates.py çıktısı; yoksa .j2 kaynakları derlenir
+COMPILED_DIR = os.path.join(TEMPLATE_DIR, "compiled")
+
+# generate() parçaları bu boyuta gelince yazılır (satır başına write yok)
+FLUSH_CHARS = 1 << 16
+
+
+def _loader():
+    loaders = [FileSystemLoader(TEMPLATE_DIR)]
+    if os.path.isdir(COMPILED_DIR):
+        loaders.insert(0, ModuleLoader(COMPILED_DIR))
+    return ChoiceLoader(loaders)
+
+
+@lru_cache(maxsize=None)
+def environment() -> Environment:
+    """
+    Process başına tek Environment: template'ler ilk kullanımda derlenir,
+    sonraki raporlar Environment cache'inden alır. auto_reload kapalı
+    (template'ler paketle gelir, her render'da mtime kontrolü gereksiz).
+    """
+    return Environment(
+        loader=_loader(),
+        autoescape=select_autoescape(("html", "j2")),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        auto_reload=False,
+    )
+
+
+def render_to(out: IO[str], name: str, **context):
+    """
+    Template'i parça parça out'a yazar; iterator context değerleri
+    (spool.iter) render sırasında tüketilir, çıktı bellekte birikmez.
+    """
+    buf: list[str] = []
+    size = 0
+    for chunk in environment().get_template(name).generate(**context):
+        buf.append(chunk)
+        size += len(chunk)
+        if size >= FLUSH_CHARS:
+            out.write("".join(buf))
+            buf.clear()
+            size = 0
+    out.write("".join(buf))
+
+
+def precompile(target: str = COMPILED_DIR) -> list[str]:
+    """
+    Tüm .j2 template'leri Python modülü olarak target'a derler
+    (ModuleLoader ile yüklenir; ilk raporda parse / compile maliyeti yok).
+    """
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(("html", "j2")),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    names = env.list_templates(extensions=["j2"])
+    env.compile_templates(target, extensions=["j2"], zip=None, ignore_errors=False)
+    environment.cache_clear()
+    return names
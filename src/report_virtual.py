@@ -0,0 +1,540 @@
+from __future__ import annotations
+
+import html
+import json
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Iterable
+
+from scanner import Finding
+from scan_delta import ScanDelta
+from report_catalog import record_report
+from report_spool import KINDS, SEVERITIES, open_report
+
+# write_html_report bu sayıdan fazla bulguda bu varyanta geçer
+# (config: reports.virtual_threshold)
+VIRTUAL_THRESHOLD = 2000
+
+# Kolonlar (hepsi N uzunlukta):
+#   k  kind     → KINDS index
+#   s  severity → SEVERITIES index (bilinmeyen: len(SEVERITIES))
+#   n  score
+#   t  title, r rule, e explanation, c recommendation → texts index (-1: yok)
+#   p  path     → paths index
+#   l  line     (0: yok)
+#   d  detail   (ham string; bulguya özgü olduğundan tablo yok)
+_COLUMNS = ("k", "s", "n", "t", "r", "e", "c", "p", "l", "d")
+
+# Kolon değerleri bu kadar bulguda bir temp dosyalara toplu yazılır
+_COLUMN_BATCH = 4096
+
+
+def _js(value) -> str:
+    # <script> içine gömülür: "</script>" / "<!--" kapanmasın
+    return json.dumps(value, ensure_ascii=False).replace("<", "\\u003c")
+
+
+class _Table:
+    """
+    Tekrarlanan string'ler (kural metinleri, path'ler) için index tablosu.
+    """
+
+    def __init__(self):
+        self._index: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        i = self._index.get(value)
+        if i is None:
+            i = self._index[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+
+def write_virtual_report(
+    findings: Iterable[Finding],
+    project_root: str,
+    out_dir: str,
+    mode: str | None = None,
+    files_scanned: int | None = None,
+    duration: float | None = None,
+    delta: ScanDelta | None = None,
+) -> Path:
+    """
+    Büyük sonuçlar için rapor: bulgular kolon bazlı JSON olarak gömülür,
+    sayfa sadece görünen satırları çizer (sanal scroll, client-side filtre /
+    sıralama). Bulgular tek geçişte kolon temp dosyalarına yazılır.
+    """
+    outp = Path(out_dir).expanduser().resolve()
+    outp.mkdir(parents=True, exist_ok=True)
+
+    ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    project_name = Path(project_root).name
+    report_file = outp / f"{ts}_{project_name}.html"
+
+    texts = _Table()
+    paths = _Table()
+    counts = {
+        "risks": {s: 0 for s in SEVERITIES},
+        "todos": 0,
+        "infos": 0,
+    }
+    sev_index = {s: i for i, s in enumerate(SEVERITIES)}
+    kind_index = {k: i for i, k in enumerate(KINDS)}
+
+    cols: dict[str, IO[str]] = {
+        c: tempfile.TemporaryFile("w+", encoding="utf-8", prefix="zinkx-col-")
+        for c in _COLUMNS
+    }
+    bufs: dict[str, list[str]] = {c: [] for c in _COLUMNS}
+
+    def flush(written: int):
+        for c in _COLUMNS:
+            if bufs[c]:
+                cols[c].write(("," if written else "") + ",".join(bufs[c]))
+                bufs[c].clear()
+
+    try:
+        n = 0
+        for f in findings:
+            k = kind_index.get(f.kind)
+            if k is None:
+                continue
+            if f.kind == "RISK":
+                if f.severity in counts["risks"]:
+                    counts["risks"][f.severity] += 1
+            elif f.kind == "TODO":
+                counts["todos"] += 1
+            else:
+                counts["infos"] += 1
+
+            bufs["k"].append(str(k))
+            bufs["s"].append(str(sev_index.get(f.severity, len(SEVERITIES))))
+            bufs["n"].append(str(int(f.score or 0)))
+            bufs["t"].append(str(texts.add(f.title)))
+            bufs["r"].append(str(texts.add(f.rule)))
+            bufs["e"].append(str(texts.add(f.explanation)))
+            bufs["c"].append(str(texts.add(f.recommendation)))
+            bufs["p"].append(str(paths.add(f.path)))
+            bufs["l"].append(str(f.line or 0))
+            bufs["d"].append(_js(f.detail or ""))
+            n += 1
+
+            if n % _COLUMN_BATCH == 0:
+                flush(n - _COLUMN_BATCH)
+        flush(n - len(bufs["k"]))
+
+        with open_report(report_file) as out:
+            out.write(_render_head(project_name, project_root, n, delta))
+
+            out.write('<script id="zk-data" type="application/json">{')
+            out.write('"kinds":' + _js(list(KINDS)))
+            out.write(',"severities":' + _js([*SEVERITIES, "?"]))
+            out.write(',"texts":' + _js(texts.values))
+            out.write(',"paths":' + _js(paths.values))
+            out.write(',"cols":{')
+            for i, c in enumerate(_COLUMNS):
+                out.write(f'{"," if i else ""}"{c}":[')
+                cols[c].seek(0)
+                shutil.copyfileobj(cols[c], out)
+                out.write("]")
+            out.write("}}</script>\n")
+
+            out.write(_VIEWER)
+    finally:
+        for fh in cols.values():
+            fh.close()
+
+    record_report(
+        report_file,
+        project_root,
+        counts,
+        mode=mode,
+        files_scanned=files_scanned,
+        duration=duration,
+    )
+    return report_file
+
+
+# ==================================================
+# HTML
+# ==================================================
+def _render_head(
+    project_name: str,
+    project_root: str,
+    total: int,
+    delta: ScanDelta | None = None,
+) -> str:
+    changes = ""
+    if delta is not None and delta.base_scan_id is not None:
+        changes = (
+            f"<br>Since previous scan: {delta.new_count} new · "
+            f"{delta.fixed_count} fixed · {delta.persisting_count} persisting"
+        )
+
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Zinkx Dev Assistant – Scan Report</title>
+<meta name="viewport" content="width=device-width, initial-scale=1">
+
+<style>
+:root {{
+  --bg: #020617;
+  --panel: #030712;
+  --border: #1e293b;
+
+  --text: #e5e7eb;
+  --soft: #cbd5f5;
+  --muted: #94a3b8;
+
+  --risk: #ef4444;
+  --todo: #facc15;
+  --info: #38bdf8;
+}}
+
+* {{ box-sizing: border-box; }}
+
+html, body {{ height: 100%; }}
+
+body {{
+  margin: 0;
+  background: var(--bg);
+  color: var(--text);
+  font-family: -apple-system, BlinkMacSystemFont, "Inter", sans-serif;
+  font-size: 14px;
+  display: flex;
+  flex-direction: column;
+}}
+
+header {{ padding: 20px 20px 0; }}
+
+h1 {{ margin: 0 0 4px 0; font-size: 22px; }}
+
+.meta {{ color: var(--muted); font-size: 12px; line-height: 1.5; }}
+
+.stats {{
+  display: grid;
+  grid-template-columns: repeat(4, 1fr);
+  gap: 12px;
+  margin: 16px 0;
+}}
+
+.stat {{
+  background: var(--panel);
+  border: 1px solid var(--border);
+  border-radius: 10px;
+  padding: 10px;
+  text-align: center;
+}}
+
+.stat-value {{ font-size: 22px; font-weight: 700; }}
+
+.toolbar {{
+  display: flex;
+  gap: 8px;
+  flex-wrap: wrap;
+  align-items: center;
+  padding: 0 20px 12px;
+}}
+
+.toolbar button, .toolbar select, .toolbar input {{
+  background: var(--panel);
+  color: var(--text);
+  border: 1px solid var(--border);
+  border-radius: 8px;
+  padding: 5px 10px;
+  font: inherit;
+}}
+
+.toolbar button.active {{ border-color: var(--info); color: var(--info); }}
+.toolbar input {{ flex: 1; min-width: 180px; }}
+.toolbar .count {{ color: var(--muted); font-size: 12px; }}
+
+main {{ flex: 1; display: flex; min-height: 0; border-top: 1px solid var(--border); }}
+
+#list {{ flex: 1; overflow-y: auto; position: relative; }}
+#spacer {{ position: relative; }}
+
+.row {{
+  position: absolute;
+  left: 0; right: 0;
+  height: 44px;
+  padding: 0 16px;
+  display: flex;
+  gap: 10px;
+  align-items: center;
+  border-bottom: 1px solid var(--border);
+  cursor: pointer;
+  white-space: nowrap;
+}}
+
+.row:hover {{ background: rgba(255,255,255,0.03); }}
+.row.sel {{ background: rgba(56,189,248,0.12); }}
+
+.badge {{
+  font-size: 11px;
+  padding: 2px 6px;
+  border-radius: 6px;
+  text-transform: uppercase;
+  flex: none;
+  width: 74px;
+  text-align: center;
+}}
+
+.k0 {{ background: var(--risk); }}
+.k1 {{ background: var(--todo); color: #000; }}
+.k2 {{ background: var(--info); color: #000; }}
+
+.title {{ font-weight: 600; overflow: hidden; text-overflow: ellipsis; flex: 1; }}
+.path {{ color: var(--info); font-size: 12px; overflow: hidden; text-overflow: ellipsis; max-width: 45%; }}
+
+#detail {{
+  width: 38%;
+  overflow-y: auto;
+  border-left: 1px solid var(--border);
+  padding: 16px 20px;
+  display: none;
+}}
+
+#detail.open {{ display: block; }}
+#detail h3 {{ margin-top: 0; font-size: 16px; }}
+#detail pre {{ white-space: pre-wrap; word-break: break-all; color: var(--soft); }}
+#detail a {{ color: var(--info); word-break: break-all; }}
+#detail .muted {{ color: var(--muted); font-size: 12px; }}
+</style>
+</head>
+
+<body>
+<header>
+<h1>Zinkx Dev Assistant</h1>
+<div class="meta">
+Project: <b>{html.escape(project_name, quote=False)}</b><br>
+Path: {html.escape(str(project_root), quote=False)}<br>
+Date: {datetime.now().isoformat(timespec="seconds")} · {total} findings{changes}
+</div>
+<div class="stats" id="stats"></div>
+</header>
+
+<div class="toolbar">
+  <button data-kind="-1" class="active">All</button>
+  <button data-kind="0">Risks</button>
+  <button data-kind="1">TODO</button>
+  <button data-kind="2">Info</button>
+  <select id="sev">
+    <option value="-1">All severities</option>
+    <option value="0">Critical</option>
+    <option value="1">High</option>
+    <option value="2">Medium</option>
+    <option value="3">Low</option>
+  </select>
+  <select id="sort">
+    <option value="default">Sort: scan order</option>
+    <option value="path">Sort: path</option>
+    <option value="title">Sort: title</option>
+    <option value="score">Sort: score</option>
+  </select>
+  <input id="q" type="search" placeholder="Filter title, path, detail…">
+  <span class="count" id="count"></span>
+</div>
+
+<main>
+  <div id="list"><div id="spacer"></div></div>
+  <aside id="detail"></aside>
+</main>
+
+"""
+
+
+_VIEWER = """<script>
+(function () {
+  "use strict";
+
+  var data = JSON.parse(document.getElementById("zk-data").textContent);
+  var T = data.texts, P = data.paths, C = data.cols;
+  var N = C.k.length;
+  var K = Int8Array.from(C.k), S = Int8Array.from(C.s), SC = Int32Array.from(C.n);
+  var TI = Int32Array.from(C.t), PI = Int32Array.from(C.p), L = Int32Array.from(C.l);
+  var D = C.d;
+
+  var ROW_H = 44, OVERSCAN = 10;
+  var list = document.getElementById("list");
+  var spacer = document.getElementById("spacer");
+  var detail = document.getElementById("detail");
+
+  var state = { kind: -1, sev: -1, q: "", sort: "default" };
+  var view = new Int32Array(0);
+  var selected = -1;
+  var pool = [];
+
+  // ---- Stats
+  var byKind = [0, 0, 0];
+  for (var i = 0; i < N; i++) byKind[K[i]]++;
+  var score = Math.max(0, 100 - byKind[0] * 15 - byKind[1] * 5);
+  var scoreColor = score >= 80 ? "#22c55e" : score >= 50 ? "#facc15" : "#ef4444";
+  document.getElementById("stats").innerHTML =
+    stat(score, "Health", scoreColor) + stat(byKind[0], "Risks", "var(--risk)") +
+    stat(byKind[1], "TODO", "var(--todo)") + stat(byKind[2], "Info", "var(--info)");
+
+  function stat(v, label, color) {
+    return '<div class="stat"><div class="stat-value" style="color:' + color + '">' +
+      v + "</div><div>" + label + "</div></div>";
+  }
+
+  // ---- Filter / sort (aramada küçük harf tabloları bir kez kurulur)
+  var lowT = null, lowP = null, lowD = null;
+
+  function apply() {
+    var q = state.q;
+    if (q && lowT === null) {
+      lowT = T.map(function (s) { return s.toLowerCase(); });
+      lowP = P.map(function (s) { return s.toLowerCase(); });
+      lowD = D.map(function (s) { return s.toLowerCase(); });
+    }
+
+    var out = new Int32Array(N), n = 0;
+    for (var i = 0; i < N; i++) {
+      if (state.kind >= 0 && K[i] !== state.kind) continue;
+      if (state.sev >= 0 && S[i] !== state.sev) continue;
+      if (q && lowT[TI[i]].indexOf(q) < 0 && lowP[PI[i]].indexOf(q) < 0 &&
+          lowD[i].indexOf(q) < 0) continue;
+      out[n++] = i;
+    }
+    view = out.subarray(0, n);
+
+    if (state.sort === "path") {
+      var pr = rank(P);
+      view.sort(function (a, b) { return pr[PI[a]] - pr[PI[b]] || L[a] - L[b]; });
+    } else if (state.sort === "title") {
+      var tr = rank(T);
+      view.sort(function (a, b) { return tr[TI[a]] - tr[TI[b]] || a - b; });
+    } else if (state.sort === "score") {
+      view.sort(function (a, b) { return SC[b] - SC[a] || a - b; });
+    }
+
+    document.getElementById("count").textContent = n + " / " + N;
+    spacer.style.height = n * ROW_H + "px";
+    list.scrollTop = 0;
+    render();
+  }
+
+  // Tablo sırası → alfabetik sıra (tablo küçük, satırlar sadece int karşılaştırır)
+  var ranks = new Map();
+  function rank(table) {
+    var r = ranks.get(table);
+    if (r) return r;
+    var idx = table.map(function (_, i) { return i; });
+    idx.sort(function (a, b) { return table[a] < table[b] ? -1 : table[a] > table[b] ? 1 : 0; });
+    r = new Int32Array(table.length);
+    idx.forEach(function (t, pos) { r[t] = pos; });
+    ranks.set(table, r);
+    return r;
+  }
+
+  // ---- Virtual rendering: sadece görünen satırlar DOM'da
+  function rowNode(slot) {
+    var el = pool[slot];
+    if (!el) {
+      el = document.createElement("div");
+      el.className = "row";
+      el.innerHTML = '<span class="badge"></span><span class="title"></span><span class="path"></span>';
+      el.addEventListener("click", function () { select(+this.dataset.i); });
+      spacer.appendChild(el);
+      pool[slot] = el;
+    }
+    return el;
+  }
+
+  function render() {
+    var first = Math.max(0, Math.floor(list.scrollTop / ROW_H) - OVERSCAN);
+    var last = Math.min(view.length, Math.ceil((list.scrollTop + list.clientHeight) / ROW_H) + OVERSCAN);
+
+    var slot = 0;
+    for (var pos = first; pos < last; pos++, slot++) {
+      var i = view[pos];
+      var el = rowNode(slot);
+      el.style.display = "";
+      el.style.transform = "translateY(" + pos * ROW_H + "px)";
+      el.dataset.i = i;
+      el.className = i === selected ? "row sel" : "row";
+
+      var badge = el.firstChild;
+      badge.className = "badge k" + K[i];
+      badge.textContent = K[i] === 0 ? data.severities[S[i]] : data.kinds[K[i]];
+      el.childNodes[1].textContent = T[TI[i]];
+      el.childNodes[2].textContent = L[i] ? P[PI[i]] + ":" + L[i] : P[PI[i]];
+    }
+    for (; slot < pool.length; slot++) pool[slot].style.display = "none";
+  }
+
+  function text(idx) { return idx >= 0 ? T[idx] : ""; }
+
+  function esc(s) {
+    return String(s).replace(/[&<>"]/g, function (c) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;" }[c];
+    });
+  }
+
+  function select(i) {
+    selected = i;
+    render();
+
+    var path = P[PI[i]];
+    var loc = L[i] ? path + ":" + L[i] : path;
+    var href = L[i] ? "vscode://file/" + encodeURI(loc) : "#";
+
+    detail.innerHTML =
+      "<h3>" + esc(T[TI[i]]) + "</h3>" +
+      '<div class="muted">' + esc(data.kinds[K[i]]) + " · " + esc(data.severities[S[i]]) +
+      (C.r[i] >= 0 ? " · rule: " + esc(text(C.r[i])) : "") + "</div>" +
+      '<p><a href="' + esc(href) + '">' + esc(loc) + "</a></p>" +
+      "<pre>" + esc(D[i]) + "</pre>" +
+      (C.e[i] >= 0 ? "<p>" + esc(text(C.e[i])) + "</p>" : "") +
+      (C.c[i] >= 0 ? "<p><i>" + esc(text(C.c[i])) + "</i></p>" : "");
+    detail.classList.add("open");
+  }
+
+  // ---- Events
+  var ticking = false;
+  list.addEventListener("scroll", function () {
+    if (ticking) return;
+    ticking = true;
+    requestAnimationFrame(function () { ticking = false; render(); });
+  });
+  window.addEventListener("resize", render);
+
+  document.querySelectorAll(".toolbar button").forEach(function (b) {
+    b.addEventListener("click", function () {
+      document.querySelectorAll(".toolbar button").forEach(function (x) { x.classList.remove("active"); });
+      b.classList.add("active");
+      state.kind = +b.dataset.kind;
+      apply();
+    });
+  });
+  document.getElementById("sev").addEventListener("change", function () {
+    state.sev = +this.value;
+    apply();
+  });
+  document.getElementById("sort").addEventListener("change", function () {
+    state.sort = this.value;
+    apply();
+  });
+
+  var qTimer = null;
+  document.getElementById("q").addEventListener("input", function () {
+    var v = this.value.trim().toLowerCase();
+    clearTimeout(qTimer);
+    qTimer = setTimeout(function () { state.q = v; apply(); }, 150);
+  });
+
+  apply();
+})();
+</script>
+</body>
+</html>
+"""
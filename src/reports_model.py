@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import os
+import re
+from datetime import datetime
+from typing import Any, Dict
+
+from PySide6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QRect, QSize, QFileSystemWatcher,
+)
+from PySide6.QtGui import QIcon, QPixmap, QPainter, QPalette, QColor, QFont
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+
+from report_catalog import ReportCatalog
+
+ICON_DIR = os.path.join(os.path.dirname(__file__), "..", "assets", "icons")
+
+# View'a tek seferde açılan satır sayısı (fetchMore ile devamı)
+FETCH_BATCH = 200
+ROW_HEIGHT = 74
+
+# Liste sadece tarayıcıda açılan HTML raporlar; JSONL / SARIF makine çıktısıdır
+# (CI, code scanning), katalogda kayıtlıdır ama burada gösterilmez
+LISTED_SUFFIX = ".html"
+
+_TIME = re.compile(r"^\d{2}-\d{2}-\d{2}$")
+
+
+def _meta_from_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    parts = [f"{entry.get('risk_total', 0)} risks", f"{entry.get('todos', 0)} TODO"]
+    if entry.get("files_scanned") is not None:
+        parts.append(f"{entry['files_scanned']} files")
+    if entry.get("duration") is not None:
+        parts.append(f"{entry['duration']:.1f}s")
+
+    return {
+        "file": entry["file"],
+        "date": datetime.fromtimestamp(entry.get("created_at", 0)).strftime("%Y-%m-%d %H:%M:%S"),
+        "project": entry.get("project_name") or "Unknown project",
+        "mode": (entry.get("mode") or "scan").upper(),
+        "summary": " · ".join(parts),
+        "entry": entry,
+    }
+
+
+def _meta_from_filename(filename: str) -> Dict[str, Any]:
+    # Katalogdan önceki raporlar: 2026-01-15_13-21-41_myproject.html
+    parts = filename[:-len(LISTED_SUFFIX)].split("_")
+
+    date = parts[0] if parts else "Unknown date"
+    rest = parts[1:]
+    if rest and _TIME.match(rest[0]):
+        date = f"{date} {rest[0].replace('-', ':')}"
+        rest = rest[1:]
+
+    return {
+        "file": filename,
+        "date": date,
+        "project": "_".join(rest) or "Unknown project",
+        "mode": "SCAN",
+        "summary": "Project root",
+        "entry": None,
+    }
+
+
+# ==================================================
+# Model
+# ==================================================
+class ReportListModel(QAbstractListModel):
+    """
+    reports/ altındaki HTML raporlar (en yeni önce).
+
+    - Metadata (proje, mode, sayaçlar) catalog.jsonl'den gelir; HTML okunmaz.
+      Katalogda olmayan eski raporlar için dosya adı parse edilir
+    - Dizin listesi sadece dosya adlarıdır (silinen raporlar düşer)
+    - Satırlar view'a FETCH_BATCH'lik parçalar hâlinde açılır (canFetchMore)
+    - Dizin değişince (yeni rapor) sadece yeni satırlar eklenir
+    """
+
+    FileRole = Qt.UserRole
+    MetaRole = Qt.UserRole + 1
+
+    def __init__(self, reports_dir: str, parent=None):
+        super().__init__(parent)
+        self.reports_dir = reports_dir
+
+        self._files: list[str] = []
+        self._loaded = 0
+        self._meta: dict[str, Dict[str, Any]] = {}
+
+        self._catalog = ReportCatalog(reports_dir)
+        self._entries: dict[str, Dict[str, Any]] = {}
+
+        # HTML dizine katalog satırından önce düşer → katalog dosyası da izlenir
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(lambda _: self.refresh())
+        self._watcher.fileChanged.connect(lambda _: self.refresh())
+
+    # ----------------------------------------------
+    # Qt model API
+    # ----------------------------------------------
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._files)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        n = min(FETCH_BATCH, len(self._files) - self._loaded)
+        if n <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + n - 1)
+        self._loaded += n
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+
+        filename = self._files[index.row()]
+        if role == self.FileRole:
+            return filename
+        if role == self.MetaRole:
+            return self.meta(filename)
+        if role == Qt.DisplayRole:
+            return self.meta(filename)["project"]
+        if role == Qt.ToolTipRole:
+            return filename
+        return None
+
+    # ----------------------------------------------
+    # Data
+    # ----------------------------------------------
+    def meta(self, filename: str) -> Dict[str, Any]:
+        meta = self._meta.get(filename)
+        if meta is None:
+            entry = self._entries.get(filename)
+            meta = _meta_from_entry(entry) if entry else _meta_from_filename(filename)
+            self._meta[filename] = meta
+        return meta
+
+    def _read_catalog(self) -> bool:
+        """
+        Yeni katalog satırlarını alır; daha önce çizilmiş bir rapora ait
+        satır geldiyse True (metadata cache'i o dosya için düşer).
+        """
+        changed = False
+        for entry in self._catalog.read_new():
+            name = entry["file"]
+            if not name.endswith(LISTED_SUFFIX):
+                continue
+            self._entries[name] = entry
+            if self._meta.pop(name, None) is not None:
+                changed = True
+        return changed
+
+    def _list_files(self) -> list[str]:
+        try:
+            with os.scandir(self.reports_dir) as it:
+                names = [e.name for e in it if e.name.endswith(LISTED_SUFFIX)]
+        except OSError:
+            return []
+        return sorted(names, reverse=True)
+
+    def refresh(self):
+        """
+        Dizini tekrar listeler. Sadece başa yeni rapor eklendiyse (olağan
+        durum: yeni scan) mevcut satırlar korunur, aksi hâlde model sıfırlanır.
+        """
+        if os.path.isdir(self.reports_dir) and not self._watcher.directories():
+            self._watcher.addPath(self.reports_dir)
+        if os.path.isfile(self._catalog.path) and not self._watcher.files():
+            self._watcher.addPath(self._catalog.path)
+
+        if self._read_catalog() and self._loaded:
+            self.dataChanged.emit(self.index(0), self.index(self._loaded - 1))
+
+        files = self._list_files()
+        if files == self._files:
+            return
+
+        added = len(files) - len(self._files)
+        if self._files and added > 0 and files[added:] == self._files:
+            self.beginInsertRows(QModelIndex(), 0, added - 1)
+            self._files = files
+            self._loaded += added
+            self.endInsertRows()
+            return
+
+        self.beginResetModel()
+        self._files = files
+        self._loaded = min(FETCH_BATCH, len(files))
+        live = set(files)
+        self._meta = {f: m for f, m in self._meta.items() if f in live}
+        self.endResetModel()
+
+
+# ==================================================
+# Delegate
+# ==================================================
+class ReportItemDelegate(QStyledItemDelegate):
+    """
+    Rapor kartını doğrudan çizer (satır başına widget / layout yok).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (ad, boyut) → pixmap; tüm satırlar aynı birkaç ikonu paylaşır
+        self._pixmaps: dict[tuple[str, int], QPixmap] = {}
+
+    def _pixmap(self, name: str, size: int) -> QPixmap:
+        key = (name, size)
+        pm = self._pixmaps.get(key)
+        if pm is None:
+            pm = QIcon(os.path.join(ICON_DIR, name)).pixmap(size, size)
+            self._pixmaps[key] = pm
+        return pm
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width() or 320, ROW_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index):
+        meta = index.data(ReportListModel.MetaRole)
+        if meta is None:
+            return
+
+        pal = option.palette
+        selected = bool(option.state & QStyle.State_Selected)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        card = option.rect.adjusted(1, 1, -1, -1)
+        painter.setPen(pal.color(QPalette.Mid))
+        painter.setBrush(pal.color(QPalette.Highlight) if selected else pal.color(QPalette.Base))
+        painter.drawRoundedRect(card, 14, 14)
+
+        text = QColor("white") if selected else pal.color(QPalette.Text)
+        muted = QColor("white") if selected else QColor("#94a3b8")
+        inner = card.adjusted(16, 12, -16, -12)
+
+        # ---- Title row
+        top = QRect(inner.left(), inner.top(), inner.width(), 22)
+        painter.drawPixmap(top.left(), top.top() + 2, self._pixmap("report.svg", 18))
+
+        bold = QFont(option.font)
+        bold.setBold(True)
+        painter.setFont(bold)
+        painter.setPen(text)
+        painter.drawText(
+            top.adjusted(26, 0, -60, 0), Qt.AlignVCenter | Qt.AlignLeft,
+            painter.fontMetrics().elidedText(meta["project"], Qt.ElideRight, top.width() - 86),
+        )
+
+        painter.setFont(option.font)
+        painter.setPen(muted if selected else QColor("#60a5fa"))
+        painter.drawText(top, Qt.AlignVCenter | Qt.AlignRight, meta["mode"])
+
+        # ---- Meta row
+        small = QFont(option.font)
+        small.setPointSizeF(max(small.pointSizeF() - 2, 8))
+        painter.setFont(small)
+        painter.setPen(muted)
+
+        row = QRect(inner.left(), inner.bottom() - 18, inner.width(), 18)
+        painter.drawPixmap(row.left(), row.top() + 2, self._pixmap("clock.svg", 14))
+        date_w = painter.fontMetrics().horizontalAdvance(meta["date"])
+        painter.drawText(row.adjusted(20, 0, 0, 0), Qt.AlignVCenter | Qt.AlignLeft, meta["date"])
+
+        x = row.left() + 20 + date_w + 12
+        painter.drawPixmap(x, row.top() + 2, self._pixmap("folder.svg", 14))
+        painter.drawText(
+            QRect(x + 20, row.top(), row.right() - x - 20, row.height()),
+            Qt.AlignVCenter | Qt.AlignLeft, meta["summary"],
+        )
+
+        painter.restore()
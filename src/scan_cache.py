@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from baseline import Baseline
+from scanner import Finding, ScanProfile, scan_file
+
+# Daemon uzun yaşar ve birçok repo tarar: cache LRU ile sınırlı. Bellek
+# bulgu listeleriyle büyüdüğünden toplam bulgu sayısı da sınırlanır.
+MAX_ENTRIES = 50_000
+MAX_FINDINGS = 200_000
+
+
+# --------------------------------------------------
+# Per-file result cache
+# --------------------------------------------------
+class FileScanCache:
+    """
+    Dosya bazlı scan sonuçlarını bellekte tutar.
+
+    Anahtar: (path, ScanProfile, Baseline)
+    Geçerlilik: st_mtime_ns + st_size aynı kaldıkça dosya yeniden okunmaz,
+    önceki findings döner. Config değişince profile, baseline dosyası
+    değişince Baseline nesnesi (dolayısıyla key) değişir.
+
+    En eski kullanılan kayıtlar max_entries / max_findings aşılınca düşer.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_findings: int = MAX_FINDINGS):
+        self.max_entries = max_entries
+        self.max_findings = max_findings
+        self._entries: OrderedDict[tuple, tuple[tuple, list[Finding]]] = OrderedDict()
+        self._findings = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def scan(
+        self,
+        p: Path,
+        profile: ScanProfile,
+        baseline: Baseline | None = None,
+        root: str | None = None,
+    ) -> list[Finding]:
+        """
+        baseline / root scan_file'a geçer (dosya içi sınır baseline'lı
+        satırları saymaz); Baseline.load aynı dosya için aynı nesneyi döner.
+        """
+        baseline = baseline if baseline else None
+        try:
+            st = p.stat()
+        except OSError:
+            self.invalidate(str(p))
+            return []
+
+        key = (str(p), profile, baseline)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(entry[1])
+
+        found = scan_file(p, profile, baseline, root)
+
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (stamp, found)
+            self._findings += len(found)
+            self.misses += 1
+            self._evict()
+
+        return list(found)
+
+    def _drop(self, key: tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._findings -= len(entry[1])
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._findings > self.max_findings
+        ):
+            _, (_, found) = self._entries.popitem(last=False)
+            self._findings -= len(found)
+
+    def invalidate(self, path: str | None = None):
+        """
+        path verilirse sadece o dosyanın kayıtları, yoksa tüm cache silinir.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._findings = 0
+                return
+            for key in [k for k in self._entries if k[0] == path]:
+                self._drop(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
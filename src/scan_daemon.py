@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Warm scan daemon.
+
+Pre-commit hook'ların her commit'te Python başlatıp scanner / config /
+report modüllerini yeniden import etmemesi için uzun ömürlü yerel servis.
+Unix domain socket üzerinden satır bazlı JSON konuşur:
+
+    → {"op": "check", "repo": "/path/to/repo", "staged": [...], "mode": "prod"}
+    ← {"ok": true, "allowed": false, "risks": 2, "todos": 0, ...}
+
+Bellekte tutulanlar:
+- derlenmiş kurallar (scanner modülü import edilmiş halde kalır)
+- dosya bazlı sonuç cache'i (FileScanCache)
+- repo başına git index durumu (index mtime → staged dosyalar)
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+from git_changed import get_staged_files
+from ipc import STATE_DIR
+from report_html import write_html_report
+from scan_cache import FileScanCache
+from scanner import scan_project, SCAN_DEV, SCAN_PROD
+
+SOCKET_PATH = os.path.join(STATE_DIR, "scan-daemon.sock")
+
+# Boşta kalan daemon kendini kapatır (saniye)
+IDLE_TIMEOUT = 30 * 60
+
+# Verdict içinde dönen örnek risk sayısı
+TOP_RISKS = 10
+
+
+# --------------------------------------------------
+# Git index state
+# --------------------------------------------------
+class _GitIndexState:
+    """
+    Repo başına staged dosya listesi.
+    .git/index değişmedikçe git süreci yeniden çalıştırılmaz.
+    """
+
+    def __init__(self):
+        self._repos: dict[str, tuple[int, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def staged(self, repo: str) -> list[str]:
+        index = Path(repo) / ".git" / "index"
+        try:
+            stamp = index.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        with self._lock:
+            entry = self._repos.get(repo)
+            if entry is not None and entry[0] == stamp:
+                return list(entry[1])
+
+        files = get_staged_files(repo)
+
+        with self._lock:
+            self._repos[repo] = (stamp, files)
+
+        return list(files)
+
+
+# --------------------------------------------------
+# Daemon
+# --------------------------------------------------
+class ScanDaemon:
+    def __init__(
+        self,
+        socket_path: str = SOCKET_PATH,
+        idle_timeout: float = IDLE_TIMEOUT,
+    ):
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+
+        self.cache = FileScanCache()
+        self.index = _GitIndexState()
+
+        self._last_activity = time.monotonic()
+        self._server: socketserver.UnixStreamServer | None = None
+
+    # ----------------------------------------------
+    # Requests
+    # ----------------------------------------------
+    def handle(self, req: dict) -> dict:
+        self._last_activity = time.monotonic()
+        op = req.get("op")
+
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "cached_files": len(self.cache)}
+
+        if op == "check":
+            repo = req.get("repo")
+            if not repo or not os.path.isdir(repo):
+                return {"ok": False, "error": f"Not a directory: {repo}"}
+
+            return self.check(
+                repo,
+                staged=req.get("staged"),
+                mode=SCAN_DEV if req.get("mode") == "dev" else SCAN_PROD,
+            )
+
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    def check(
+        self,
+        repo: str,
+        staged: list[str] | None = None,
+        mode: str = SCAN_PROD,
+    ) -> dict:
+        start_ts = time.perf_counter()
+        repo = str(Path(repo).resolve())
+
+        if staged is None:
+            files = self.index.staged(repo)
+        else:
+            files = []
+            for p in staged:
+                full = Path(repo) / p
+                if full.is_file():
+                    files.append(str(full))
+
+        if not files:
+            return {
+                "ok": True,
+                "allowed": True,
+                "risks": 0,
+                "todos": 0,
+                "files": 0,
+                "report": None,
+                "top": [],
+                "elapsed_ms": round((time.perf_counter() - start_ts) * 1000, 1),
+            }
+
+        stats = {}
+        findings = scan_project(
+            repo,
+            mode=mode,
+            only_files=files,
+            cache=self.cache,
+            stats=stats,
+        )
+
+        risks = [f for f in findings if f.kind == "RISK"]
+        todos = sum(1 for f in findings if f.kind == "TODO")
+
+        # Rapor sadece commit engellendiğinde yazılır (temiz commit'te IO yok)
+        report = None
+        if risks:
+            report = str(write_html_report(
+                findings,
+                repo,
+                out_dir=str(Path(repo) / "reports"),
+                mode=mode,
+                **stats,
+            ))
+
+        return {
+            "ok": True,
+            "allowed": not risks,
+            "risks": len(risks),
+            "todos": todos,
+            "files": len(files),
+            "report": report,
+            "top": [
+                f"[{f.severity}] {f.title} — {f.path}:{f.line}" if f.line
+                else f"[{f.severity}] {f.title} — {f.path}"
+                for f in risks[:TOP_RISKS]
+            ],
+            "elapsed_ms": round((time.perf_counter() - start_ts) * 1000, 1),
+        }
+
+    # ----------------------------------------------
+    # Server lifecycle
+    # ----------------------------------------------
+    def serve_forever(self):
+        if is_running(self.socket_path):
+            print(f"Scan daemon already running: {self.socket_path}")
+            return
+
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)  # stale socket
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw in self.rfile:
+                    if not raw.strip():
+                        continue
+                    try:
+                        resp = daemon.handle(json.loads(raw))
+                    except Exception as e:
+                        resp = {"ok": False, "error": str(e)}
+                    self.wfile.write(json.dumps(resp).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+        class Server(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+
+        old_umask = os.umask(0o077)
+        try:
+            self._server = Server(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+
+        threading.Thread(target=self._idle_watchdog, daemon=True).start()
+
+        try:
+            self._server.serve_forever(poll_interval=0.5)
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _idle_watchdog(self):
+        while True:
+            time.sleep(min(60, self.idle_timeout))
+            if time.monotonic() - self._last_activity > self.idle_timeout:
+                self.shutdown()
+                return
+
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+def is_running(socket_path: str = SOCKET_PATH) -> bool:
+    if not os.path.exists(socket_path):
+        return False
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(0.5)
+            s.connect(socket_path)
+            s.sendall(b'{"op": "ping"}\n')
+            return bool(s.recv(4096))
+    except OSError:
+        return False
+
+
+def main() -> int:
+    ScanDaemon().serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scanner import Finding
+
+# Raporda / UI'da listelenen en fazla new / fixed bulgu (sayılar her zaman tam)
+DELTA_LIST_LIMIT = 200
+
+
+@dataclass
+class ScanDelta:
+    """
+    İki kayıtlı scan arasındaki fark (fingerprint ile eşleştirilir).
+
+    new:        bu scan'de var, önceki scan'de yok
+    fixed:      önceki scan'de var, bu scan'de yok (önceki scan'deki hâli)
+    persisting: ikisinde de var (sadece sayı)
+
+    Sayılar DB'de hesaplanır; new / fixed listeleri gösterim için
+    DELTA_LIST_LIMIT ile sınırlıdır (len(new) != new_count olabilir).
+    """
+    scan_id: int
+    base_scan_id: int | None
+    new_count: int = 0
+    fixed_count: int = 0
+    persisting_count: int = 0
+    new_risks: int = 0
+    fixed_risks: int = 0
+    new: list[Finding] = field(default_factory=list)
+    fixed: list[Finding] = field(default_factory=list)
+
+    def counts(self) -> dict:
+        """
+        Status / rapor özeti (JSON'a yazılabilir).
+        """
+        return {
+            "base_scan_id": self.base_scan_id,
+            "new": self.new_count,
+            "fixed": self.fixed_count,
+            "persisting": self.persisting_count,
+            "new_risks": self.new_risks,
+            "fixed_risks": self.fixed_risks,
+        }
+
+    def report_counts(self) -> dict | None:
+        """
+        Dosya raporları (JSONL / SARIF) için sadece sayılar; önceki scan yoksa
+        None. base_scan_id yerel DB rowid'i olduğundan yazılmaz: aynı bulgular
+        her makinede / çalıştırmada aynı byte'ları üretir.
+        """
+        if self.base_scan_id is None:
+            return None
+        counts = self.counts()
+        del counts["base_scan_id"]
+        return counts
@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import re
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from config import load_config
 from ipc import write_status   # 👈 progress IPC
+from progress_shm import (
+    ProgressBlock,
+    PHASE_ROOT_CHECKS,
+    PHASE_SCANNING,
+    PHASE_SORTING,
+    PHASE_DONE,
+)
 import time
 from datetime import datetime
 
+from baseline import Baseline
+from fingerprint import fingerprint_of, relative_key
+from finding_runs import FindingRuns, FindingStore
+
+if TYPE_CHECKING:
+    from findings_db import FindingsDB
+    from scan_cache import FileScanCache
+
 
 # --------------------------------------------------
 # Scan modes
@@ -58,6 +76,33 @@ DEBUG_ARTIFACTS = [
     "die(",
     "dd(",
 ]
+DEV_NOTE_TAGS = ["todo", "fixme", "hack", "bug", "xxx", "note", "optimize"]
+
+# --------------------------------------------------
+# Buffer scanning
+# --------------------------------------------------
+# Kural başına aday needle'ları: dosyanın küçük harfli kopyasında aranır
+# (literal → str.find, regex alternation'dan ~10x hızlı). Satır sınırını
+# geçemez ve kuralın tuttuğu her satırda eşleşir; kesin kontrol (eski
+# satır koşulu) sadece eşleşen satırlarda çalışır
+_SECRET_HINTS = ("api_key", "api-key", "apikey", "secret", "token", "password")
+
+# Satır sonu sadece \n / \r\n ise (olağan durum); kopyanın sonuna "\n"
+# eklenir, son satır da " \n" ile bulunur
+_LONG_LINE_HINT = re.compile(r"(?m)^[^\n]{241}")
+_TRAILING_WS_HINTS = (" \n", "\t\n", " \r\n", "\t\r\n")
+
+# Diğer str.splitlines() satır sonları da varsa
+_RARE_BREAKS = ("\v", "\f", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+_NOT_BREAK = r"[^\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]"
+_LONG_LINE_HINT_ANY = re.compile(rf"(?<!{_NOT_BREAK}){_NOT_BREAK}{{241}}")
+_TRAILING_WS_HINT_ANY = re.compile(r"[ \t](?=[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]|\Z)")
+
+# _LineIndex satır başları: satır sonlarının bitiş offset'leri
+_NEWLINE = re.compile(r"\n")
+_LINE_BREAK = re.compile(r"\r\n?|[\n\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
 SEVERITY_SCORES = {
     "CRITICAL": 25,
     "HIGH": 15,
@@ -65,6 +110,72 @@ SEVERITY_SCORES = {
     "LOW": 3,
 }
 
+# --------------------------------------------------
+# Rule tables
+# --------------------------------------------------
+# Tüm metin dosyalarında çalışan kurallar
+GENERAL_RULES = frozenset({
+    "long_line",
+    "trailing_whitespace",
+    "dev_note",
+    "large_file",
+})
+
+# Uzantıya özel kurallar
+EXT_RULES = {
+    ".php": frozenset({
+        "hardcoded_secret",
+        "debug_artifact",
+        "dangerous_function",
+        "hardcoded_email",
+        "display_errors",
+        "error_reporting",
+    }),
+}
+
+# kind="RISK" bulgu üreten kurallar: dosya başı sınır (finding_caps) bunlara
+# uygulanmaz, risk sayıları / skor / alarm eşiği eksiksiz kalır
+RISK_RULES = frozenset({
+    "hardcoded_secret",
+    "debug_artifact",
+    "dangerous_function",
+    "display_errors",
+    "error_reporting",
+    "env_tracked",
+})
+
+# Mode'a göre kural severity'leri
+RULE_SEVERITIES = {
+    SCAN_DEV: {
+        "long_line": "LOW",
+        "trailing_whitespace": "LOW",
+        "dev_note": "LOW",
+        "large_file": "LOW",
+        "hardcoded_secret": "HIGH",
+        "debug_artifact": "MEDIUM",
+        "dangerous_function": "CRITICAL",
+        "hardcoded_email": "LOW",
+        "display_errors": "MEDIUM",
+        "error_reporting": "LOW",
+        "env_tracked": "CRITICAL",
+        "missing_project_file": "LOW",
+    },
+    SCAN_PROD: {
+        "long_line": "LOW",
+        "trailing_whitespace": "LOW",
+        "dev_note": "LOW",
+        "large_file": "LOW",
+        "hardcoded_secret": "CRITICAL",
+        "debug_artifact": "HIGH",
+        "dangerous_function": "CRITICAL",
+        "hardcoded_email": "LOW",
+        "display_errors": "CRITICAL",
+        "error_reporting": "CRITICAL",
+        "env_tracked": "CRITICAL",
+        "missing_project_file": "LOW",
+    },
+}
+
 
 
 # --------------------------------------------------
@@ -84,14 +195,153 @@ class Finding:
     explanation: str | None = None
     recommendation: str | None = None
 
+    rule: str | None = None      # kural id (ör. hardcoded_secret)
+
+
+# --------------------------------------------------
+# Scan profile
+# --------------------------------------------------
+@dataclass(frozen=True)
+class ScanProfile:
+    """
+    config + scan mode'dan bir kez derlenen, değişmez scan ayarları.
+
+    Hashable (cache key) ve picklable (worker process'lere gönderilebilir).
+    Karşılaştırma / hash sadece ayar alanları üzerindendir; marker regex'i
+    ve lookup dict'leri bunlardan türetilir.
+    """
+    mode: str = SCAN_DEV
+    ignore_dirs: frozenset[str] = frozenset(IGNORE_DIRS)
+    text_exts: frozenset[str] = frozenset(TEXT_EXTS)
+    ignore_markers: tuple[str, ...] = ()
+    check_env: bool = True
+    show_progress: bool = True
+    progress_steps: tuple[int, ...] = (20, 50, 80, 100)
+    ext_rules: tuple[tuple[str, frozenset[str]], ...] = ()
+    severities: tuple[tuple[str, str], ...] = ()
+    # Dosya başına kural sınırı: ("default", n) ve kural override'ları, 0 = sınırsız
+    finding_caps: tuple[tuple[str, int], ...] = ()
+    # Sonuçları değiştirmez: karşılaştırma / hash / digest'e girmez
+    memory_budget: int = field(default=0, compare=False)
+
+    _marker_re: re.Pattern | None = field(default=None, init=False, compare=False, repr=False)
+    _rules: dict = field(default_factory=dict, init=False, compare=False, repr=False)
+    _severity: dict = field(default_factory=dict, init=False, compare=False, repr=False)
+    _caps: dict = field(default_factory=dict, init=False, compare=False, repr=False)
+    _hash: int = field(default=0, init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        markers = "|".join(re.escape(m) for m in self.ignore_markers)
+        set_ = object.__setattr__
+        set_(self, "_marker_re", re.compile(markers) if self.ignore_markers else None)
+        set_(self, "_rules", dict(self.ext_rules))
+        set_(self, "_severity", dict(self.severities))
+        set_(self, "_caps", dict(self.finding_caps))
+        set_(self, "_hash", hash(self._key()))
+
+    def __reduce__(self):
+        # Sadece ayar alanları pickle'lanır; türetilmiş alanlar (özellikle
+        # _hash: str hash'i process'e göre değişir) __post_init__'te yeniden
+        # hesaplanır, worker'daki profil yerel profille aynı cache key'i verir
+        return (type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init))
+
+    @classmethod
+    def from_config(cls, mode: str = SCAN_DEV, cfg: dict | None = None) -> ScanProfile:
+        cfg = load_config() if cfg is None else cfg
+
+        ignore_dirs = set(IGNORE_DIRS)
+        if cfg.get("ignore_node_modules", True):
+            ignore_dirs.add("node_modules")
+
+        ext_rules = tuple(sorted(
+            (ext, GENERAL_RULES | EXT_RULES.get(ext, frozenset()))
+            for ext in TEXT_EXTS
+        ))
+
+        return cls(
+            mode=mode,
+            ignore_dirs=frozenset(ignore_dirs),
+            text_exts=frozenset(TEXT_EXTS),
+            ignore_markers=tuple(cfg.get("ignore_inline_markers", [])),
+            check_env=bool(cfg.get("ignore_env", True)),
+            show_progress=bool(cfg.get("show_scan_progress", True)),
+            progress_steps=tuple(cfg.get("scan_progress_steps", [20, 50, 80, 100])),
+            ext_rules=ext_rules,
+            severities=tuple(sorted(RULE_SEVERITIES.get(mode, RULE_SEVERITIES[SCAN_DEV]).items())),
+            finding_caps=tuple(sorted(
+                (rule, int(cap or 0)) for rule, cap in cfg.get("finding_caps", {}).items()
+            )),
+            memory_budget=int(cfg.get("findings_memory_budget", 0) or 0),
+        )
+
+    def _key(self) -> tuple:
+        return (
+            self.mode,
+            self.ignore_dirs,
+            self.text_exts,
+            self.ignore_markers,
+            self.check_env,
+            self.show_progress,
+            self.progress_steps,
+            self.ext_rules,
+            self.severities,
+            self.finding_caps,
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def digest(self) -> str:
+        """
+        Process'ler arası sabit kimlik (hash() string'lerde process'e göre değişir).
+        Diske yazılan durumların (snapshot vb.) geçerlilik kontrolü için.
+        """
+        data = {
+            "mode": self.mode,
+            "ignore_dirs": sorted(self.ignore_dirs),
+            "text_exts": sorted(self.text_exts),
+            "ignore_markers": list(self.ignore_markers),
+            "check_env": self.check_env,
+            "show_progress": self.show_progress,
+            "progress_steps": list(self.progress_steps),
+            "ext_rules": [[ext, sorted(rules)] for ext, rules in self.ext_rules],
+            "severities": [list(pair) for pair in self.severities],
+            "finding_caps": [list(pair) for pair in self.finding_caps],
+        }
+        h = hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8"))
+        return h.hexdigest()
+
+    def is_ignored_dir(self, p: Path) -> bool:
+        return not self.ignore_dirs.isdisjoint(p.parts)
+
+    def has_marker(self, low: str) -> bool:
+        return self._marker_re is not None and self._marker_re.search(low) is not None
+
+    def rules_for(self, suffix: str) -> frozenset[str]:
+        return self._rules.get(suffix, frozenset())
+
+    def severity(self, rule: str) -> str:
+        return self._severity.get(rule, "LOW")
+
+    def cap(self, rule: str) -> int:
+        if rule in RISK_RULES:
+            return 0
+        return self._caps.get(rule, self._caps.get("default", 0))
+
 
 # --------------------------------------------------
 # Helpers
 # --------------------------------------------------
-def _is_ignored_dir(p: Path, cfg) -> bool:
-    if cfg.get("ignore_node_modules", True) and "node_modules" in p.parts:
-        return True
-    return any(part in IGNORE_DIRS for part in p.parts)
+def is_scannable(p: Path, profile: ScanProfile) -> bool:
+    """
+    Scan ve watch mode için ortak dosya filtresi.
+    """
+    if profile.is_ignored_dir(p):
+        return False
+    if p.suffix.lower() not in profile.text_exts:
+        return False
+    return p.is_file()
 
 
 def _safe_read_text(path: Path, limit_bytes: int = 400_000) -> str:
@@ -115,510 +365,883 @@ def _emit_progress(percent: int, mode: str):
 
 
 # --------------------------------------------------
-# Main scanner
+# Result order
 # --------------------------------------------------
-def scan_project(
-    root: str,
-    mode: str = SCAN_DEV,
-    only_files: list[str] | None = None,
-) -> list[Finding]:
+SEVERITY_ORDER = {
+    "CRITICAL": 0,
+    "HIGH": 1,
+    "MEDIUM": 2,
+    "LOW": 3,
+}
 
-    cfg = load_config()
 
-    ignore_markers = tuple(cfg.get("ignore_inline_markers", []))
-    progress_steps = cfg.get("scan_progress_steps", [20, 50, 80, 100])
-    show_progress = cfg.get("show_scan_progress", True)
+def finding_sort_key(f: Finding) -> tuple:
+    return (
+        SEVERITY_ORDER.get(f.severity, 9),
+        f.path,
+        f.line or 0,
+    )
 
-    rootp = Path(root).expanduser().resolve()
+
+# --------------------------------------------------
+# Per-file scanner
+# --------------------------------------------------
+class _LineIndex:
+    """
+    Dosya metni, küçük harfli kopyası ve satır başı offset'leri. Kurallar
+    tüm kopyada aranır; eşleşme offset'i satır başları dizisinde bisect ile
+    satır numarasına çevrilir, satır sadece eşleşen satır için kesilir.
+    Offset dizisi ilk eşleşmede kurulur (eşleşmesiz dosyada hiç kurulmaz).
+    """
+    __slots__ = ("text", "low", "plain_breaks", "_starts")
+
+    def __init__(self, text: str):
+        self.text = text
+
+        # Offset'ler korunmalı: lower() ile uzunluğu değişen tek karakter
+        # İ önceden 'i' olur; re.I'nin ASCII harfle eşlediği ı / ſ da
+        # katlanır (hardcoded_secret pattern'leri re.I)
+        if text.isascii():
+            low = text.lower()
+        else:
+            if "\u0130" in text:
+                text = text.replace("\u0130", "i")
+            low = text.lower()
+            if "\u0131" in low:
+                low = low.replace("\u0131", "i")
+            if "\u017f" in low:
+                low = low.replace("\u017f", "s")
+        self.low = low + "\n"
+
+        self.plain_breaks = (
+            low.count("\r") == low.count("\r\n")
+            and not any(c in low for c in _RARE_BREAKS)
+        )
+        self._starts: list[int] | None = None
+
+    def _line_starts(self) -> list[int]:
+        """
+        splitlines() ile aynı satırların başları + metin sonu. Satır string'i
+        kurulmaz; sadece satır sonu eşleşmelerinin bitiş offset'leri alınır.
+        """
+        text = self.text
+        breaks = _NEWLINE if self.plain_breaks else _LINE_BREAK
+        starts = [0]
+        starts += map(re.Match.end, breaks.finditer(text))
+        # Son satır sonsuzsa metin sonu; sondaki satır sonu yeni satır açmaz
+        if starts[-1] != len(text):
+            starts.append(len(text))
+        return starts
+
+    def hits(self, *needles: str | re.Pattern) -> Iterator[tuple[int, str]]:
+        """
+        Needle'lardan (literal veya pattern) birinin geçtiği satırlar
+        (satır no, satır), artan sırada ve satır başına bir kez.
+        """
+        low = self.low
+        found: set[int] = set()
+        for needle in needles:
+            pos = 0
+            while True:
+                if isinstance(needle, str):
+                    at = low.find(needle, pos)
+                else:
+                    m = needle.search(low, pos)
+                    at = -1 if m is None else m.start()
+                if at < 0 or at >= len(low) - 1:
+                    break
+
+                if self._starts is None:
+                    self._starts = self._line_starts()
+                i = bisect_right(self._starts, at) - 1
+                found.add(i)
+                # Satırın kalanı atlanır: aynı satırda ikinci eşleşme aranmaz
+                pos = self._starts[i + 1]
+
+        starts = self._starts
+        text = self.text
+        for i in sorted(found):
+            yield i + 1, text[starts[i]:starts[i + 1]].splitlines()[0]
+
+
+class _FindingCaps:
+    """
+    Dosya içi kural sınırı. Sınırdan sonra Finding kurulmaz (detail slice /
+    dataclass yok); sadece sayı ve ilk / son satır tutulur, dosya sonunda
+    kural başına tek özet bulgu olur.
+
+    baseline verilirse baseline'daki satırlar sınıra sayılmaz (scan_project
+    onları zaten düşürür): sınır sadece raporlanacak bulgulara uygulanır,
+    sınırı aşan yeni satır da baseline'lı eski satırların arkasında kalmaz.
+    """
+    __slots__ = ("profile", "counts", "over", "baseline", "rel_path", "used")
+
+    def __init__(self, profile: ScanProfile, baseline: Baseline | None = None, rel_path: str = ""):
+        self.profile = profile
+        self.counts: dict[str, int] = {}
+        # rule → [ilk satır, son satır, adet] (sınırı aşanlar)
+        self.over: dict[str, list[int]] = {}
+        self.baseline = baseline if baseline else None
+        self.rel_path = rel_path
+        # Baseline kopya sayacı (Baseline.filter ile aynı sırada tüketilir)
+        self.used: dict[str, int] = {}
+
+    def take(self, rule: str, kind: str, line_no: int, line: str) -> bool:
+        cap = self.profile.cap(rule)
+        if not cap:
+            return True
+
+        # detail, bulgu kurulurken kullanılanla aynı (line.strip()[:240])
+        if self.baseline is not None and self.baseline.take(
+            fingerprint_of(rule, kind, self.rel_path, line.strip()[:240]),
+            self.used,
+        ):
+            return True
+
+        n = self.counts.get(rule, 0) + 1
+        self.counts[rule] = n
+        if n <= cap:
+            return True
+
+        over = self.over.get(rule)
+        if over is None:
+            self.over[rule] = [line_no, line_no, 1]
+        else:
+            over[1] = line_no
+            over[2] += 1
+        return False
+
+    def summaries(self, findings: list[Finding]) -> list[Finding]:
+        """
+        Sınırı aşan her kural için, son tekil bulgudan türeyen özet bulgu.
+        Adet / satırlar / sınır sadece başlıkta: detail sabit, fingerprint
+        (kural + path + detail) adet, satır aralığı veya sınır değişince aynı kalır.
+        """
+        out = []
+        for rule, (first, last, count) in self.over.items():
+            template = next(f for f in reversed(findings) if f.rule == rule)
+            out.append(replace(
+                template,
+                title=(
+                    f"{template.title}: {count} more (lines {first}-{last}, "
+                    f"limit {self.profile.cap(rule)} per file)"
+                ),
+                detail="Occurrences over the per-file limit are summarized.",
+                line=first,
+            ))
+        return out
+
+
+def scan_file(
+    p: Path,
+    profile: ScanProfile,
+    baseline: Baseline | None = None,
+    root: str | None = None,
+) -> list[Finding]:
+    """
+    Tek dosyanın satır bazlı kontrollerini çalıştırır; kurallar tüm metinde
+    aranır (_LineIndex), sonuç finding_sort_key sırasında.
+    Ignore / uzantı filtresi çağıran tarafta yapılır.
+
+    baseline + root (resolve edilmiş proje kökü) verilirse dosya içi sınır
+    baseline'daki satırları saymaz. Baseline bulguları yine döner; süzme
+    çağıran tarafta (Baseline.filter).
+    """
     findings: list[Finding] = []
-    start_ts = time.perf_counter()
-    scanned_files = 0
+    rules = profile.rules_for(p.suffix.lower())
+    sev = profile.severity
 
-    if not rootp.exists() or not rootp.is_dir():
+    text = _safe_read_text(p)
+    if not text:
         return findings
 
-    # --------------------------------------------------
-    # File iterator
-    # --------------------------------------------------
-    if only_files:
-        file_iter = [Path(p) for p in only_files if Path(p).is_file()]
+    if IGNORE_FILE_MARKER in text:
+        return findings
+
+    buf = _LineIndex(text)
+    caps = _FindingCaps(
+        profile,
+        baseline,
+        relative_key(str(p), root) if baseline and root else "",
+    )
+    has_marker = profile.has_marker
+    # ----------------------------------------------
+    # General checks (language-agnostic)
+    # ----------------------------------------------
+    # Çok uzun satır / trailing whitespace gibi hijyen kontrolleri
+    if buf.plain_breaks:
+        long_hints, trailing_hints = (_LONG_LINE_HINT,), _TRAILING_WS_HINTS
     else:
-        file_iter = list(rootp.rglob("*"))
+        long_hints, trailing_hints = (_LONG_LINE_HINT_ANY,), (_TRAILING_WS_HINT_ANY,)
 
-    total_files = len(file_iter) or 1
-    next_progress_index = 0
+    for i, line in buf.hits(*long_hints) if "long_line" in rules else ():
+        if has_marker(line.lower()):
+            continue
 
-    def update_progress(done: int):
-        nonlocal next_progress_index
-        if not show_progress:
-            return
-        percent = int((done / total_files) * 100)
-        if next_progress_index < len(progress_steps):
-            if percent >= progress_steps[next_progress_index]:
-                _emit_progress(progress_steps[next_progress_index], mode)
-                next_progress_index += 1
+        # Long line (readability)
+        if len(line) > 240 and caps.take("long_line", "INFO", i, line):
+            findings.append(Finding(
+                kind="INFO",
+                severity=sev("long_line"),
+                score=SEVERITY_SCORES[sev("long_line")],
+
+                title="Long line",
+                detail=line.strip()[:240],
+                path=str(p),
+                line=i,
+
+                explanation="Very long lines reduce readability and make reviews harder.",
+                recommendation="Consider wrapping the line or refactoring into smaller pieces.",
+                rule="long_line",
+            ))
 
-    # --------------------------------------------------
-    # 1️⃣ .env git ignore check
-    # --------------------------------------------------
-    if cfg.get("ignore_env", True):
-        env_file = rootp / ".env"
-        if env_file.exists():
-            gitignore = rootp / ".gitignore"
-            gi = _safe_read_text(gitignore) if gitignore.exists() else ""
-            if ".env" not in gi:
-                findings.append(Finding(
-                    kind="RISK",
-                    severity="CRITICAL",
-                    score=SEVERITY_SCORES["CRITICAL"],
 
-                    title=".env may be tracked",
-                    detail="Project has .env but .gitignore does not mention it.",
-                    path=str(env_file),
+    for i, line in buf.hits(*trailing_hints) if "trailing_whitespace" in rules else ():
+        if has_marker(line.lower()):
+            continue
 
-                    explanation=(
-                        ".env files usually contain secrets such as database "
-                        "credentials or API keys."
-                    ),
-                    recommendation=(
-                        "Add `.env` to your .gitignore file and rotate exposed secrets."
-                    ),
-                ))
+        # Trailing whitespace (cleanliness)
+        if (
+            line.rstrip("\n\r") != line.rstrip("\n\r ").rstrip("\t")
+            and caps.take("trailing_whitespace", "INFO", i, line)
+        ):
+            findings.append(Finding(
+                kind="INFO",
+                severity=sev("trailing_whitespace"),
+                score=SEVERITY_SCORES[sev("trailing_whitespace")],
+
+                title="Trailing whitespace",
+                detail=line.strip()[:240],
+                path=str(p),
+                line=i,
+
+                explanation="Trailing whitespace creates noisy diffs and reduces code clarity.",
+                recommendation="Trim trailing spaces/tabs (editor setting: trim on save).",
+                rule="trailing_whitespace",
+            ))
 
-    # --------------------------------------------------
-    # 1B) Project structure checks (root-level hygiene)
-    # --------------------------------------------------
-    # README / LICENSE / requirements.txt / .gitignore gibi temel dosyalar
-    root_checks = [
-        ("README.md", "INFO", "Missing README.md",
-         "README helps others understand and use the project.",
-         "Create a README.md explaining setup, usage, and features."),
-        ("LICENSE", "INFO", "Missing LICENSE",
-         "A license clarifies how others can use your code.",
-         "Add a LICENSE file (e.g., MIT) to define usage rights."),
-        (".gitignore", "INFO", "Missing .gitignore",
-         "Without .gitignore, sensitive or bulky files may be committed.",
-         "Add a .gitignore suitable for your stack (Python, Node, etc.)."),
-        ("requirements.txt", "INFO", "Missing requirements.txt",
-         "Dependencies are unclear without a requirements file.",
-         "Add requirements.txt (pip freeze) or use pyproject.toml."),
-    ]
 
-    for filename, kind, title, explanation, recommendation in root_checks:
-        f = rootp / filename
-        if not f.exists():
-            findings.append(Finding(
-                kind=kind,
-                severity="LOW",
-                score=SEVERITY_SCORES["LOW"],
+    # ----------------------------------------------
+    # TODO / FIXME
+    # ----------------------------------------------
+    for i, line in buf.hits(*DEV_NOTE_TAGS) if "dev_note" in rules else ():
+        low = line.lower()
+        if has_marker(low):
+            continue
 
-                title=title,
-                detail=f"{filename} not found in project root.",
-                path=str(f),
+        if any(t in low for t in DEV_NOTE_TAGS) and caps.take("dev_note", "TODO", i, line):
 
-                explanation=explanation,
-                recommendation=recommendation,
+            findings.append(Finding(
+                kind="TODO",
+                severity=sev("dev_note"),
+                score=SEVERITY_SCORES[sev("dev_note")],
+
+                title="Dev note found (TODO/FIXME/HACK/BUG)",
+                detail=line.strip()[:240],
+                path=str(p),
+                line=i,
+
+                explanation=(
+                    "TODO or FIXME comments indicate unfinished or temporary "
+                    "code that may be forgotten over time."
+                ),
+                recommendation=(
+                    "Review this comment and either complete the implementation "
+                    "or remove the TODO/FIXME if it is no longer needed."
+                ),
+                rule="dev_note",
             ))
 
+    
 
+    # ----------------------------------------------
+    # PHP specific checks
+    # ----------------------------------------------
+    # Kural sırası eski satır döngüsündeki sırayla aynı: aynı satırdaki
+    # bulguların (stabil sort sonrası) sırası değişmez
+    if rules & EXT_RULES[".php"]:
+        check_email = "hardcoded_email" in rules and ".env" not in p.name.lower()
 
-    # --------------------------------------------------
-    # 2️⃣ File scanning
-    # --------------------------------------------------
-    for idx, p in enumerate(file_iter, start=1):
-        update_progress(idx)
+        for i, line in buf.hits(*_SECRET_HINTS) if "hardcoded_secret" in rules else ():
+            if has_marker(line.lower()):
+                continue
 
-        if p.is_dir():
-            continue
-        if _is_ignored_dir(p, cfg):
-            continue
-        if p.suffix.lower() not in TEXT_EXTS:
-            continue
-        
-        scanned_files += 1
+            if any(pat.search(line) for pat in SECRET_PATTERNS) and caps.take("hardcoded_secret", "RISK", i, line):
+                findings.append(Finding(
+                    kind="RISK",
+                    severity=sev("hardcoded_secret"),
+                    score=SEVERITY_SCORES[sev("hardcoded_secret")],
 
-        text = _safe_read_text(p)
-        if not text:
-            continue
+                    title="Hardcoded secret",
+                    detail=line.strip()[:240],
+                    path=str(p),
+                    line=i,
 
-        if IGNORE_FILE_MARKER in text:
-            continue
+                    explanation="Hardcoded secrets can be exposed through version control.",
+                    recommendation="Move secrets to environment variables or a secret manager.",
+                    rule="hardcoded_secret",
+                ))
 
-        lines = text.splitlines()
         # ----------------------------------------------
-        # General checks (language-agnostic)
+        # Debug artifacts (var_dump, print_r, die, dd)
         # ----------------------------------------------
-        # Çok uzun satır / trailing whitespace gibi hijyen kontrolleri
-        for i, line in enumerate(lines, start=1):
+        for i, line in buf.hits(*DEBUG_ARTIFACTS) if "debug_artifact" in rules else ():
             low = line.lower()
-            if any(m in low for m in ignore_markers):
+            if has_marker(low):
                 continue
 
-            # Long line (readability)
-            if len(line) > 240:
+            if any(dbg in low for dbg in DEBUG_ARTIFACTS) and caps.take("debug_artifact", "RISK", i, line):
                 findings.append(Finding(
-                    kind="INFO",
-                    severity="LOW",
-                    score=SEVERITY_SCORES["LOW"],
+                    kind="RISK",
+                    severity=sev("debug_artifact"),
+                    score=SEVERITY_SCORES[sev("debug_artifact")],
 
-                    title="Long line",
+                    title="Debug artifact found",
                     detail=line.strip()[:240],
                     path=str(p),
                     line=i,
 
-                    explanation="Very long lines reduce readability and make reviews harder.",
-                    recommendation="Consider wrapping the line or refactoring into smaller pieces.",
+                    explanation="Debug calls left in code can expose data and break execution flow.",
+                    recommendation="Remove debug calls or guard them behind a debug flag.",
+                    rule="debug_artifact",
                 ))
 
+        # ----------------------------------------------
+        # Dangerous functions (eval/system/exec etc.)
+        # ----------------------------------------------
+        for i, line in buf.hits(*DANGEROUS_FUNCS) if "dangerous_function" in rules else ():
+            low = line.lower()
+            if has_marker(low):
+                continue
 
-            # Trailing whitespace (cleanliness)
-            if line.rstrip("\n\r") != line.rstrip("\n\r ").rstrip("\t"):
+            if any(fn in low for fn in DANGEROUS_FUNCS) and caps.take("dangerous_function", "RISK", i, line):
+                findings.append(Finding(
+                    kind="RISK",
+                    severity=sev("dangerous_function"),
+                    score=SEVERITY_SCORES[sev("dangerous_function")],
+
+                    title="Dangerous function usage",
+                    detail=line.strip()[:240],
+                    path=str(p),
+                    line=i,
+
+                    explanation=(
+                        "Functions like eval/exec/system can lead to remote code execution "
+                        "if input is not strictly controlled."
+                    ),
+                    recommendation=(
+                        "Avoid these functions entirely. If unavoidable, strictly validate "
+                        "input and restrict execution scope."
+                    ),
+                    rule="dangerous_function",
+                ))
+
+
+        for i, line in buf.hits("@") if check_email else ():
+            if has_marker(line.lower()):
+                continue
+
+            if EMAIL_PATTERN.search(line) and caps.take("hardcoded_email", "INFO", i, line):
                 findings.append(Finding(
                     kind="INFO",
-                    severity="LOW",
-                    score=SEVERITY_SCORES["LOW"],
+                    severity=sev("hardcoded_email"),
+                    score=SEVERITY_SCORES[sev("hardcoded_email")],
 
-                    title="Trailing whitespace",
+                    title="Hardcoded email",
                     detail=line.strip()[:240],
                     path=str(p),
                     line=i,
 
-                    explanation="Trailing whitespace creates noisy diffs and reduces code clarity.",
-                    recommendation="Trim trailing spaces/tabs (editor setting: trim on save).",
+                    explanation=(
+                        "Email addresses hardcoded in source files may expose "
+                        "personal data or become outdated."
+                    ),
+                    recommendation=(
+                        "Move email addresses to configuration files or "
+                        "environment variables if possible."
+                    ),
+                    rule="hardcoded_email",
                 ))
 
 
-        # ----------------------------------------------
-        # TODO / FIXME
-        # ----------------------------------------------
-        for i, line in enumerate(lines, start=1):
+
+        for i, line in buf.hits("display_errors") if "display_errors" in rules else ():
             low = line.lower()
-            if any(m in low for m in ignore_markers):
+            if has_marker(low):
                 continue
 
-            tags = ["todo", "fixme", "hack", "bug", "xxx", "note", "optimize"]
-            if any(t in low for t in tags):
-
+            if (
+                "display_errors" in low and "ini_set" in low
+                and caps.take("display_errors", "RISK", i, line)
+            ):
                 findings.append(Finding(
-                    kind="TODO",
-                    severity="LOW",
-                    score=SEVERITY_SCORES["LOW"],
+                    kind="RISK",
+                    severity=sev("display_errors"),
+                    score=SEVERITY_SCORES[sev("display_errors")],
 
-                    title="Dev note found (TODO/FIXME/HACK/BUG)",
+                    title="display_errors enabled",
                     detail=line.strip()[:240],
                     path=str(p),
                     line=i,
 
                     explanation=(
-                        "TODO or FIXME comments indicate unfinished or temporary "
-                        "code that may be forgotten over time."
+                        "display_errors enabled may expose stack traces or "
+                        "sensitive application details to users."
                     ),
                     recommendation=(
-                        "Review this comment and either complete the implementation "
-                        "or remove the TODO/FIXME if it is no longer needed."
+                        "Disable display_errors in production and log errors "
+                        "to a secure location instead."
                     ),
+                    rule="display_errors",
                 ))
 
-        
 
-        # ----------------------------------------------
-        # PHP specific checks
-        # ----------------------------------------------
-        if p.suffix.lower() == ".php":
-            for i, line in enumerate(lines, start=1):
-                low = line.lower()
-                if any(m in low for m in ignore_markers):
-                    continue
-
-                for pat in SECRET_PATTERNS:
-                    if pat.search(line):
-                        findings.append(Finding(
-                            kind="RISK",
-                            severity="CRITICAL" if mode == SCAN_PROD else "HIGH",
-                            score=SEVERITY_SCORES["CRITICAL" if mode == SCAN_PROD else "HIGH"],
-
-                            title="Hardcoded secret",
-                            detail=line.strip()[:240],
-                            path=str(p),
-                            line=i,
-
-                            explanation="Hardcoded secrets can be exposed through version control.",
-                            recommendation="Move secrets to environment variables or a secret manager.",
-                        ))
-
-                        break
-                
-                # ----------------------------------------------
-                # Debug artifacts (var_dump, print_r, die, dd)
-                # ----------------------------------------------
-                for dbg in DEBUG_ARTIFACTS:
-                    if dbg in low:
-                        findings.append(Finding(
-                            kind="RISK",
-                            severity="HIGH" if mode == SCAN_PROD else "MEDIUM",
-                            score=SEVERITY_SCORES["HIGH" if mode == SCAN_PROD else "MEDIUM"],
-
-                            title="Debug artifact found",
-                            detail=line.strip()[:240],
-                            path=str(p),
-                            line=i,
-
-                            explanation="Debug calls left in code can expose data and break execution flow.",
-                            recommendation="Remove debug calls or guard them behind a debug flag.",
-                        ))
-
-                        break
-
-                # ----------------------------------------------
-                # Dangerous functions (eval/system/exec etc.)
-                # ----------------------------------------------
-                for fn in DANGEROUS_FUNCS:
-                    if fn in low:
-                        severity = "RISK"  # her zaman risk
-                        findings.append(Finding(
-                            kind="RISK",
-                            severity="CRITICAL",
-                            score=SEVERITY_SCORES["CRITICAL"],
-
-                            title="Dangerous function usage",
-                            detail=line.strip()[:240],
-                            path=str(p),
-                            line=i,
-
-                            explanation=(
-                                "Functions like eval/exec/system can lead to remote code execution "
-                                "if input is not strictly controlled."
-                            ),
-                            recommendation=(
-                                "Avoid these functions entirely. If unavoidable, strictly validate "
-                                "input and restrict execution scope."
-                            ),
-                        ))
-                        break
-
-
-                if EMAIL_PATTERN.search(line):
-                    if ".env" not in p.name.lower():
-                        findings.append(Finding(
-                            kind="INFO",
-                            severity="LOW",
-                            score=SEVERITY_SCORES["LOW"],
-
-                            title="Hardcoded email",
-                            detail=line.strip()[:240],
-                            path=str(p),
-                            line=i,
-
-                            explanation=(
-                                "Email addresses hardcoded in source files may expose "
-                                "personal data or become outdated."
-                            ),
-                            recommendation=(
-                                "Move email addresses to configuration files or "
-                                "environment variables if possible."
-                            ),
-                        ))
-
-
-
-                if "display_errors" in low and "ini_set" in low:
-                    sev = "CRITICAL" if mode == SCAN_PROD else "MEDIUM"
-
-                    findings.append(Finding(
-                        kind="RISK",
-                        severity=sev,
-                        score=SEVERITY_SCORES[sev],
-
-                        title="display_errors enabled",
-                        detail=line.strip()[:240],
-                        path=str(p),
-                        line=i,
-
-                        explanation=(
-                            "display_errors enabled may expose stack traces or "
-                            "sensitive application details to users."
-                        ),
-                        recommendation=(
-                            "Disable display_errors in production and log errors "
-                            "to a secure location instead."
-                        ),
-                    ))
-
-
-
-
-                if "error_reporting" in low and "e_all" in low:
-                    sev = "CRITICAL" if mode == SCAN_PROD else "LOW"
-
-                    findings.append(Finding(
-                        kind="RISK",
-                        severity=sev,
-                        score=SEVERITY_SCORES[sev],
-
-                        title="error_reporting(E_ALL)",
-                        detail=line.strip()[:240],
-                        path=str(p),
-                        line=i,
-
-                        explanation=(
-                            "error_reporting(E_ALL) may expose notices and warnings "
-                            "that are not intended for end users."
-                        ),
-                        recommendation=(
-                            "Limit error reporting in production environments "
-                            "and use logging for diagnostics."
-                        ),
-                    ))
 
 
+        for i, line in buf.hits("error_reporting") if "error_reporting" in rules else ():
+            low = line.lower()
+            if has_marker(low):
+                continue
 
-        # ----------------------------------------------
-        # Large file warning
-        # ----------------------------------------------
-        try:
-            size = p.stat().st_size
-            if size > 700_000:
+            if (
+                "error_reporting" in low and "e_all" in low
+                and caps.take("error_reporting", "RISK", i, line)
+            ):
                 findings.append(Finding(
-                    kind="INFO",
-                    severity="LOW",
-                    score=SEVERITY_SCORES["LOW"],
+                    kind="RISK",
+                    severity=sev("error_reporting"),
+                    score=SEVERITY_SCORES[sev("error_reporting")],
 
-                    title="Large file",
-                    detail=f"File is {size / 1024:.0f} KB",
+                    title="error_reporting(E_ALL)",
+                    detail=line.strip()[:240],
                     path=str(p),
+                    line=i,
 
                     explanation=(
-                        "Very large source files can negatively impact "
-                        "readability, maintainability, and performance."
+                        "error_reporting(E_ALL) may expose notices and warnings "
+                        "that are not intended for end users."
                     ),
                     recommendation=(
-                        "Consider splitting this file into smaller modules "
-                        "with clear responsibilities."
+                        "Limit error reporting in production environments "
+                        "and use logging for diagnostics."
                     ),
+                    rule="error_reporting",
                 ))
-        except Exception:
-            pass
 
-    # --------------------------------------------------
-    # Final progress
-    # --------------------------------------------------
-    if show_progress:
-        _emit_progress(100, mode)
+
+
+    # ----------------------------------------------
+    # Large file warning
+    # ----------------------------------------------
+    try:
+        size = p.stat().st_size
+        if "large_file" in rules and size > 700_000:
+            findings.append(Finding(
+                kind="INFO",
+                severity=sev("large_file"),
+                score=SEVERITY_SCORES[sev("large_file")],
+
+                # Boyut başlıkta: detail (→ fingerprint) dosya düzenlenince değişmez
+                title=f"Large file ({size / 1024:.0f} KB)",
+                detail="File is larger than 700 KB",
+                path=str(p),
+
+                explanation=(
+                    "Very large source files can negatively impact "
+                    "readability, maintainability, and performance."
+                ),
+                recommendation=(
+                    "Consider splitting this file into smaller modules "
+                    "with clear responsibilities."
+                ),
+                rule="large_file",
+            ))
+    except Exception:
+        pass
+
+    if caps.over:
+        findings.extend(caps.summaries(findings))
+
+    # Üretildiği yerde sıralı (worker / cache'te bir kez): scan_project merge eder
+    findings.sort(key=finding_sort_key)
+    return findings
+
+
+# --------------------------------------------------
+# Root-level checks
+# --------------------------------------------------
+# _root_findings'in baktığı kök dosyaları (watcher polling'i bunları da izler)
+ROOT_FILES = (".env", "README.md", "LICENSE", ".gitignore", "requirements.txt")
+
+
+def _root_findings(rootp: Path, profile: ScanProfile) -> list[Finding]:
+    """
+    Proje kökü kontrolleri (.env / README / LICENSE ...).
+    Dosya başına değil, scan başına bir kez çalışır.
+    """
+    findings: list[Finding] = []
 
     # --------------------------------------------------
-    # Risk summary (by severity)
+    # .env git ignore check
     # --------------------------------------------------
-    risk_summary = {
-        "CRITICAL": 0,
-        "HIGH": 0,
-        "MEDIUM": 0,
-        "LOW": 0,
-    }
+    if profile.check_env:
+        env_file = rootp / ".env"
+        if env_file.exists():
+            gitignore = rootp / ".gitignore"
+            gi = _safe_read_text(gitignore) if gitignore.exists() else ""
+            if ".env" not in gi:
+                findings.append(Finding(
+                    kind="RISK",
+                    severity=profile.severity("env_tracked"),
+                    score=SEVERITY_SCORES[profile.severity("env_tracked")],
 
-    for f in findings:
-        if f.kind == "RISK" and f.severity in risk_summary:
-            risk_summary[f.severity] += 1
+                    title=".env may be tracked",
+                    detail="Project has .env but .gitignore does not mention it.",
+                    path=str(env_file),
+
+                    explanation=(
+                        ".env files usually contain secrets such as database "
+                        "credentials or API keys."
+                    ),
+                    recommendation=(
+                        "Add `.env` to your .gitignore file and rotate exposed secrets."
+                    ),
+                    rule="env_tracked",
+                ))
 
     # --------------------------------------------------
-    # Overall risk level
+    # Project structure checks (root-level hygiene)
     # --------------------------------------------------
-    if risk_summary["CRITICAL"] > 0:
-        risk_level = "CRITICAL"
-    elif risk_summary["HIGH"] >= 3:
-        risk_level = "WARNING"
-    elif sum(risk_summary.values()) > 0:
-        risk_level = "REVIEW"
-    else:
-        risk_level = "SAFE"
+    # README / LICENSE / requirements.txt / .gitignore gibi temel dosyalar
+    root_checks = [
+        ("README.md", "INFO", "Missing README.md",
+         "README helps others understand and use the project.",
+         "Create a README.md explaining setup, usage, and features."),
+        ("LICENSE", "INFO", "Missing LICENSE",
+         "A license clarifies how others can use your code.",
+         "Add a LICENSE file (e.g., MIT) to define usage rights."),
+        (".gitignore", "INFO", "Missing .gitignore",
+         "Without .gitignore, sensitive or bulky files may be committed.",
+         "Add a .gitignore suitable for your stack (Python, Node, etc.)."),
+        ("requirements.txt", "INFO", "Missing requirements.txt",
+         "Dependencies are unclear without a requirements file.",
+         "Add requirements.txt (pip freeze) or use pyproject.toml."),
+    ]
+
+    for filename, kind, title, explanation, recommendation in root_checks:
+        f = rootp / filename
+        if not f.exists():
+            findings.append(Finding(
+                kind=kind,
+                severity=profile.severity("missing_project_file"),
+                score=SEVERITY_SCORES[profile.severity("missing_project_file")],
+
+                title=title,
+                detail=f"{filename} not found in project root.",
+                path=str(f),
+
+                explanation=explanation,
+                recommendation=recommendation,
+                rule="missing_project_file",
+            ))
+
+    findings.sort(key=finding_sort_key)
+    return findings
+
+
+# --------------------------------------------------
+# Summary
+# --------------------------------------------------
+class FindingSummary:
+    """
+    Status payload'undaki özet alanları (dashboard / menubar badge), bulgular
+    geldikçe biriktirilir: sayaçlar bulgu listesinin tamamı bellekte olmadan
+    (spill) de kesin hesaplanır. Tam scan ve watch mode aynı hesaplamayı kullanır.
+    """
+
+    def __init__(self):
+        self.risk_summary = {
+            "CRITICAL": 0,
+            "HIGH": 0,
+            "MEDIUM": 0,
+            "LOW": 0,
+        }
+        self.risk_score = 0
+        self.risks = 0
+        self.todos = 0
+        # path → risk score (ilk görülme sırası: eşitlikte sıralamayı belirler)
+        self.file_risk: dict[str, int] = {}
+
+    def add(self, findings: Iterable[Finding]):
+        risk_summary = self.risk_summary
+        file_risk = self.file_risk
+        for f in findings:
+            if f.kind == "RISK":
+                self.risks += 1
+                self.risk_score += f.score
+                if f.severity in risk_summary:
+                    risk_summary[f.severity] += 1
+                file_risk[f.path] = file_risk.get(f.path, 0) + f.score
+            elif f.kind == "TODO":
+                self.todos += 1
+
+    def as_status(self) -> dict:
+        risk_summary = dict(self.risk_summary)
+
+        # --------------------------------------------------
+        # Overall risk level
+        # --------------------------------------------------
+        if risk_summary["CRITICAL"] > 0:
+            risk_level = "CRITICAL"
+        elif risk_summary["HIGH"] >= 3:
+            risk_level = "WARNING"
+        elif sum(risk_summary.values()) > 0:
+            risk_level = "REVIEW"
+        else:
+            risk_level = "SAFE"
+
+        # --------------------------------------------------
+        # Human recommendation
+        # --------------------------------------------------
+        if risk_level == "CRITICAL":
+            recommendation = "Fix CRITICAL issues before production deployment."
+        elif risk_level == "WARNING":
+            recommendation = "High-risk issues detected. Review before release."
+        elif risk_level == "REVIEW":
+            recommendation = "Minor risks found. Consider cleanup."
+        else:
+            recommendation = "No significant risks detected. Safe to proceed."
+
+        # --------------------------------------------------
+        # Top risky files
+        # --------------------------------------------------
+        top_risky_files = [
+            path for path, _ in sorted(
+                self.file_risk.items(),
+                key=lambda x: x[1],
+                reverse=True
+            )
+        ][:5]
+
+        return {
+            "last_risks": self.risks,
+            "last_todos": self.todos,
+            "risk_score": self.risk_score,
+
+            "risk_summary": risk_summary,
+            "risk_level": risk_level,
+            "recommendation": recommendation,
+            "top_risky_files": top_risky_files,
+        }
+
+
+def summarize_findings(findings: Iterable[Finding]) -> dict:
+    summary = FindingSummary()
+    summary.add(findings)
+    return summary.as_status()
+
+
+
+# --------------------------------------------------
+# Main scanner
+# --------------------------------------------------
+def scan_project(
+    root: str,
+    mode: str = SCAN_DEV,
+    only_files: list[str] | None = None,
+    cache: FileScanCache | None = None,
+    progress: ProgressBlock | None = None,
+    profile: ScanProfile | None = None,
+    db: FindingsDB | None = None,
+    stats: dict | None = None,
+    baseline: Baseline | None = None,
+) -> list[Finding] | FindingRuns:
+    """
+    cache verilirse (ör. scan daemon) değişmemiş dosyalar yeniden okunmaz.
+    progress verilirse canlı sayaçlar shared-memory bloğuna yazılır (progress_shm);
+    blok çağıran tarafından claim() edilmiş olmalı.
+    profile verilmezse config + mode'dan derlenir; verilirse mode onundur.
+    db verilirse tam scan'ler (only_files yok) geçmişe kaydedilir; "done"
+    status'u scan_id taşır.
+    stats verilirse files_scanned / duration (ve db ile kayıtlı scan'lerde
+    delta) ile doldurulur; rapor writer'larına **stats olarak geçer.
+    baseline verilmezse proje kökündeki .zinkx-baseline yüklenir; oradaki
+    bulgular sonuçlara girmez ("done" status'unda suppressed sayısı).
+    Boş Baseline() ile suppression kapatılır.
+
+    Bellekte en fazla profile.memory_budget bulgu tutulur; aşılırsa sıralı
+    run'lar diske yazılır ve sonuç FindingRuns olarak (sıralı merge, tekrar
+    gezilebilir) döner. Bütçe aşılmadıkça dönen değer eskisi gibi list.
+    """
+
+    if profile is None:
+        profile = ScanProfile.from_config(mode)
+    mode = profile.mode
+
+    progress_steps = profile.progress_steps
+    show_progress = profile.show_progress
+
+    rootp = Path(root).expanduser().resolve()
+    findings = FindingStore(finding_sort_key, profile.memory_budget)
+    summary_acc = FindingSummary()
+    start_ts = time.perf_counter()
+    scanned_files = 0
+    suppressed = 0
+
+    if not rootp.exists() or not rootp.is_dir():
+        return []
+
+    slot = progress.begin(mode)[0] if progress is not None else None
+
+    if baseline is None:
+        baseline = Baseline.load(rootp)
+    root_key = str(rootp)
 
     # --------------------------------------------------
-    # Human recommendation
+    # File iterator
     # --------------------------------------------------
-    if risk_level == "CRITICAL":
-        recommendation = "Fix CRITICAL issues before production deployment."
-    elif risk_level == "WARNING":
-        recommendation = "High-risk issues detected. Review before release."
-    elif risk_level == "REVIEW":
-        recommendation = "Minor risks found. Consider cleanup."
+    if only_files:
+        file_iter = [Path(p) for p in only_files if Path(p).is_file()]
     else:
-        recommendation = "No significant risks detected. Safe to proceed."
-
+        file_iter = list(rootp.rglob("*"))
 
+    total_files = len(file_iter) or 1
+    next_progress_index = 0
 
+    if progress is not None:
+        progress.set_total(len(file_iter))
 
+    def update_progress(done: int):
+        nonlocal next_progress_index
+        if not show_progress:
+            return
+        percent = int((done / total_files) * 100)
+        if next_progress_index < len(progress_steps):
+            if percent >= progress_steps[next_progress_index]:
+                _emit_progress(progress_steps[next_progress_index], mode)
+                next_progress_index += 1
 
     # --------------------------------------------------
-    # Risk score calculation
+    # 1️⃣ Root-level checks (.env, README, LICENSE ...)
     # --------------------------------------------------
-    total_risk_score = sum(
-        f.score for f in findings if f.kind == "RISK"
-    )
+    if progress is not None:
+        progress.set_phase(PHASE_ROOT_CHECKS)
 
+    root_findings = _root_findings(rootp, profile)
+    if baseline:
+        kept = baseline.filter(root_findings, root_key)
+        suppressed += len(root_findings) - len(kept)
+        root_findings = kept
+    findings.extend(root_findings)
+    summary_acc.add(root_findings)
 
+    if slot is not None:
+        slot.add(findings=root_findings)
+        progress.set_phase(PHASE_SCANNING)
 
     # --------------------------------------------------
-    # Top risky files
+    # 2️⃣ File scanning
     # --------------------------------------------------
-    file_risk_map: dict[str, int] = {}
+    for idx, p in enumerate(file_iter, start=1):
+        update_progress(idx)
 
-    for f in findings:
-        if f.kind == "RISK":
-            file_risk_map[f.path] = file_risk_map.get(f.path, 0) + f.score
+        if not is_scannable(p, profile):
+            if slot is not None:
+                slot.add(files=1)
+            continue
 
-    top_risky_files = [
-        path for path, _ in sorted(
-            file_risk_map.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-    ][:5]
+        scanned_files += 1
+
+        if cache is not None:
+            file_findings = cache.scan(p, profile, baseline, root_key)
+        else:
+            file_findings = scan_file(p, profile, baseline, root_key)
+        if baseline and file_findings:
+            kept = baseline.filter(file_findings, root_key)
+            suppressed += len(file_findings) - len(kept)
+            file_findings = kept
+        if file_findings:
+            findings.extend(file_findings)
+            summary_acc.add(file_findings)
+
+        if slot is not None:
+            try:
+                size = p.stat().st_size
+            except OSError:
+                size = 0
+            slot.add(files=1, bytes_=size, findings=file_findings)
+
+    # --------------------------------------------------
+    # Final progress
+    # --------------------------------------------------
+    if show_progress:
+        _emit_progress(100, mode)
 
     # --------------------------------------------------
     # Done status (for Dashboard "Last Scan Details")
     # --------------------------------------------------
     duration = time.perf_counter() - start_ts
+    summary = summary_acc.as_status()
 
-    # count risks / todos for quick UI summary
-    last_risks = sum(1 for f in findings if f.kind == "RISK")
-    last_todos = sum(1 for f in findings if f.kind == "TODO")
+    # Geçmiş kaydı status'tan önce: dashboard "done" gelince DB'de bulur
+    scan_id = None
+    if db is not None and not only_files:
+        try:
+            scan_id = db.record_scan(
+                str(rootp), mode, findings, summary,
+                files_scanned=scanned_files,
+                duration=round(duration, 2),
+            )
+        except Exception:
+            scan_id = None
 
-    write_status({
+    # Önceki kayıtlı scan'e göre new / fixed / persisting (DB'den, rescan yok)
+    delta = None
+    if scan_id is not None:
+        try:
+            delta = db.scan_delta(scan_id)
+        except Exception:
+            delta = None
+
+    status = {
         "type": "done",
         "mode": mode,
 
-        "last_risks": last_risks,
-        "last_todos": last_todos,
-        "risk_score": total_risk_score,
-
-        "risk_summary": risk_summary,
-        "risk_level": risk_level,
-        "recommendation": recommendation,
-        "top_risky_files": top_risky_files,
+        **summary,
 
         "files_scanned": scanned_files,
         "duration": round(duration, 2),
         "finished_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    })
+    }
+    if baseline:
+        status["suppressed"] = suppressed
+    if scan_id is not None:
+        status["scan_id"] = scan_id
+        status["project"] = str(rootp)
+    if delta is not None:
+        status["delta"] = delta.counts()
+
+    if stats is not None:
+        stats["files_scanned"] = scanned_files
+        stats["duration"] = round(duration, 2)
+        if delta is not None:
+            stats["delta"] = delta
+
+    write_status(status)
 
 
 
     # --------------------------------------------------
     # Sort results
     # --------------------------------------------------
-    severity_order = {
-        "CRITICAL": 0,
-        "HIGH": 1,
-        "MEDIUM": 2,
-        "LOW": 3,
-    }
+    if progress is not None:
+        progress.set_phase(PHASE_SORTING)
 
-    findings.sort(
-        key=lambda f: (
-            severity_order.get(f.severity, 9),
-            f.path,
-            f.line or 0,
-        )
-    )
+    # Dosya sonuçları zaten sıralı: global sort yok, severity bucket'larına
+    # göre birleştirilir (spill olduysa disk run'larıyla lazy merge)
+    results = findings.finish()
 
+    if progress is not None:
+        progress.set_phase(PHASE_DONE)
 
-    return findings
+    return results
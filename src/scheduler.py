@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from ipc import write_queue_state
+
+# --------------------------------------------------
+# Triggers / priorities (küçük = önce)
+# --------------------------------------------------
+TRIGGER_INTERACTIVE = "interactive"   # menü / dashboard
+TRIGGER_PRECOMMIT = "precommit"       # git hook
+TRIGGER_BACKGROUND = "background"     # watch / periyodik
+
+PRIORITIES = {
+    TRIGGER_INTERACTIVE: 0,
+    TRIGGER_PRECOMMIT: 1,
+    TRIGGER_BACKGROUND: 2,
+}
+
+DEFAULT_WORKERS = 2
+
+# Bittikten sonra queue state'te kısa süre görünen job sayısı
+RECENT_LIMIT = 10
+
+
+@dataclass
+class ScanJob:
+    id: int
+    project: str
+    mode: str
+    trigger: str
+    priority: int
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    state: str = "queued"             # queued | running | done | failed
+    error: str | None = None
+
+    _callbacks: list = field(default_factory=list, repr=False)
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.project, self.mode)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "project": self.project,
+            "mode": self.mode,
+            "trigger": self.trigger,
+            "state": self.state,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class ScanScheduler:
+    """
+    Çok projeli scan kuyruğu.
+
+    - Öncelik: interactive > precommit > background, aynı öncelikte FIFO
+    - Aynı (project, mode) kuyrukta / çalışırken tekrar gelirse mevcut job'a
+      bağlanır; daha yüksek öncelikle gelirse bekleyen job öne alınır.
+      Callback'ler sadece job'u kuran submit'ten alınır: aynı job için
+      tekrar gelen istekler tek bir tamamlanma bildirimi üretir
+    - Tüm projeler için tek, sınırlı worker havuzu
+    - Her değişiklikte kuyruk durumu IPC'ye yazılır (topic: "queue")
+
+    runner(job) worker thread'inde çalışır; callback'ler de worker
+    thread'inden çağrılır (UI tarafı kendi thread'ine taşımalıdır).
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[ScanJob], Any],
+        max_workers: int = DEFAULT_WORKERS,
+        publish: bool = True,
+    ):
+        self._runner = runner
+        self._publish_state = publish
+
+        self._cond = threading.Condition()
+        self._heap: list[tuple[int, int, ScanJob]] = []
+        self._order = itertools.count()
+        self._ids = itertools.count(1)
+
+        self._active: dict[tuple[str, str], ScanJob] = {}   # queued + running
+        self._recent: list[ScanJob] = []
+        self._stopped = False
+
+        self._workers = [
+            threading.Thread(
+                target=self._worker, name=f"ScanWorker-{i}", daemon=True
+            )
+            for i in range(max(1, max_workers))
+        ]
+        for t in self._workers:
+            t.start()
+
+    # ----------------------------------------------
+    # Public API
+    # ----------------------------------------------
+    def submit(
+        self,
+        project: str,
+        mode: str,
+        trigger: str = TRIGGER_INTERACTIVE,
+        on_done: Callable[[ScanJob, Any], None] | None = None,
+        on_error: Callable[[ScanJob, Exception], None] | None = None,
+    ) -> tuple[ScanJob, bool]:
+        """
+        (job, yeni_mi) döner. yeni_mi=False → mevcut job'a bağlandı,
+        on_done / on_error eklenmez (job'un ilk callback'leri çağrılır).
+        """
+        priority = PRIORITIES.get(trigger, PRIORITIES[TRIGGER_BACKGROUND])
+
+        with self._cond:
+            job = self._active.get((project, mode))
+            created = job is None
+
+            if created:
+                job = ScanJob(
+                    id=next(self._ids),
+                    project=project,
+                    mode=mode,
+                    trigger=trigger,
+                    priority=priority,
+                )
+                if on_done or on_error:
+                    job._callbacks.append((on_done, on_error))
+                self._active[job.key] = job
+                heapq.heappush(self._heap, (priority, next(self._order), job))
+
+            elif job.state == "queued" and priority < job.priority:
+                # Öne al; heap'teki eski kayıt pop edilince atlanır
+                job.priority = priority
+                job.trigger = trigger
+                heapq.heappush(self._heap, (priority, next(self._order), job))
+
+            self._cond.notify()
+
+        self._publish()
+        return job, created
+
+    @property
+    def busy(self) -> bool:
+        with self._cond:
+            return bool(self._active)
+
+    def is_active(self, project: str, mode: str) -> bool:
+        with self._cond:
+            return (project, mode) in self._active
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._cond:
+            active = sorted(
+                self._active.values(), key=lambda j: (j.priority, j.id)
+            )
+            return {
+                "type": "queue",
+                "workers": len(self._workers),
+                "running": [j.to_dict() for j in active if j.state == "running"],
+                "queued": [j.to_dict() for j in active if j.state == "queued"],
+                "recent": [j.to_dict() for j in self._recent],
+            }
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    # ----------------------------------------------
+    # Workers
+    # ----------------------------------------------
+    def _next_job(self) -> ScanJob | None:
+        with self._cond:
+            while True:
+                if self._stopped:
+                    return None
+                while self._heap:
+                    priority, _, job = heapq.heappop(self._heap)
+                    # Öne alınmış / zaten başlamış job'ların eski kayıtları
+                    if job.state != "queued" or priority != job.priority:
+                        continue
+                    job.state = "running"
+                    job.started_at = time.time()
+                    return job
+                self._cond.wait()
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            self._publish()
+
+            try:
+                result = self._runner(job)
+            except Exception as e:
+                self._finish(job, "failed", error=e)
+            else:
+                self._finish(job, "done", result=result)
+
+    def _finish(self, job: ScanJob, state: str, result=None, error=None):
+        with self._cond:
+            job.state = state
+            job.finished_at = time.time()
+            job.error = str(error) if error is not None else None
+
+            self._active.pop(job.key, None)
+            self._recent.insert(0, job)
+            del self._recent[RECENT_LIMIT:]
+
+            callbacks = list(job._callbacks)
+
+        self._publish()
+
+        for on_done, on_error in callbacks:
+            try:
+                if error is None:
+                    if on_done:
+                        on_done(job, result)
+                elif on_error:
+                    on_error(job, error)
+            except Exception:
+                pass
+
+    def _publish(self):
+        if not self._publish_state:
+            return
+        try:
+            write_queue_state(self.snapshot())
+        except Exception:
+            pass
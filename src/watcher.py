@@ -0,0 +1,476 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from config import load_config
+from dir_snapshot import (
+    build_snapshot,
+    diff_snapshot,
+    load_state,
+    save_state,
+    snapshot_files,
+    touch_files,
+)
+from baseline import BASELINE_NAME, Baseline, baseline_path
+from ipc import write_status
+from scanner import (
+    Finding,
+    ROOT_FILES,
+    SCAN_DEV,
+    ScanProfile,
+    _root_findings,
+    is_scannable,
+    scan_file,
+    summarize_findings,
+)
+
+# Son event'ten sonra bu kadar sessizlik beklenir (saniye)
+DEBOUNCE_SECONDS = 0.5
+# Sürekli event gelse bile en geç bu süre sonunda rescan yapılır
+MAX_DEBOUNCE_SECONDS = 5.0
+# Polling fallback tarama aralığı (saniye)
+POLL_INTERVAL = 2.0
+# Snapshot + findings en fazla bu sıklıkla diske yazılır (saniye)
+SAVE_INTERVAL = 30.0
+
+
+# --------------------------------------------------
+# Helpers
+# --------------------------------------------------
+def _walk_dirs(root: Path, profile: ScanProfile):
+    """
+    Ignore kurallarına uyan dizinleri gezer; ignored dizinlere hiç inmez.
+    """
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames
+            if not profile.is_ignored_dir(Path(dirpath) / d)
+        ]
+        yield dirpath
+
+
+def _walk_files(root: Path, profile: ScanProfile):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames
+            if not profile.is_ignored_dir(Path(dirpath) / d)
+        ]
+        for name in filenames:
+            p = Path(dirpath) / name
+            if is_scannable(p, profile):
+                yield p
+
+
+# --------------------------------------------------
+# Backends
+# --------------------------------------------------
+class _InotifyBackend:
+    """
+    Linux inotify (ctypes, ek bağımlılık yok).
+    Sadece ignore edilmeyen dizinlere watch eklenir; node_modules vb.
+    içindeki churn kernel seviyesinde hiç event üretmez.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    MASK = (
+        IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+        | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    )
+
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, root: Path, profile: ScanProfile):
+        self.root = root
+        self.profile = profile
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        self._wd_paths: dict[int, str] = {}
+        self._add_tree(root)
+
+    def _add_watch(self, path: str):
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(path), self.MASK
+        )
+        if wd >= 0:
+            self._wd_paths[wd] = path
+
+    def _add_tree(self, top: Path):
+        for dirpath in _walk_dirs(top, self.profile):
+            self._add_watch(dirpath)
+
+    def wait(self, timeout: float) -> set[str]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[str] = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = self._EVENT.unpack_from(buf, offset)
+                offset += self._EVENT.size
+                name = buf[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & self.IN_Q_OVERFLOW:
+                    # Kernel kuyruğu taştı → tüm proje yeniden taranır
+                    changed.add(str(self.root))
+                    continue
+
+                if mask & self.IN_IGNORED:
+                    self._wd_paths.pop(wd, None)
+                    continue
+
+                base = self._wd_paths.get(wd)
+                if base is None:
+                    continue
+
+                path = os.path.join(base, os.fsdecode(name)) if name else base
+
+                if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    if self.profile.is_ignored_dir(Path(path)):
+                        continue
+                    self._add_tree(Path(path))
+
+                changed.add(path)
+
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """
+    inotify olmayan sistemler (macOS vb.) için mtime/size karşılaştırması.
+    Taranan dosyalara ek olarak kök kontrol dosyaları (.env, README ...) ve
+    baseline izlenir; inotify backend'i ile aynı değişiklikleri görür.
+    """
+
+    def __init__(self, root: Path, profile: ScanProfile, interval: float = POLL_INTERVAL):
+        self.root = root
+        self.profile = profile
+        self.interval = interval
+        self._state = self._snapshot()
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        state = {}
+        for p in _walk_files(self.root, self.profile):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            state[str(p)] = (st.st_mtime_ns, st.st_size)
+
+        for name in (*ROOT_FILES, BASELINE_NAME):
+            p = self.root / name
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            state[str(p)] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self, timeout: float) -> set[str]:
+        time.sleep(max(timeout, self.interval))
+
+        current = self._snapshot()
+        previous = self._state
+        self._state = current
+
+        changed = {p for p, stamp in current.items() if previous.get(p) != stamp}
+        changed |= previous.keys() - current.keys()
+        return changed
+
+    def close(self):
+        pass
+
+
+def _make_backend(root: Path, profile: ScanProfile, backend: str):
+    if backend in ("auto", "inotify") and sys.platform.startswith("linux"):
+        try:
+            return _InotifyBackend(root, profile)
+        except (OSError, AttributeError):
+            if backend == "inotify":
+                raise
+    return _PollingBackend(root, profile)
+
+
+# --------------------------------------------------
+# Watcher
+# --------------------------------------------------
+class ProjectWatcher:
+    """
+    Proje kökünü izler, değişen dosyaları debounce ederek yeniden tarar
+    ve güncel özeti write_status ile ("type": "live") yayınlar.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        mode: str = SCAN_DEV,
+        backend: str = "auto",
+        debounce: float = DEBOUNCE_SECONDS,
+        on_update: Callable[[dict], None] | None = None,
+    ):
+        self.root = Path(root).expanduser().resolve()
+        self.mode = mode
+        self.backend_name = backend
+        self.debounce = debounce
+        self.on_update = on_update
+
+        self.profile = ScanProfile.from_config(mode, load_config())
+
+        # path → o dosyanın findings'i (incremental güncellenir)
+        self.files: dict[str, list[Finding]] = {}
+        self.root_findings: list[Finding] = []
+        # Dosya içi sınırlar bu baseline ile hesaplanır; dosya değişince full scan
+        self.baseline = Baseline()
+
+        # Cold start için dizin snapshot'ı (dir_snapshot)
+        self._snapshot: dict | None = None
+        self._dirty: set[str] = set()
+        self._last_save = 0.0
+
+        self._stop = threading.Event()
+        self._backend = None
+
+    # ----------------------------------------------
+    # Scan helpers
+    # ----------------------------------------------
+    def _settings(self) -> dict:
+        try:
+            st = os.stat(baseline_path(self.root))
+            baseline = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            baseline = None
+        return {"profile": self.profile.digest, "baseline": baseline}
+
+    def _scan_file(self, p: Path) -> list[Finding]:
+        return scan_file(p, self.profile, self.baseline, str(self.root))
+
+    def _full_scan(self):
+        self.baseline = Baseline.load(self.root)
+        self._snapshot = build_snapshot(self.root, self.profile)
+        self._dirty.clear()
+        self.files = {
+            path: self._scan_file(Path(path))
+            for path in snapshot_files(self._snapshot, self.root)
+        }
+        self.root_findings = _root_findings(self.root, self.profile)
+
+    def _cold_start(self) -> int | None:
+        """
+        Kaydedilmiş snapshot + findings varsa sadece değişen dizinler
+        okunur ve değişen dosyalar taranır. Yoksa None (full scan gerekir).
+        """
+        # Kayıtlı findings aynı baseline ile hesaplanmış olmalı (_settings)
+        state = load_state(self.root, self._settings())
+        if state is None:
+            return None
+        self.baseline = Baseline.load(self.root)
+
+        snapshot, self.files = state
+        self._snapshot, changed, removed = diff_snapshot(self.root, snapshot, self.profile)
+        return self._rescan(changed | removed)
+
+    def _save(self):
+        if self._snapshot is None:
+            return
+
+        # Son kayıttan beri işlenmemiş fark kalmasın (snapshot ↔ findings tutarlı)
+        self._snapshot, changed, removed = diff_snapshot(
+            self.root, self._snapshot, self.profile
+        )
+        if changed or removed:
+            self._rescan(changed | removed)
+
+        touch_files(self._snapshot, self.root, self._dirty)
+        self._dirty.clear()
+
+        try:
+            save_state(self.root, self._settings(), self._snapshot, self.files)
+        except OSError:
+            pass
+        self._last_save = time.monotonic()
+
+    def _rescan(self, changed: set[str]) -> int:
+        touched = 0
+
+        self._dirty.update(changed)
+
+        for path in changed:
+            p = Path(path)
+
+            if p.is_dir():
+                prefix = path.rstrip(os.sep) + os.sep
+                for stale in [k for k in self.files if k.startswith(prefix)]:
+                    del self.files[stale]
+                for f in _walk_files(p, self.profile):
+                    self.files[str(f)] = self._scan_file(f)
+                    touched += 1
+                continue
+
+            if is_scannable(p, self.profile):
+                self.files[path] = self._scan_file(p)
+                touched += 1
+                continue
+
+            # Silinmiş dosya / dizin
+            prefix = path.rstrip(os.sep) + os.sep
+            for stale in [k for k in self.files if k == path or k.startswith(prefix)]:
+                del self.files[stale]
+                touched += 1
+
+        self.root_findings = _root_findings(self.root, self.profile)
+        return touched
+
+    def _relevant(self, path: str) -> bool:
+        """
+        Event filtresi: ignore kurallarına takılan yollar ve taranmayan
+        uzantılar rescan tetiklemez.
+        """
+        p = Path(path)
+        if self.profile.is_ignored_dir(p):
+            return False
+        if path == str(self.root) or p.parent == self.root:
+            return True  # root-level checks (.env, README ...)
+        if path in self.files:
+            return True
+        if not p.exists():
+            prefix = path.rstrip(os.sep) + os.sep
+            return any(k.startswith(prefix) for k in self.files)
+        return p.suffix.lower() in self.profile.text_exts or p.is_dir()
+
+    def findings(self) -> list[Finding]:
+        out = list(self.root_findings)
+        for items in self.files.values():
+            out.extend(items)
+        return self.baseline.filter(out, str(self.root))
+
+    def _publish(self, changed_files: int, duration: float):
+        status = {
+            "type": "live",
+            "mode": self.mode,
+            "project": str(self.root),
+
+            **summarize_findings(self.findings()),
+
+            "files_scanned": len(self.files),
+            "changed_files": changed_files,
+            "duration": round(duration, 2),
+            "finished_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        write_status(status)
+
+        if self.on_update:
+            self.on_update(status)
+
+    # ----------------------------------------------
+    # Loop
+    # ----------------------------------------------
+    def run(self):
+        start_ts = time.perf_counter()
+        self._backend = _make_backend(self.root, self.profile, self.backend_name)
+
+        touched = self._cold_start()
+        if touched is None:
+            self._full_scan()
+            touched = len(self.files)
+        self._publish(touched, time.perf_counter() - start_ts)
+        self._save()
+
+        try:
+            while not self._stop.is_set():
+                changed = {
+                    p for p in self._backend.wait(1.0) if self._relevant(p)
+                }
+                if not changed:
+                    continue
+
+                # Debounce: burst bitene kadar (veya üst sınıra kadar) topla
+                deadline = time.monotonic() + MAX_DEBOUNCE_SECONDS
+                while time.monotonic() < deadline and not self._stop.is_set():
+                    more = {
+                        p for p in self._backend.wait(self.debounce)
+                        if self._relevant(p)
+                    }
+                    if not more:
+                        break
+                    changed |= more
+
+                start_ts = time.perf_counter()
+                # Baseline değişti: dosya içi sınırlar tüm dosyalarda yeniden
+                if str(self.root) in changed or str(baseline_path(self.root)) in changed:
+                    self._full_scan()
+                    touched = len(self.files)
+                else:
+                    touched = self._rescan(changed)
+                self._publish(touched, time.perf_counter() - start_ts)
+
+                if time.monotonic() - self._last_save > SAVE_INTERVAL:
+                    self._save()
+        finally:
+            self._save()
+            self._backend.close()
+
+    def start(self) -> threading.Thread:
+        t = threading.Thread(target=self.run, name="ProjectWatcher", daemon=True)
+        t.start()
+        return t
+
+    def stop(self):
+        self._stop.set()
+
+
+def run_watch(root: str, mode: str = SCAN_DEV, backend: str = "auto"):
+    """
+    CLI için bloklayan watch döngüsü (Ctrl+C ile çıkılır).
+    """
+    def report(st: dict):
+        print(
+            f"[{st['finished_at']}] "
+            f"risks: {st['last_risks']}  todos: {st['last_todos']}  "
+            f"level: {st['risk_level']}  "
+            f"(rescanned {st['changed_files']} file(s) in {st['duration']}s)"
+        )
+
+    watcher = ProjectWatcher(root, mode=mode, backend=backend, on_update=report)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        watcher.stop()
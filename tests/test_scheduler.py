@@ -0,0 +1,42 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from scheduler import ScanScheduler, TRIGGER_BACKGROUND, TRIGGER_INTERACTIVE  # noqa: E402
+
+
+def test_repeated_submit_completes_once():
+    release = threading.Event()
+    finished = threading.Event()
+    runs = []
+    done = []
+
+    def runner(job):
+        runs.append(job.id)
+        release.wait(5)
+        return "report"
+
+    def on_done(job, result):
+        done.append((job.id, result))
+        finished.set()
+
+    sched = ScanScheduler(runner, max_workers=1, publish=False)
+    try:
+        first, created = sched.submit("/p", "dev", on_done=on_done)
+        assert created
+
+        # Hook / pencere / watcher aynı scan'i tekrar istiyor
+        for trigger in (TRIGGER_BACKGROUND, TRIGGER_INTERACTIVE, TRIGGER_BACKGROUND):
+            job, created = sched.submit("/p", "dev", trigger, on_done=on_done)
+            assert job is first and not created
+
+        release.set()
+        assert finished.wait(5)
+        assert not sched.is_active("/p", "dev")
+    finally:
+        sched.stop()
+
+    assert runs == [first.id]
+    assert done == [(first.id, "report")]
@@ -12,6 +12,7 @@ TARGETS = [
     ".tmp",
     ".temp",
     ".ipc",
+    "src/templates/compiled",
 ]
 
 EXTENSIONS = [
@@ -0,0 +1,22 @@
+import os
+import sys
+
+BASE_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+
+sys.path.insert(0, os.path.join(BASE_DIR, "src"))
+
+from report_templates import COMPILED_DIR, precompile  # noqa: E402
+
+
+def main():
+    print("🧩 Compiling report templates into:", COMPILED_DIR)
+
+    for name in precompile(COMPILED_DIR):
+        print(f"[TPL] {name}")
+
+    print("✅ Templates compiled")
+
+if __name__ == "__main__":
+    main()